@@ -0,0 +1,236 @@
+#!python
+
+import asyncio
+
+from queue import Deque, LinkedQueue
+
+
+class QueueEmpty(ValueError):
+    """Raised by the nowait methods when there is no item to take."""
+
+
+class QueueFull(ValueError):
+    """Raised by the nowait methods when there is no room for an item."""
+
+
+class AsyncContainer(object):
+    """
+        Event loop friendly wrapper around one of the project's queues or
+        deques. Waiting getters and putters are parked on futures in FIFO
+        order and served strictly first come, first served: a put hands its
+        item straight to the oldest waiting getter, and a get pulls the
+        oldest waiting putter's item in behind it, so a coroutine that
+        arrives later can never barge ahead of one that is already waiting.
+        Not thread-safe; use blockingqueue for sharing between threads.
+    """
+
+    def __init__(self, container, maxsize=0):
+        """
+            Wrap the given empty container. A maxsize of 0 or less means
+            there is no bound on the number of items.
+        """
+        self.container = container
+        self.maxsize = maxsize
+        # Futures waiting for an item, oldest at the front
+        self._getters = Deque()
+        # (future, insert, item) triples waiting for room, oldest at the front
+        self._putters = Deque()
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __repr__(self):
+        """Return a string representation of this container."""
+        return "{}({} items, maxsize={})".format(
+            type(self).__name__, self.length(), self.maxsize
+        )
+
+    def length(self):
+        """
+            Return the number of items waiting to be taken.
+            Running time: O(1) - The wrapped containers track their length
+        """
+        return self.container.length()
+
+    def is_empty(self):
+        """Return True if there are no items waiting, or False otherwise."""
+        return self.container.length() == 0
+
+    def is_full(self):
+        """Return True if a maxsize is set and has been reached, or False."""
+        return 0 < self.maxsize <= self.container.length()
+
+    def _next_waiter(self, waiters):
+        """
+            Pop and return the oldest waiter that hasn't been cancelled,
+            or None if there isn't one.
+        """
+        while waiters.size:
+            waiter = waiters.pop_front()
+            future = waiter if isinstance(waiter, asyncio.Future) else waiter[0]
+            if not future.done():
+                return waiter
+        return None
+
+    def _put_nowait(self, insert, item):
+        """
+            Hand the item to the oldest waiting getter, or add it with the
+            given insert function if there is room. Returns False if full.
+            A getter only waits while the container is empty, so there is
+            never a waiting getter that should have had an existing item.
+        """
+        getter = self._next_waiter(self._getters) if self._getters.size else None
+        if getter is None:
+            if 0 < self.maxsize <= self.container.length():
+                return False
+            insert(item)
+        else:
+            getter.set_result(item)
+        if not self._unfinished_tasks:
+            self._finished.clear()
+        self._unfinished_tasks += 1
+        return True
+
+    def _get_nowait(self, remove):
+        """
+            Take an item with the given remove function, then let the
+            oldest waiting putter into the freed slot.
+        """
+        item = remove()
+        putter = self._next_waiter(self._putters) if self._putters.size else None
+        if putter is not None:
+            future, insert, waiting_item = putter
+            insert(waiting_item)
+            self._unfinished_tasks += 1
+            future.set_result(None)
+        return item
+
+    async def _put(self, insert, item):
+        """Add the item with insert, waiting for room if necessary."""
+        # Putters only wait while we're full, so if there's room now
+        # nobody is ahead of us
+        if self._put_nowait(insert, item):
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._putters.push_back((future, insert, item))
+        # The getter that resolves our future has already added our item
+        await future
+
+    async def _get(self, remove, requeue):
+        """
+            Take an item with remove, waiting for one if necessary. An item
+            handed to us just as we're cancelled goes to the next getter, or
+            back into the container with requeue if nobody is waiting.
+        """
+        if self.container.length():
+            return self._get_nowait(remove)
+        future = asyncio.get_running_loop().create_future()
+        self._getters.push_back(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # We were handed an item just before being cancelled,
+                # so pass it on to the next getter rather than drop it
+                item = future.result()
+                getter = self._next_waiter(self._getters)
+                if getter is None:
+                    requeue(item)
+                else:
+                    getter.set_result(item)
+            raise
+
+    def task_done(self):
+        """
+            Mark one item taken with get() as fully processed, waking any
+            join() callers once every item put so far has been processed.
+            Raises ValueError if called more times than items were put.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every item put so far has been marked task_done()."""
+        await self._finished.wait()
+
+
+class AsyncQueue(AsyncContainer):
+    """
+        First-in first-out AsyncContainer. Wraps a LinkedQueue by default,
+        pass queue_type=ArrayQueue for the circular buffer instead.
+    """
+
+    def __init__(self, maxsize=0, queue_type=LinkedQueue):
+        super().__init__(queue_type(), maxsize)
+
+    async def put(self, item):
+        """Add the given item to the back, waiting for room if necessary."""
+        await self._put(self.container.enqueue, item)
+
+    async def get(self):
+        """Remove and return the front item, waiting for one if necessary."""
+        # Queues can only add at the back, so a requeued item loses its place
+        return await self._get(self.container.dequeue, self.container.enqueue)
+
+    def put_nowait(self, item):
+        """Add the given item to the back if there is room, or raise QueueFull."""
+        if not self._put_nowait(self.container.enqueue, item):
+            raise QueueFull("The queue is full")
+
+    def get_nowait(self):
+        """Remove and return the front item if there is one, or raise QueueEmpty."""
+        if self.container.is_empty():
+            raise QueueEmpty("The queue is empty")
+        return self._get_nowait(self.container.dequeue)
+
+
+class AsyncDeque(AsyncContainer):
+    """
+        Double-ended AsyncContainer over the block-linked queue.Deque.
+        Items can be added and taken at either end; waiters are still
+        served in the order they arrived, whichever end they asked for.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__(Deque(), maxsize)
+
+    async def push_front(self, item):
+        """Add the given item to the front, waiting for room if necessary."""
+        await self._put(self.container.push_front, item)
+
+    async def push_back(self, item):
+        """Add the given item to the back, waiting for room if necessary."""
+        await self._put(self.container.push_back, item)
+
+    async def pop_front(self):
+        """Remove and return the front item, waiting for one if necessary."""
+        return await self._get(self.container.pop_front, self.container.push_front)
+
+    async def pop_back(self):
+        """Remove and return the back item, waiting for one if necessary."""
+        return await self._get(self.container.pop_back, self.container.push_back)
+
+    def push_front_nowait(self, item):
+        """Add the given item to the front if there is room, or raise QueueFull."""
+        if not self._put_nowait(self.container.push_front, item):
+            raise QueueFull("The deque is full")
+
+    def push_back_nowait(self, item):
+        """Add the given item to the back if there is room, or raise QueueFull."""
+        if not self._put_nowait(self.container.push_back, item):
+            raise QueueFull("The deque is full")
+
+    def pop_front_nowait(self):
+        """Remove and return the front item if there is one, or raise QueueEmpty."""
+        if self.container.is_empty():
+            raise QueueEmpty("The deque is empty")
+        return self._get_nowait(self.container.pop_front)
+
+    def pop_back_nowait(self):
+        """Remove and return the back item if there is one, or raise QueueEmpty."""
+        if self.container.is_empty():
+            raise QueueEmpty("The deque is empty")
+        return self._get_nowait(self.container.pop_back)
@@ -0,0 +1,67 @@
+#!python
+"""
+    Benchmarks for the asyncio adapters in asyncqueue.py.
+    Usage: python asyncqueue_bench.py [number of messages]
+"""
+
+import asyncio
+
+from asyncqueue import AsyncDeque, AsyncQueue
+from bench import arg_size, report, timed
+from queue import ArrayQueue
+
+# Marks the end of the stream as it flows down the pipeline
+DONE = object()
+
+
+async def pipeline(make_channel, put_name, get_name, count, stages):
+    """
+        Drive count messages from a source coroutine through the given
+        number of relay stages to a sink, each hop over a fresh channel.
+    """
+    channels = [make_channel() for _ in range(stages + 1)]
+
+    async def source(channel):
+        put = getattr(channel, put_name)
+        for message in range(count):
+            await put(message)
+        await put(DONE)
+
+    async def relay(inbox, outbox):
+        get, put = getattr(inbox, get_name), getattr(outbox, put_name)
+        while True:
+            message = await get()
+            await put(message)
+            if message is DONE:
+                return
+
+    async def sink(channel):
+        get = getattr(channel, get_name)
+        received = 0
+        while await get() is not DONE:
+            received += 1
+        return received
+
+    relays = [relay(channels[i], channels[i + 1]) for i in range(stages)]
+    results = await asyncio.gather(source(channels[0]), *relays, sink(channels[-1]))
+    return results[-1]
+
+
+def bench_pipelines(count, stages=2, maxsize=100):
+    """Messages per second through a pipeline against asyncio.Queue."""
+    channels = (
+        ("asyncio.Queue", lambda: asyncio.Queue(maxsize), "put", "get"),
+        ("AsyncQueue", lambda: AsyncQueue(maxsize), "put", "get"),
+        ("AsyncQueue(ArrayQueue)", lambda: AsyncQueue(maxsize, ArrayQueue), "put", "get"),
+        ("AsyncDeque", lambda: AsyncDeque(maxsize), "push_back", "pop_front"),
+    )
+    for name, make_channel, put_name, get_name in channels:
+        seconds, received = timed(lambda: asyncio.run(
+            pipeline(make_channel, put_name, get_name, count, stages)))
+        assert received == count
+        report(name, messages=count, stages=stages, maxsize=maxsize,
+               messages_per_sec=count / seconds)
+
+
+if __name__ == "__main__":
+    bench_pipelines(arg_size(10 ** 6))
@@ -0,0 +1,194 @@
+#!python
+
+from asyncqueue import AsyncDeque, AsyncQueue, QueueEmpty, QueueFull
+from queue import ArrayQueue
+import asyncio
+import unittest
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class AsyncQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        q = AsyncQueue()
+        assert q.length() == 0
+        assert q.is_empty() is True
+        assert q.is_full() is False
+
+    def test_put_and_get(self):
+        async def main(q):
+            await q.put('A')
+            await q.put('B')
+            await q.put('C')
+            assert q.length() == 3
+            return [await q.get(), await q.get(), await q.get()]
+        assert run(main(AsyncQueue())) == ['A', 'B', 'C']
+        assert run(main(AsyncQueue(queue_type=ArrayQueue))) == ['A', 'B', 'C']
+
+    def test_nowait(self):
+        q = AsyncQueue(maxsize=1)
+        with self.assertRaises(QueueEmpty):
+            q.get_nowait()
+        q.put_nowait('A')
+        assert q.is_full() is True
+        with self.assertRaises(QueueFull):
+            q.put_nowait('B')
+        with self.assertRaises(ValueError):
+            q.put_nowait('B')
+        assert q.get_nowait() == 'A'
+
+    def test_get_waits_for_put(self):
+        async def main():
+            q = AsyncQueue()
+            getter = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            assert getter.done() is False
+            await q.put('A')
+            return await getter
+        assert run(main()) == 'A'
+
+    def test_put_waits_for_room(self):
+        async def main():
+            q = AsyncQueue(maxsize=1)
+            await q.put('A')
+            putter = asyncio.ensure_future(q.put('B'))
+            await asyncio.sleep(0)
+            assert putter.done() is False
+            assert await q.get() == 'A'
+            await putter
+            return q.get_nowait()
+        assert run(main()) == 'B'
+
+    def test_fair_getters(self):
+        async def main():
+            q = AsyncQueue()
+            order = []
+
+            async def getter(name):
+                order.append((name, await q.get()))
+
+            tasks = [asyncio.ensure_future(getter(name)) for name in 'XYZ']
+            await asyncio.sleep(0)
+            for item in (1, 2, 3):
+                q.put_nowait(item)
+            # A late get_nowait can't barge in ahead of the waiting getters
+            with self.assertRaises(QueueEmpty):
+                q.get_nowait()
+            await asyncio.gather(*tasks)
+            return order
+        assert run(main()) == [('X', 1), ('Y', 2), ('Z', 3)]
+
+    def test_fair_putters(self):
+        async def main():
+            q = AsyncQueue(maxsize=1)
+            q.put_nowait(0)
+            tasks = [asyncio.ensure_future(q.put(item)) for item in (1, 2, 3)]
+            await asyncio.sleep(0)
+            # A late put_nowait can't barge in ahead of the waiting putters
+            with self.assertRaises(QueueFull):
+                q.put_nowait(4)
+            items = [await q.get() for _ in range(4)]
+            await asyncio.gather(*tasks)
+            return items
+        assert run(main()) == [0, 1, 2, 3]
+
+    def test_cancelled_waiters_are_skipped(self):
+        async def main():
+            q = AsyncQueue()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(q.get(), 0.01)
+            getter = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            await q.put('A')
+            return await getter
+        assert run(main()) == 'A'
+
+    def test_cancelled_after_handoff_keeps_item(self):
+        async def main():
+            q = AsyncQueue()
+            getter = asyncio.ensure_future(q.get())
+            await asyncio.sleep(0)
+            q.put_nowait('A')
+            getter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await getter
+            return q.get_nowait()
+        assert run(main()) == 'A'
+
+    def test_task_done_and_join(self):
+        async def main():
+            q = AsyncQueue(maxsize=4)
+            done = []
+
+            async def worker():
+                while True:
+                    item = await q.get()
+                    done.append(item)
+                    q.task_done()
+
+            workers = [asyncio.ensure_future(worker()) for _ in range(3)]
+            for item in range(100):
+                await q.put(item)
+            await q.join()
+            for task in workers:
+                task.cancel()
+            return done
+        assert sorted(run(main())) == list(range(100))
+        with self.assertRaises(ValueError):
+            AsyncQueue().task_done()
+
+
+class AsyncDequeTest(unittest.TestCase):
+
+    def test_both_ends(self):
+        async def main():
+            d = AsyncDeque()
+            await d.push_back('B')
+            await d.push_front('A')
+            await d.push_back('C')
+            return [await d.pop_back(), await d.pop_front(), await d.pop_front()]
+        assert run(main()) == ['C', 'A', 'B']
+
+    def test_nowait(self):
+        d = AsyncDeque(maxsize=2)
+        with self.assertRaises(QueueEmpty):
+            d.pop_front_nowait()
+        with self.assertRaises(QueueEmpty):
+            d.pop_back_nowait()
+        d.push_back_nowait('B')
+        d.push_front_nowait('A')
+        with self.assertRaises(QueueFull):
+            d.push_back_nowait('C')
+        assert d.pop_back_nowait() == 'B'
+        assert d.pop_front_nowait() == 'A'
+
+    def test_bounded_waits(self):
+        async def main():
+            d = AsyncDeque(maxsize=1)
+            await d.push_back('A')
+            putter = asyncio.ensure_future(d.push_front('B'))
+            getter_items = [await d.pop_back()]
+            await putter
+            getter_items.append(await d.pop_back())
+            return getter_items
+        assert run(main()) == ['A', 'B']
+
+    def test_cancelled_after_handoff_returns_item_to_its_end(self):
+        async def main():
+            d = AsyncDeque()
+            getter = asyncio.ensure_future(d.pop_back())
+            await asyncio.sleep(0)
+            d.push_back_nowait('B')
+            getter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await getter
+            d.push_front_nowait('A')
+            return [d.pop_front_nowait(), d.pop_front_nowait()]
+        assert run(main()) == ['A', 'B']
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!python
+"""Small timing and memory helpers shared by the *_bench.py scripts."""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+
+def arg_size(default, position=1):
+    """Return the problem size given on the command line, or the default."""
+    if len(sys.argv) > position:
+        return int(float(sys.argv[position]))
+    return default
+
+
+def timed(func, *args):
+    """
+        Call func with the given args and return (seconds taken, result).
+        Like timeit, the cyclic garbage collector is paused while timing.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func(*args)
+        return time.perf_counter() - start, result
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def traced(func, *args):
+    """
+        Call func with the given args while tracing allocations.
+        Returns (bytes still allocated afterwards, peak bytes, result).
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, peak, result
+
+
+def report(name, **fields):
+    """Print one aligned line of benchmark results."""
+    parts = []
+    for field, value in fields.items():
+        if isinstance(value, float):
+            value = "{:,.3f}".format(value) if value < 1000 else "{:,.0f}".format(value)
+        elif isinstance(value, int):
+            value = "{:,}".format(value)
+        parts.append("{}={}".format(field, value))
+    print("{:<32} {}".format(name, "  ".join(parts)))
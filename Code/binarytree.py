@@ -3,14 +3,22 @@
 from queue import Queue
 
 import strings
+from hashtable import ItemsView, KeysView, ValuesView
 
 
 class BinaryTreeNode(object):
+    # Slots instead of a per-node __dict__ keep large trees compact
+    __slots__ = ("data", "left", "right", "_height", "_size")
+
     def __init__(self, data):
         """Initialize this binary tree node with the given data."""
         self.data = data
         self.left = None
         self.right = None
+        # The height and node count of the subtree rooted here, kept up to
+        # date by BinarySearchTree as it inserts and deletes
+        self._height = 0
+        self._size = 1
 
     def __repr__(self):
         """Return a string representation of this binary tree node."""
@@ -31,32 +39,52 @@ class BinaryTreeNode(object):
             Best case: O(1) where the current node is a leaf and no traversing
             is required.
             Worst case: O(n) where we're starting from the root node and have to
-            traverse the entire tree to figure out the height.
+            traverse the entire tree to figure out the height. We go one level at
+            a time instead of recursing, so even a degenerate tree of a million
+            nodes won't hit the recursion limit.
+            This measures from scratch so it works for nodes linked by hand;
+            BinarySearchTree.height() reads the cached height instead.
         """
+        height = -1
+        level = [self]
+        # Each pass swaps the current level for the level of children below it
+        while level:
+            height += 1
+            next_level = []
+            for node in level:
+                if node.left is not None:
+                    next_level.append(node.left)
+                if node.right is not None:
+                    next_level.append(node.right)
+            level = next_level
+        return height
 
-        # If the current node is a leaf, the height is zero
-        if self.is_leaf():
-            return 0
-
-        # Initialize our height properties
-        left_height = 0
-        right_height = 0
 
-        # Check the left side of the node
-        if self.left is not None:
-            left_height = self.left.height()
+def _height(node):
+    """Return the cached height of the given node, or -1 for no node."""
+    return node._height if node is not None else -1
 
-        # Check the right side of the node
-        if self.right is not None:
-            right_height = self.right.height()
 
-        # Obtain the largest value, add one, and then return it.
-        largest_height = max(left_height, right_height) + 1
-        return largest_height
+def _size(node):
+    """Return the cached subtree size of the given node, or 0 for no node."""
+    return node._size if node is not None else 0
 
 
 class BinarySearchTree(object):
-    def __init__(self, items=None):
+    def __new__(cls, *args, balanced=False, **kwargs):
+        """
+            Pick the kind of tree to build. With balanced=True we build an
+            AVLTree, which rebalances itself on insert and delete so sorted
+            input can't degrade it into a linked list.
+        """
+        if cls is BinarySearchTree and balanced:
+            cls = AVLTree
+        return super().__new__(cls)
+
+    # The kind of node created for each new item
+    node_class = BinaryTreeNode
+
+    def __init__(self, items=None, balanced=False):
         """Initialize this binary search tree and insert the given items."""
         self.root = None
         self.size = 0
@@ -68,6 +96,10 @@ class BinarySearchTree(object):
         """Return a string representation of this binary search tree."""
         return "BinarySearchTree({} nodes)".format(self.size)
 
+    def __iter__(self):
+        """Return a generator of all items in this tree, in order."""
+        return self.iter_in_order()
+
     def is_empty(self):
         """Return True if this binary search tree is empty (has no nodes)."""
         return self.root is None
@@ -77,17 +109,51 @@ class BinarySearchTree(object):
             Return the height of this tree (the number of edges on the longest
             downward path from this tree's root node to a descendant leaf node).
 
-            Best case: O(1) If the binary tree isn't defined yet or there is only a root
-            node.
-            Worst case: O(n) Where we have to traverse the entire list of nodes to find the height
+            Running time: O(1) - Every node caches the height of its subtree
         """
         if not self.root:
             return 0
 
-        if self.root.is_leaf():
-            return 0
+        return self.root._height
+
+    def rank(self, item):
+        """
+            Return the number of items in this tree that are less than the given
+            item, which is its index in items_in_order() if it is present.
+            Running time: O(h) - One walk down from the root, adding up the
+            cached sizes of the left subtrees we pass
+        """
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.data > item:
+                node = node.left
+            elif node.data == item:
+                return rank + _size(node.left)
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
 
-        return self.root.height()
+    def select(self, index):
+        """
+            Return the item at the given index in in-order (the index-th smallest
+            item), or raise ValueError if the index is out of range.
+            Running time: O(h) - The cached subtree sizes tell us which way to go
+            at each node without visiting anything else
+        """
+        if not 0 <= index < self.size:
+            raise ValueError("Index out of range: {}".format(index))
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.data
+            else:
+                index -= left_size + 1
+                node = node.right
 
     def contains(self, item):
         """
@@ -98,7 +164,7 @@ class BinarySearchTree(object):
             or simply doesn't exist
         """
         # Find a node with the given item, if any
-        node = self._find_node_recursive(item, self.root)
+        node = self._find_node_iterative(item)
         # Return True if a node was found, or False
         return node is not None
 
@@ -112,30 +178,196 @@ class BinarySearchTree(object):
             or simply doesn't exist
         """
         # Find a node with the given item, if any
-        node = self._find_node_recursive(item, self.root)
+        node = self._find_node_iterative(item)
         return node.data if node else None
 
     def insert(self, item):
         """
-            Insert the given item in order into this binary search tree.
-            TODO: Best case running time: O(1) where the tree is empty
-            TODO: Worst case running time: O(logn) where we have to insert towards the middle
-            or end of the tree
+            Insert the given item in order into this binary search tree,
+            replacing the stored item if an equal one is already present.
+            Best case running time: O(1) where the tree is empty
+            Worst case running time: O(h) where h is the height of the tree, which
+            is O(logn) for random input but O(n) for sorted input. The walk down
+            is iterative, so deep trees use no extra stack, and the walk back
+            up keeps the cached heights and sizes current.
         """
-        # Handle the case where the tree is empty
-        if self.is_empty():
-            self.root = BinaryTreeNode(item)
-            self.size += 1
-            return
-        # Find the parent node of where the given item should be inserted
-        parent = self._find_parent_node_recursive(item, self.root)
+        self._insert(item)
 
-        # Check where to insert the node
-        if parent.data > item:
-            parent.left = BinaryTreeNode(item)
-        elif parent.data < item:
-            parent.right = BinaryTreeNode(item)
+    def _insert(self, item):
+        """
+            Insert the given item as insert() does, and return the node that
+            now holds it, whether new or already present.
+        """
+        # Descend to where the item belongs, remembering the way back up
+        path = []
+        node = self.root
+        while node is not None:
+            if node.data == item:
+                node.data = item
+                return node
+            path.append(node)
+            node = node.left if node.data > item else node.right
+
+        node = self.node_class(item)
         self.size += 1
+        if not path:
+            self.root = node
+            return node
+        parent = path[-1]
+        if parent.data > item:
+            parent.left = node
+        else:
+            parent.right = node
+        self._retrace(path, 1)
+        return node
+
+    def _update_node(self, node):
+        """Recompute the cached height and size of the given node from its children."""
+        left, right = node.left, node.right
+        node._height = max(_height(left), _height(right)) + 1
+        node._size = _size(left) + _size(right) + 1
+
+    def _retrace(self, path, change):
+        """
+            Walk back up the given root-to-node path after an insert or delete,
+            which changed the number of nodes below the end of the path by the
+            given amount, keeping the cached heights and sizes up to date.
+            Running time: O(h) - Heights are recomputed only until one comes
+            out unchanged, since nothing above it can change height either;
+            the sizes above that just move by the change.
+        """
+        index = len(path) - 1
+        while index >= 0:
+            node = path[index]
+            old_height = node._height
+            self._update_node(node)
+            index -= 1
+            if node._height == old_height:
+                break
+        while index >= 0:
+            path[index]._size += change
+            index -= 1
+
+    def min(self):
+        """
+            Return the smallest item in this tree, or raise ValueError if empty.
+            Running time: O(h) - Follow left children down from the root
+        """
+        if self.root is None:
+            raise ValueError("Binary search tree is empty")
+        node = self.root
+        while node.left is not None:
+            node = node.left
+        return node.data
+
+    def max(self):
+        """
+            Return the largest item in this tree, or raise ValueError if empty.
+            Running time: O(h) - Follow right children down from the root
+        """
+        if self.root is None:
+            raise ValueError("Binary search tree is empty")
+        node = self.root
+        while node.right is not None:
+            node = node.right
+        return node.data
+
+    def floor(self, item):
+        """
+            Return the largest item in this tree less than or equal to the given
+            item, or None if there isn't one.
+            Running time: O(h) - One walk down from the root
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data == item:
+                return node.data
+            if node.data > item:
+                node = node.left
+            else:
+                # A candidate, but there may be a closer one to its right
+                best = node
+                node = node.right
+        return best.data if best is not None else None
+
+    def ceiling(self, item):
+        """
+            Return the smallest item in this tree greater than or equal to the
+            given item, or None if there isn't one.
+            Running time: O(h) - One walk down from the root
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data == item:
+                return node.data
+            if node.data > item:
+                # A candidate, but there may be a closer one to its left
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best.data if best is not None else None
+
+    def predecessor(self, item):
+        """
+            Return the largest item in this tree strictly less than the given
+            item, or None if there isn't one. The item needn't be in the tree.
+            Running time: O(h) - One walk down from the root
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if item > node.data:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best.data if best is not None else None
+
+    def successor(self, item):
+        """
+            Return the smallest item in this tree strictly greater than the given
+            item, or None if there isn't one. The item needn't be in the tree.
+            Running time: O(h) - One walk down from the root
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            if node.data > item:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best.data if best is not None else None
+
+    def range(self, lo, hi):
+        """
+            Generate the items in this tree from lo up to but not including hi,
+            in order, like the built-in range.
+            Running time: O(h + k) - Where k is the number of items generated,
+            because subtrees entirely below lo are never entered and we stop at
+            the first item at or above hi
+            Memory usage: O(h) - Only the path down to the current node is kept
+        """
+        stack = []
+        node = self.root
+        while True:
+            # Descend towards lo, skipping left subtrees that are all below it
+            while node is not None:
+                if lo > node.data:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not hi > node.data:
+                return
+            yield node.data
+            node = node.right
 
     def _find_node_iterative(self, item):
         """
@@ -239,55 +471,58 @@ class BinarySearchTree(object):
             )  # Hint: Remember to update the parent parameter
 
     def delete(self, item):
-        """Remove given item from this tree, if present, or raise ValueError.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
-        parent_node = self._find_parent_node_recursive(item, self.root)
-
-        if parent_node:
-            self.size -= 1
-
-            # Start removal
-            if parent_node.data > item:
-                node_to_remove = parent_node.left
-
-                # No children leafs, sever node off
-                if node_to_remove.is_leaf():
-                    parent_node.left = None
-                    return
-
-                # If the right node is present, move it up to the new node.
-                # If it's not, move up the left node. Essentially moves up the next
-                # greatest value.
-                if node_to_remove.right:
-                    parent_node.left = node_to_remove.right
-                else:
-                    parent_node.left = node_to_remove.left
-            else:
-                node_to_remove = parent_node.right
-
-                if node_to_remove.is_leaf():
-                    parent_node.left = None
-                    return
+        """
+            Remove given item from this tree, if present, or raise ValueError.
+            Best case running time: O(1) where the item is at the root and has
+            at most one child
+            Worst case running time: O(h) where h is the height of the tree and
+            the item (or its successor) is at the bottom. Every step is
+            iterative, so deep trees use no extra stack.
+        """
+        # Find the node and the path down to it without recursing
+        path = []
+        node = self.root
+        while node is not None and node.data != item:
+            path.append(node)
+            node = node.left if node.data > item else node.right
+        if node is None:
+            raise ValueError("Node is not located within the binary tree")
 
-                # If the left node is present, move it up to the new node.
-                # If it's not, move up the right node. Essentially moves up the next
-                # greatest value.
-                if node_to_remove.left:
-                    parent_node.right = node_to_remove.left
-                else:
-                    parent_node.right = node_to_remove.right
+        if node.left is not None and node.right is not None:
+            node = self._swap_with_successor(node, path)
+        # Leaves and nodes with one child are replaced by that child
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self.size -= 1
+        self._retrace(path, -1)
 
-        # Root node doesn't have a parent node, but can contain item
-        # we're looking for.
-        elif parent_node is None and self.root.data == item:
-            self.size -= 1
-            self.root == None
+    def _replace_child(self, parent, node, child):
+        """
+            Link the given child into the given node's place under parent,
+            or make it the root if the node has no parent.
+        """
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            raise ValueError("Node is not located within the binary tree")
-        # TODO: Use helper methods and break this algorithm down into 3 cases
-        # based on how many children the node containing the given item has and
-        # implement new helper methods for subtasks of the more complex cases
+            parent.right = child
+
+    def _swap_with_successor(self, node, path):
+        """
+            Move the item of the in-order successor of the given node, which has
+            two children, into it and return the successor to be spliced out
+            instead. The successor is the leftmost node of the right subtree, so
+            it never has a left child. The nodes passed on the way are added to
+            the given path.
+        """
+        path.append(node)
+        successor = node.right
+        while successor.left is not None:
+            path.append(successor)
+            successor = successor.left
+        node.data = successor.data
+        return successor
 
     def items_in_order(self):
         """Return an in-order list of all items in this binary search tree."""
@@ -298,6 +533,24 @@ class BinarySearchTree(object):
         # Return in-order list of all items in tree
         return items
 
+    def iter_in_order(self):
+        """
+            Generate all items in this binary search tree in-order, lazily.
+            Running time: O(1) amortized per item - Each node is pushed and popped once
+            Memory usage: O(h) - Only the path down to the current node is kept
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                # Go as far left as possible, remembering the way back
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.data
+                node = node.right
+
     def _traverse_in_order_recursive(self, node, visit):
         """
             Traverse this binary tree with recursive in-order traversal (DFS).
@@ -346,6 +599,24 @@ class BinarySearchTree(object):
         # Return pre-order list of all items in tree
         return items
 
+    def iter_pre_order(self):
+        """
+            Generate all items in this binary search tree pre-order, lazily.
+            Running time: O(1) per item - Each node is pushed and popped once
+            Memory usage: O(h) - At most one pending right child per level
+        """
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            # Push right first so the left subtree is visited first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
     def _traverse_pre_order_recursive(self, node, visit):
         """
             Traverse this binary tree with recursive pre-order traversal (DFS).
@@ -391,6 +662,28 @@ class BinarySearchTree(object):
         # Return post-order list of all items in tree
         return items
 
+    def iter_post_order(self):
+        """
+            Generate all items in this binary search tree post-order, lazily.
+            Running time: O(1) amortized per item - Each node is pushed and popped once
+            Memory usage: O(h) - Only the path down to the current node is kept
+        """
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                # Visit the right subtree first unless we just came back from it
+                if top.right is not None and top.right is not last_visited:
+                    node = top.right
+                else:
+                    yield top.data
+                    last_visited = stack.pop()
+
     def _traverse_post_order_recursive(self, node, visit):
         """
             Traverse this binary tree with recursive post-order traversal (DFS).
@@ -449,6 +742,24 @@ class BinarySearchTree(object):
         # Return level-order list of all items in tree
         return items
 
+    def iter_level_order(self):
+        """
+            Generate all items in this binary search tree level-order, lazily.
+            Running time: O(1) per item - Each node is enqueued and dequeued once
+            Memory usage: O(w) - Where w is the widest level of the tree
+        """
+        if self.root is None:
+            return
+        queue = Queue()
+        queue.enqueue(self.root)
+        while not queue.is_empty():
+            node = queue.dequeue()
+            yield node.data
+            if node.left is not None:
+                queue.enqueue(node.left)
+            if node.right is not None:
+                queue.enqueue(node.right)
+
     def _traverse_level_order_iterative(self, start_node, visit):
         """Traverse this binary tree with iterative level-order traversal (BFS).
         Start at the given node and visit each node with the given function.
@@ -472,6 +783,198 @@ class BinarySearchTree(object):
                 queue.enqueue(node.right)
 
 
+class AVLTree(BinarySearchTree):
+    """
+        Self-balancing binary search tree, also made by
+        BinarySearchTree(balanced=True). After every insert and delete the
+        heights of the two subtrees of any node differ by at most one, which
+        keeps the tree height under 1.45 log2(n) whatever the insertion order.
+        Only the walk back up after an insert or delete differs; everything
+        else is inherited.
+    """
+
+    def __repr__(self):
+        """Return a string representation of this AVL tree."""
+        return "AVLTree({} nodes)".format(self.size)
+
+    def _rotate_left(self, node):
+        """
+            Rotate the given node down to the left and return its right child,
+            which takes its place as the root of the subtree.
+        """
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """
+            Rotate the given node down to the right and return its left child,
+            which takes its place as the root of the subtree.
+        """
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        """
+            Update the cached height and size of the given node and rotate it if
+            its subtrees are out of balance, returning the new subtree root.
+        """
+        self._update_node(node)
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            # Left-right case: straighten it out into a left-left case first
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            # Right-left case: straighten it out into a right-right case first
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _retrace(self, path, change):
+        """
+            Walk back up the given root-to-node path after an insert or delete,
+            rebalancing each node and linking rotated subtrees back into place.
+            Like the unbalanced walk, this stops rebalancing once a subtree's
+            height is unchanged and only adjusts the sizes above it.
+            Running time: O(logn) - At most one rotation per level, and an
+            insert needs at most one (single or double) rotation in total
+        """
+        index = len(path) - 1
+        while index >= 0:
+            node = path[index]
+            old_height = node._height
+            subtree = self._rebalance(node)
+            index -= 1
+            if subtree is not node:
+                self._replace_child(path[index] if index >= 0 else None, node, subtree)
+            if subtree._height == old_height:
+                break
+        while index >= 0:
+            path[index]._size += change
+            index -= 1
+
+
+class TreeMapNode(BinaryTreeNode):
+    # The key is kept in data, so every tree method orders nodes by key
+    __slots__ = ("value",)
+
+    def __init__(self, key, value=None):
+        """Initialize this tree map node with the given key and value."""
+        super().__init__(key)
+        self.value = value
+
+    def __repr__(self):
+        """Return a string representation of this tree map node."""
+        return "TreeMapNode({!r}: {!r})".format(self.data, self.value)
+
+
+class TreeMap(AVLTree):
+    """
+        Ordered map from keys to values with the same interface as HashTable,
+        stored in an AVL tree of TreeMapNodes. keys(), values() and items()
+        are live views that iterate in key order, and every BinarySearchTree
+        query (range, floor, ceiling, rank, select, min, max, ...) works on
+        the keys.
+    """
+
+    node_class = TreeMapNode
+
+    def __init__(self, pairs=None):
+        """Initialize this tree map and set the given (key, value) pairs."""
+        self._version = 0  # Bumped whenever keys are added or removed
+        self._iterators = 0  # Views being iterated, counted by TableView
+        super().__init__()
+        if pairs is not None:
+            for key, value in pairs:
+                self.set(key, value)
+
+    def __repr__(self):
+        """Return a string representation of this tree map."""
+        return "TreeMap({} entries)".format(self.size)
+
+    def _entries(self):
+        """
+            Yield every (key, value) entry in key order.
+            Running time: O(1) amortized per entry - The same walk as iter_in_order
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield (node.data, node.value)
+                node = node.right
+
+    def keys(self):
+        """Return a live view of all keys in this tree map, in order."""
+        return KeysView(self)
+
+    def values(self):
+        """Return a live view of all values in this tree map, in key order."""
+        return ValuesView(self)
+
+    def items(self):
+        """Return a live view of all (key, value) entries in this tree map, in key order."""
+        return ItemsView(self)
+
+    def length(self):
+        """
+            Return the number of entries in this tree map.
+            Running time: O(1) - We keep track of the size
+        """
+        return self.size
+
+    def get(self, key):
+        """
+            Return the value associated with the given key, or raise KeyError.
+            Running time: O(logn) - The tree is balanced
+        """
+        node = self._find_node_iterative(key)
+        if node is None:
+            raise KeyError("Key not found: {}".format(key))
+        return node.value
+
+    def set(self, key, value):
+        """
+            Insert or update the given key with its associated value.
+            Running time: O(logn) - One walk down and back up a balanced tree
+        """
+        size = self.size
+        self._insert(key).value = value
+        if self.size != size:
+            self._version += 1
+
+    def delete(self, key):
+        """
+            Delete the given key and its associated value, or raise KeyError.
+            Running time: O(logn) - One walk down and back up a balanced tree
+        """
+        try:
+            super().delete(key)
+        except ValueError:
+            raise KeyError("Key not found: {}".format(key))
+        self._version += 1
+
+    def _swap_with_successor(self, node, path):
+        """Move the successor's value along with its key."""
+        successor = super()._swap_with_successor(node, path)
+        node.value = successor.value
+        return successor
+
+
 def test_binary_search_tree():
     # Create a complete binary search tree of 3, 7, or 15 items in level-order
     # items = [2, 1, 3]
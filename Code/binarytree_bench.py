@@ -0,0 +1,155 @@
+#!python
+"""
+    Benchmarks for the trees in binarytree.py.
+    Usage: python binarytree_bench.py [number of keys]
+"""
+
+import random
+
+from bench import arg_size, report, timed, traced
+from binarytree import BinarySearchTree, TreeMap
+from hashtable import HashTable
+
+
+def insertion_orders(count):
+    """Return the sorted, reversed and shuffled key orders to build trees from."""
+    shuffled = list(range(count))
+    random.shuffle(shuffled)
+    return (
+        ("sorted", range(count)),
+        ("reversed", range(count - 1, -1, -1)),
+        ("random", shuffled),
+    )
+
+
+def build(tree, keys):
+    """Insert the given keys into the tree one at a time."""
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+    return tree
+
+
+def lookup(tree, keys):
+    """Check the tree contains every one of the given keys."""
+    contains = tree.contains
+    for key in keys:
+        contains(key)
+
+
+def bench_balanced(count, degenerate_sizes=(1000, 2000, 4000, 8000)):
+    """
+        Insert and lookup throughput for the balanced and plain trees.
+        Sorted and reversed keys make the plain tree a linked list, so each
+        insert and lookup walks every node and the whole load is O(n^2).
+        The plain tree runs those orders at a few doubling sizes instead of
+        count, which shows its per-key rate halving as the tree doubles.
+    """
+    for order, keys in insertion_orders(count):
+        runs = [(True, keys)]
+        if order == "random":
+            runs.append((False, keys))
+        else:
+            runs.extend((False, keys[:size]) for size in degenerate_sizes)
+        for balanced, run_keys in runs:
+            seconds, tree = timed(build, BinarySearchTree(balanced=balanced), run_keys)
+            lookup_seconds, _ = timed(lookup, tree, run_keys)
+            report("{} {}".format("AVLTree" if balanced else "BinarySearchTree", order),
+                   keys=len(run_keys), height=tree.height(),
+                   inserts_per_sec=len(run_keys) / seconds,
+                   lookups_per_sec=len(run_keys) / lookup_seconds)
+
+
+def bench_order_statistics(count, queries=10 ** 5):
+    """Cost of polling height() and of rank/select queries on a random tree."""
+    keys = list(range(count))
+    random.shuffle(keys)
+    tree = build(BinarySearchTree(balanced=True), keys)
+    seconds, _ = timed(lambda: [tree.height() for _ in range(queries)])
+    report("height() cached", keys=count, polls_per_sec=queries / seconds)
+    seconds, _ = timed(tree.root.height)
+    report("height() full walk", keys=count, polls_per_sec=1 / seconds)
+    seconds, _ = timed(lambda: [tree.rank(key) for key in keys[:queries]])
+    report("rank()", keys=count, queries_per_sec=queries / seconds)
+    seconds, _ = timed(lambda: [tree.select(index) for index in keys[:queries]])
+    report("select()", keys=count, queries_per_sec=queries / seconds)
+
+
+def first_and_drain(traversal):
+    """
+        Return the seconds until the first item of the given traversal and
+        the seconds until it has been exhausted.
+    """
+    first, items = timed(lambda: iter(traversal()))
+    seconds, _ = timed(next, items)
+    first += seconds
+    rest, _ = timed(lambda: sum(1 for _ in items))
+    return first, first + rest
+
+
+def bench_traversals(count):
+    """Time to first item, total time and peak memory of each traversal."""
+    keys = list(range(count))
+    random.shuffle(keys)
+    tree = build(BinarySearchTree(balanced=True), keys)
+    for order in ("in_order", "pre_order", "post_order", "level_order"):
+        for prefix in ("items_", "iter_"):
+            traversal = getattr(tree, prefix + order)
+            first, total = first_and_drain(traversal)
+            _, peak, _ = traced(lambda: sum(1 for _ in traversal()))
+            report(prefix + order, nodes=count, first_item_usec=first * 10 ** 6,
+                   total_sec=total, peak_bytes=peak)
+
+def bench_range_queries(count, window=1000, queries=100):
+    """A window query with range() against filtering items_in_order()."""
+    keys = list(range(count))
+    random.shuffle(keys)
+    tree = build(BinarySearchTree(balanced=True), keys)
+    starts = [random.randrange(count - window) for _ in range(queries)]
+    seconds, _ = timed(lambda: [list(tree.range(lo, lo + window)) for lo in starts])
+    report("range()", keys=count, window=window, queries_per_sec=queries / seconds)
+    # The old way walks the whole tree every time, so just a few of these
+    starts = starts[:3]
+    seconds, _ = timed(lambda: [
+        [item for item in tree.items_in_order() if lo <= item < lo + window]
+        for lo in starts
+    ])
+    report("filter items_in_order()", keys=count, window=window,
+           queries_per_sec=len(starts) / seconds)
+
+
+def fill(table, keys):
+    """Set every one of the given keys in the table, mapped to itself."""
+    set_ = table.set
+    for key in keys:
+        set_(key, key)
+    return table
+
+
+def bench_tree_map(count, lookups=10 ** 5):
+    """
+        TreeMap against a HashTable that is sorted whenever ordered output is
+        needed: memory, lookup latency and a sorted walk over every entry.
+    """
+    keys = list(range(count))
+    random.shuffle(keys)
+    probes = keys[:lookups]
+    for name, make_table, sorted_items in (
+        ("TreeMap", TreeMap, lambda table: list(table.items())),
+        ("HashTable + sorted()", HashTable, lambda table: sorted(table.items())),
+    ):
+        current, _, table = traced(lambda: fill(make_table(), keys))
+        get = table.get
+        seconds, _ = timed(lambda: [get(key) for key in probes])
+        sort_seconds, _ = timed(sorted_items, table)
+        report(name, entries=count, bytes_per_entry=current / count,
+               get_usec=seconds / lookups * 10 ** 6, sorted_items_sec=sort_seconds)
+        del table
+
+
+if __name__ == "__main__":
+    bench_balanced(arg_size(10 ** 6))
+    bench_order_statistics(arg_size(10 ** 6))
+    bench_traversals(arg_size(10 ** 6))
+    bench_range_queries(arg_size(10 ** 6))
+    bench_tree_map(arg_size(10 ** 6))
@@ -1,6 +1,7 @@
 #!python
 
-from binarytree import BinarySearchTree, BinaryTreeNode
+from binarytree import AVLTree, BinarySearchTree, BinaryTreeNode, TreeMap
+import random
 import unittest
 
 
@@ -13,6 +14,10 @@ class BinaryTreeNodeTest(unittest.TestCase):
         assert node.left is None
         assert node.right is None
 
+    def test_slots(self):
+        node = BinaryTreeNode(123)
+        assert not hasattr(node, '__dict__')
+
     def test_is_leaf(self):
         # Create node with no children
         node = BinaryTreeNode(2)
@@ -174,50 +179,118 @@ class BinarySearchTreeTest(unittest.TestCase):
         assert tree.root.right.left.data == 5
         assert tree.root.right.right.data == 7
 
-    def DISABLED_test_delete_with_3_items(self):
+    def test_delete_with_3_items(self):
         # Create a complete binary search tree of 3 items in level-order
         items = [2, 1, 3]
         tree = BinarySearchTree(items)
         assert tree.root.data == 2
         assert tree.root.left.data == 1
         assert tree.root.right.data == 3
-        # TODO: Test structure of tree after each deletion
-        # tree.delete(2)
-        # assert tree.root.data == ...
-        # assert tree.root.left is ...
-        # assert tree.root.right is ...
-        # tree.delete(1)
-        # assert tree.root.data == ...
-        # assert tree.root.left is ...
-        # assert tree.root.right is ...
-        # tree.delete(3)
-        # assert tree.root.data is ...
-        # assert tree.root.left is ...
-        # assert tree.root.right is ...
-
-    def DISABLED_test_delete_with_7_items(self):
+        # The root has two children, so its successor takes its place
+        tree.delete(2)
+        assert tree.root.data == 3
+        assert tree.root.left.data == 1
+        assert tree.root.right is None
+        tree.delete(1)
+        assert tree.root.data == 3
+        assert tree.root.left is None
+        assert tree.root.right is None
+        tree.delete(3)
+        assert tree.root is None
+        assert tree.size == 0
+        with self.assertRaises(ValueError):
+            tree.delete(3)
+
+    def test_delete_with_7_items(self):
         # Create a complete binary search tree of 7 items in level-order
         items = [4, 2, 6, 1, 3, 5, 7]
         tree = BinarySearchTree(items)
-        # TODO: Test structure of tree after each deletion
-        # tree.delete(4)
-        # assert tree.root.data == ...
-        # assert tree.root.left.data == ...
-        # assert tree.root.right.data == ...
-        # assert ...
-        # assert ...
-        # tree.delete(...)
-        # assert tree.root.data == ...
-        # assert tree.root.left.data == ...
-        # assert tree.root.right.data == ...
-        # assert ...
-        # assert ...
-        # tree.delete(...)
-        # assert tree.root.data == ...
-        # assert tree.root.left.data == ...
-        # assert tree.root.right.data == ...
-        # assert ...
-        # assert ...
+        tree.delete(4)
+        assert tree.root.data == 5
+        assert tree.root.left.data == 2
+        assert tree.root.right.data == 6
+        assert tree.root.right.left is None
+        assert tree.root.right.right.data == 7
+        tree.delete(2)
+        assert tree.root.data == 5
+        assert tree.root.left.data == 3
+        assert tree.root.left.left.data == 1
+        assert tree.root.left.right is None
+        tree.delete(5)
+        assert tree.root.data == 6
+        assert tree.root.left.data == 3
+        assert tree.root.right.data == 7
+        assert tree.size == 4
+        assert tree.items_in_order() == [1, 3, 6, 7]
+
+    def test_insert_duplicate(self):
+        tree = BinarySearchTree([2, 1, 3])
+        tree.insert(1)
+        tree.insert(2)
+        assert tree.size == 3
+        assert tree.items_level_order() == [2, 1, 3]
+
+    def test_cached_height_and_size(self):
+        items = list(range(200))
+        random.shuffle(items)
+        tree = BinarySearchTree(items)
+        random.shuffle(items)
+        for item in items[:100]:
+            tree.delete(item)
+        # Every node's cache must match a fresh measurement
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            assert node._height == node.height()
+            assert node._size == 1 + sum(child._size for child in (node.left, node.right) if child)
+            stack.extend(child for child in (node.left, node.right) if child)
+        assert tree.height() == tree.root.height()
+        assert tree.root._size == tree.size == 100
+
+    def test_rank_and_select(self):
+        for balanced in (False, True):
+            items = list(range(0, 200, 2))
+            random.shuffle(items)
+            tree = BinarySearchTree(items, balanced=balanced)
+            for index, item in enumerate(range(0, 200, 2)):
+                assert tree.rank(item) == index
+                assert tree.rank(item + 1) == index + 1
+                assert tree.select(index) == item
+            assert tree.rank(-1) == 0
+            tree.delete(0)
+            assert tree.select(0) == 2
+            assert tree.rank(198) == 98
+            with self.assertRaises(ValueError):
+                tree.select(99)
+            with self.assertRaises(ValueError):
+                tree.select(-1)
+            with self.assertRaises(ValueError):
+                BinarySearchTree().select(0)
+
+    def test_degenerate_tree_stress(self):
+        # Link a million nodes into one long right spine directly, from the
+        # bottom up so each node's cached height and size can be filled in,
+        # since inserting them one by one would take quadratic time
+        count = 10 ** 6
+        tree = BinarySearchTree()
+        for item in range(count - 1, -1, -1):
+            node = BinaryTreeNode(item)
+            node.right = tree.root
+            tree._update_node(node)
+            tree.root = node
+        tree.size = count
+        # None of these may raise RecursionError
+        assert tree.height() == count - 1
+        assert tree.contains(count - 1) is True
+        assert tree.search(count) is None
+        tree.insert(count)
+        assert tree.size == count + 1
+        assert tree.height() == count
+        tree.delete(count - 1)
+        assert tree.contains(count - 1) is False
+        assert tree.contains(count) is True
+        assert tree.size == count
+        assert tree.root.height() == count - 1
 
     def test_items_in_order_with_3_strings(self):
         # Create a complete binary search tree of 3 strings in level-order
@@ -276,5 +349,252 @@ class BinarySearchTreeTest(unittest.TestCase):
         assert tree.items_level_order() == [4, 2, 6, 1, 3, 5, 7]
 
 
+    def test_iter_with_7_numbers(self):
+        # Create a complete binary search tree of 7 items in level-order
+        items = [4, 2, 6, 1, 3, 5, 7]
+        tree = BinarySearchTree(items)
+        assert list(tree) == [1, 2, 3, 4, 5, 6, 7]
+        assert list(tree.iter_in_order()) == [1, 2, 3, 4, 5, 6, 7]
+        assert list(tree.iter_pre_order()) == [4, 2, 1, 3, 6, 5, 7]
+        assert list(tree.iter_post_order()) == [1, 3, 2, 5, 7, 6, 4]
+        assert list(tree.iter_level_order()) == [4, 2, 6, 1, 3, 5, 7]
+
+    def test_iter_empty(self):
+        tree = BinarySearchTree()
+        assert list(tree) == []
+        assert list(tree.iter_pre_order()) == []
+        assert list(tree.iter_post_order()) == []
+        assert list(tree.iter_level_order()) == []
+
+    def test_iter_is_lazy(self):
+        tree = BinarySearchTree([4, 2, 6, 1, 3, 5, 7])
+        items = iter(tree)
+        assert next(items) == 1
+        assert next(items) == 2
+        # Stopping early is fine, and a new iterator starts over
+        assert next(iter(tree)) == 1
+        assert next(tree.iter_post_order()) == 1
+
+    def test_iter_matches_items(self):
+        items = list(range(300))
+        random.shuffle(items)
+        tree = BinarySearchTree(items)
+        assert list(tree.iter_in_order()) == tree.items_in_order()
+        assert list(tree.iter_pre_order()) == tree.items_pre_order()
+        assert list(tree.iter_post_order()) == tree.items_post_order()
+        assert list(tree.iter_level_order()) == tree.items_level_order()
+
+    def test_min_and_max(self):
+        tree = BinarySearchTree([4, 2, 6, 1, 3, 5, 7])
+        assert tree.min() == 1
+        assert tree.max() == 7
+        with self.assertRaises(ValueError):
+            BinarySearchTree().min()
+        with self.assertRaises(ValueError):
+            BinarySearchTree().max()
+
+    def test_floor_and_ceiling(self):
+        tree = BinarySearchTree([40, 20, 60, 10, 30, 50, 70])
+        assert tree.floor(30) == 30
+        assert tree.floor(35) == 30
+        assert tree.floor(5) is None
+        assert tree.floor(99) == 70
+        assert tree.ceiling(30) == 30
+        assert tree.ceiling(35) == 40
+        assert tree.ceiling(5) == 10
+        assert tree.ceiling(99) is None
+        assert BinarySearchTree().floor(1) is None
+
+    def test_predecessor_and_successor(self):
+        tree = BinarySearchTree([40, 20, 60, 10, 30, 50, 70])
+        assert tree.predecessor(40) == 30
+        assert tree.predecessor(35) == 30
+        assert tree.predecessor(10) is None
+        assert tree.successor(40) == 50
+        assert tree.successor(35) == 40
+        assert tree.successor(70) is None
+
+    def test_range(self):
+        tree = BinarySearchTree([40, 20, 60, 10, 30, 50, 70])
+        assert list(tree.range(20, 60)) == [20, 30, 40, 50]
+        assert list(tree.range(15, 55)) == [20, 30, 40, 50]
+        assert list(tree.range(0, 100)) == [10, 20, 30, 40, 50, 60, 70]
+        assert list(tree.range(60, 20)) == []
+        assert list(tree.range(71, 100)) == []
+        assert list(BinarySearchTree().range(0, 1)) == []
+
+    def test_range_matches_filter(self):
+        items = list(range(0, 1000, 3))
+        random.shuffle(items)
+        for balanced in (False, True):
+            tree = BinarySearchTree(items, balanced=balanced)
+            for _ in range(50):
+                lo = random.randint(-10, 1010)
+                hi = random.randint(lo, 1010)
+                expected = [item for item in tree.items_in_order() if lo <= item < hi]
+                assert list(tree.range(lo, hi)) == expected
+
+class AVLTreeTest(unittest.TestCase):
+
+    def assert_balanced(self, node):
+        """Check the cached heights and balance of every node under node."""
+        if node is None:
+            return -1
+        left = self.assert_balanced(node.left)
+        right = self.assert_balanced(node.right)
+        assert abs(left - right) <= 1
+        assert node.height() == max(left, right) + 1
+        return node.height()
+
+    def test_balanced_option(self):
+        tree = BinarySearchTree([2, 1, 3], balanced=True)
+        assert isinstance(tree, AVLTree)
+        assert isinstance(BinarySearchTree(), AVLTree) is False
+        assert tree.items_in_order() == [1, 2, 3]
+
+    def test_insert_sorted(self):
+        tree = BinarySearchTree(range(1023), balanced=True)
+        assert tree.size == 1023
+        assert tree.height() == 9
+        assert tree.root.data == 511
+        self.assert_balanced(tree.root)
+        assert tree.items_in_order() == list(range(1023))
+
+    def test_insert_reversed(self):
+        tree = BinarySearchTree(reversed(range(1000)), balanced=True)
+        assert tree.height() <= 10
+        self.assert_balanced(tree.root)
+        assert tree.items_in_order() == list(range(1000))
+
+    def test_rotations(self):
+        # Left-right and right-left cases each need a double rotation
+        for items in ([3, 1, 2], [1, 3, 2], [1, 2, 3], [3, 2, 1]):
+            tree = AVLTree(items)
+            assert tree.root.data == 2
+            assert tree.root.left.data == 1
+            assert tree.root.right.data == 3
+
+    def test_insert_duplicate(self):
+        tree = AVLTree([(2, 'B'), (1, 'A')])
+        tree.insert((2, 'B'))
+        assert tree.size == 2
+
+    def test_search(self):
+        items = list(range(100))
+        random.shuffle(items)
+        tree = AVLTree(items)
+        for item in items:
+            assert tree.contains(item) is True
+            assert tree.search(item) == item
+        assert tree.contains(100) is False
+        assert tree.search(-1) is None
+
+    def test_delete(self):
+        tree = AVLTree([4, 2, 6, 1, 3, 5, 7])
+        tree.delete(4)
+        assert tree.root.data == 5
+        assert tree.size == 6
+        tree.delete(1)
+        tree.delete(3)
+        assert tree.root.data == 5
+        assert tree.root.left.data == 2
+        tree.delete(2)
+        assert tree.root.data == 6
+        assert tree.items_in_order() == [5, 6, 7]
+        with self.assertRaises(ValueError):
+            tree.delete(2)
+        for item in (5, 6, 7):
+            tree.delete(item)
+        assert tree.is_empty() is True
+        assert tree.size == 0
+
+    def test_random_inserts_and_deletes(self):
+        items = list(range(2000))
+        random.shuffle(items)
+        tree = AVLTree(items)
+        random.shuffle(items)
+        for item in items[:1000]:
+            tree.delete(item)
+        self.assert_balanced(tree.root)
+        assert tree.size == 1000
+        assert tree.items_in_order() == sorted(items[1000:])
+
+
+class TreeMapTest(unittest.TestCase):
+
+    def test_init(self):
+        tree_map = TreeMap()
+        assert tree_map.length() == 0
+        assert tree_map.is_empty() is True
+        tree_map = TreeMap([('B', 2), ('A', 1)])
+        assert tree_map.length() == 2
+        assert tree_map.get('A') == 1
+
+    def test_set_and_get(self):
+        tree_map = TreeMap()
+        tree_map.set('I', 1)
+        tree_map.set('V', 5)
+        tree_map.set('X', 10)
+        assert tree_map.get('I') == 1
+        assert tree_map.get('V') == 5
+        assert tree_map.get('X') == 10
+        assert tree_map.length() == 3
+        with self.assertRaises(KeyError):
+            tree_map.get('A')
+
+    def test_set_twice_and_updates(self):
+        tree_map = TreeMap()
+        tree_map.set('I', 1)
+        tree_map.set('V', 4)
+        tree_map.set('V', 5)
+        assert tree_map.get('V') == 5
+        assert tree_map.length() == 2
+
+    def test_contains(self):
+        tree_map = TreeMap([('I', 1), ('V', 5)])
+        assert tree_map.contains('I') is True
+        assert tree_map.contains('X') is False
+
+    def test_delete(self):
+        tree_map = TreeMap([(key, key * 10) for key in [4, 2, 6, 1, 3, 5, 7]])
+        # Deleting a node with two children must carry the successor's value
+        tree_map.delete(4)
+        assert tree_map.get(5) == 50
+        assert tree_map.get(6) == 60
+        tree_map.delete(1)
+        assert tree_map.length() == 5
+        assert tree_map.contains(1) is False
+        with self.assertRaises(KeyError):
+            tree_map.delete(1)
+        assert list(tree_map.items()) == [(2, 20), (3, 30), (5, 50), (6, 60), (7, 70)]
+
+    def test_sorted_views(self):
+        keys = list(range(100))
+        random.shuffle(keys)
+        tree_map = TreeMap((key, str(key)) for key in keys)
+        assert list(tree_map) == list(range(100))
+        assert list(tree_map.keys()) == list(range(100))
+        assert list(tree_map.values()) == [str(key) for key in range(100)]
+        assert list(tree_map.items()) == [(key, str(key)) for key in range(100)]
+        assert len(tree_map.items()) == 100
+        assert 5 in tree_map.keys()
+        assert (5, '5') in tree_map.items()
+        assert (5, 5) not in tree_map.items()
+
+    def test_views_detect_changes(self):
+        tree_map = TreeMap([(1, 'A'), (2, 'B')])
+        with self.assertRaises(RuntimeError):
+            for key in tree_map.keys():
+                tree_map.set(key + 10, 'C')
+
+    def test_ordered_queries(self):
+        tree_map = TreeMap((key, str(key)) for key in range(0, 100, 10))
+        assert list(tree_map.range(25, 55)) == [30, 40, 50]
+        assert tree_map.floor(25) == 20
+        assert tree_map.ceiling(25) == 30
+        assert tree_map.min() == 0
+        assert tree_map.max() == 90
+        assert tree_map.get(tree_map.select(3)) == '30'
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,183 @@
+#!python
+
+import threading
+import time
+
+from queue import LinkedQueue
+from stack import LinkedStack
+
+
+class Empty(ValueError):
+    """Raised when getting from an empty container times out or won't block."""
+
+
+class Full(ValueError):
+    """Raised when putting into a full container times out or won't block."""
+
+
+class BlockingContainer(object):
+    """
+        Thread-safe wrapper that lets producers and consumers share one of
+        the project's queues or stacks. get() waits for an item and put()
+        waits for room when a maxsize is set, so slow consumers push back
+        on producers instead of anyone polling is_empty() in a loop.
+        task_done() and join() let a producer wait until every item it
+        handed out has been processed.
+        Subclasses say how items go in and come out with _put and _get.
+    """
+
+    def __init__(self, container, maxsize=0):
+        """
+            Wrap the given empty container. A maxsize of 0 or less means
+            there is no bound on the number of items.
+        """
+        self.container = container
+        self.maxsize = maxsize
+        self._unfinished_tasks = 0
+        # All three conditions share one lock around the container
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_tasks_done = threading.Condition(self._lock)
+
+    def __repr__(self):
+        """Return a string representation of this container."""
+        return "{}({} items, maxsize={})".format(
+            type(self).__name__, self.length(), self.maxsize
+        )
+
+    def length(self):
+        """
+            Return the number of items waiting to be taken.
+            Running time: O(1) - The wrapped containers track their length
+        """
+        with self._lock:
+            return self.container.length()
+
+    def is_empty(self):
+        """Return True if there are no items waiting, or False otherwise."""
+        with self._lock:
+            return self.container.is_empty()
+
+    def is_full(self):
+        """Return True if a maxsize is set and has been reached, or False."""
+        with self._lock:
+            return 0 < self.maxsize <= self.container.length()
+
+    def _wait(self, condition, is_ready, block, timeout, error):
+        """
+            Wait on the given condition until is_ready() holds, raising the
+            given error if we can't block or the timeout runs out first.
+            Only called once is_ready() has failed, with the lock held.
+        """
+        if not block:
+            raise error
+        if timeout is None:
+            while not is_ready():
+                condition.wait()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            deadline = time.monotonic() + timeout
+            while not is_ready():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+
+    def put(self, item, block=True, timeout=None):
+        """
+            Add the given item, waiting for room if the container is full.
+            Raises Full if block is False or timeout seconds pass first.
+            Running time: O(1) - Besides any time spent waiting
+        """
+        with self._not_full:
+            if 0 < self.maxsize <= self.container.length():
+                self._wait(
+                    self._not_full,
+                    lambda: self.container.length() < self.maxsize,
+                    block,
+                    timeout,
+                    Full("The container is full"),
+                )
+            self._put(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+            Remove and return the next item, waiting for one if necessary.
+            Raises Empty if block is False or timeout seconds pass first.
+            Running time: O(1) - Besides any time spent waiting
+        """
+        with self._not_empty:
+            if self.container.is_empty():
+                self._wait(
+                    self._not_empty,
+                    lambda: not self.container.is_empty(),
+                    block,
+                    timeout,
+                    Empty("The container is empty"),
+                )
+            item = self._get()
+            self._not_full.notify()
+            return item
+
+    def put_nowait(self, item):
+        """Add the given item if there is room, or raise Full."""
+        self.put(item, block=False)
+
+    def get_nowait(self):
+        """Remove and return the next item if there is one, or raise Empty."""
+        return self.get(block=False)
+
+    def task_done(self):
+        """
+            Mark one item taken with get() as fully processed, waking any
+            join() callers once every item put so far has been processed.
+            Raises ValueError if called more times than items were put.
+        """
+        with self._all_tasks_done:
+            if self._unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks -= 1
+            if self._unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        """Block until every item put so far has been marked task_done()."""
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+
+class BlockingQueue(BlockingContainer):
+    """
+        First-in first-out BlockingContainer. Wraps a LinkedQueue by default,
+        pass queue_type=ArrayQueue for the circular buffer instead.
+    """
+
+    def __init__(self, maxsize=0, queue_type=LinkedQueue):
+        super().__init__(queue_type(), maxsize)
+
+    def _put(self, item):
+        self.container.enqueue(item)
+
+    def _get(self):
+        return self.container.dequeue()
+
+
+class BlockingStack(BlockingContainer):
+    """
+        Last-in first-out BlockingContainer. Wraps a LinkedStack by default,
+        pass stack_type=ArrayStack for the dynamic array instead.
+    """
+
+    def __init__(self, maxsize=0, stack_type=LinkedStack):
+        super().__init__(stack_type(), maxsize)
+
+    def _put(self, item):
+        self.container.push(item)
+
+    def _get(self):
+        return self.container.pop()
@@ -0,0 +1,78 @@
+#!python
+"""
+    Benchmarks for the thread-safe containers in blockingqueue.py.
+    Usage: python blockingqueue_bench.py [number of items]
+"""
+
+import importlib.util
+import os
+import sysconfig
+import threading
+
+from bench import arg_size, report, timed
+from blockingqueue import BlockingQueue, BlockingStack
+from queue import ArrayQueue
+
+
+def load_stdlib_queue():
+    """
+        Import the standard library's queue module. Our own queue.py
+        shadows it when running from this directory, so load it by path.
+    """
+    path = os.path.join(sysconfig.get_paths()["stdlib"], "queue.py")
+    spec = importlib.util.spec_from_file_location("stdlib_queue", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def pipeline(make_container, count, producers, consumers):
+    """
+        Push count items through a fresh container from the given number of
+        producer threads to the given number of consumer threads.
+    """
+    container = make_container()
+    per_producer = count // producers
+    total = per_producer * producers
+
+    def produce():
+        put = container.put
+        for item in range(per_producer):
+            put(item)
+
+    def consume(share):
+        get, task_done = container.get, container.task_done
+        for _ in range(share):
+            get()
+            task_done()
+
+    shares = [total // consumers] * consumers
+    shares[0] += total - sum(shares)
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume, args=(share,)) for share in shares]
+    for thread in threads:
+        thread.start()
+    container.join()
+    for thread in threads:
+        thread.join()
+    return total
+
+
+def bench_pipelines(count, maxsize=1000, shapes=((1, 1), (4, 4), (8, 2))):
+    """Throughput of producer/consumer pipelines against stdlib queue.Queue."""
+    stdlib_queue = load_stdlib_queue()
+    containers = (
+        ("stdlib queue.Queue", lambda: stdlib_queue.Queue(maxsize)),
+        ("BlockingQueue", lambda: BlockingQueue(maxsize)),
+        ("BlockingQueue(ArrayQueue)", lambda: BlockingQueue(maxsize, ArrayQueue)),
+        ("BlockingStack", lambda: BlockingStack(maxsize)),
+    )
+    for producers, consumers in shapes:
+        for name, make_container in containers:
+            seconds, total = timed(lambda: pipeline(make_container, count, producers, consumers))
+            report(name, producers=producers, consumers=consumers, items=total,
+                   items_per_sec=total / seconds)
+
+
+if __name__ == "__main__":
+    bench_pipelines(arg_size(2 * 10 ** 5))
@@ -0,0 +1,154 @@
+#!python
+
+from blockingqueue import BlockingQueue, BlockingStack, Empty, Full
+from queue import ArrayQueue
+from stack import ArrayStack
+import threading
+import time
+import unittest
+
+
+class BlockingQueueTest(unittest.TestCase):
+
+    def test_init(self):
+        q = BlockingQueue()
+        assert q.length() == 0
+        assert q.is_empty() is True
+        assert q.is_full() is False
+
+    def test_put_and_get(self):
+        for queue_type in (BlockingQueue, lambda: BlockingQueue(queue_type=ArrayQueue)):
+            q = queue_type()
+            q.put('A')
+            q.put('B')
+            q.put('C')
+            assert q.length() == 3
+            assert q.get() == 'A'
+            assert q.get() == 'B'
+            assert q.get() == 'C'
+            assert q.is_empty() is True
+
+    def test_nowait(self):
+        q = BlockingQueue(maxsize=1)
+        with self.assertRaises(Empty):
+            q.get_nowait()
+        q.put_nowait('A')
+        assert q.is_full() is True
+        with self.assertRaises(Full):
+            q.put_nowait('B')
+        assert q.get_nowait() == 'A'
+
+    def test_errors_are_value_errors(self):
+        q = BlockingQueue()
+        with self.assertRaises(ValueError):
+            q.get(block=False)
+
+    def test_get_timeout(self):
+        q = BlockingQueue()
+        start = time.monotonic()
+        with self.assertRaises(Empty):
+            q.get(timeout=0.05)
+        assert time.monotonic() - start >= 0.05
+        with self.assertRaises(ValueError):
+            q.get(timeout=-1)
+
+    def test_put_timeout(self):
+        q = BlockingQueue(maxsize=2)
+        q.put('A')
+        q.put('B')
+        with self.assertRaises(Full):
+            q.put('C', timeout=0.05)
+        assert q.length() == 2
+
+    def test_get_waits_for_put(self):
+        q = BlockingQueue()
+        timer = threading.Timer(0.05, q.put, args=('A',))
+        timer.start()
+        assert q.get(timeout=5) == 'A'
+        timer.join()
+
+    def test_put_waits_for_room(self):
+        q = BlockingQueue(maxsize=1)
+        q.put('A')
+        timer = threading.Timer(0.05, q.get)
+        timer.start()
+        q.put('B', timeout=5)
+        timer.join()
+        assert q.get() == 'B'
+
+    def test_task_done_and_join(self):
+        q = BlockingQueue()
+        done = []
+
+        def worker():
+            while True:
+                item = q.get()
+                if item is None:
+                    q.task_done()
+                    return
+                done.append(item)
+                q.task_done()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for item in range(1000):
+            q.put(item)
+        for _ in threads:
+            q.put(None)
+        q.join()
+        assert sorted(done) == list(range(1000))
+        for thread in threads:
+            thread.join()
+        with self.assertRaises(ValueError):
+            q.task_done()
+
+    def test_producers_and_consumers(self):
+        q = BlockingQueue(maxsize=8)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for item in range(start, start + 500):
+                q.put(item)
+
+        def consume():
+            for _ in range(500):
+                item = q.get()
+                with lock:
+                    results.append(item)
+
+        threads = [threading.Thread(target=produce, args=(n * 500,)) for n in range(3)]
+        threads += [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == list(range(1500))
+        assert q.is_empty() is True
+
+
+class BlockingStackTest(unittest.TestCase):
+
+    def test_put_and_get(self):
+        for stack_type in (BlockingStack, lambda: BlockingStack(stack_type=ArrayStack)):
+            s = stack_type()
+            s.put('A')
+            s.put('B')
+            s.put('C')
+            assert s.get() == 'C'
+            assert s.get() == 'B'
+            assert s.get() == 'A'
+            with self.assertRaises(Empty):
+                s.get_nowait()
+
+    def test_bounded(self):
+        s = BlockingStack(maxsize=1)
+        s.put('A')
+        with self.assertRaises(Full):
+            s.put('B', timeout=0.01)
+        assert s.get() == 'A'
+
+
+if __name__ == '__main__':
+    unittest.main()
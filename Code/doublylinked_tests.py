@@ -11,6 +11,10 @@ class NodeTest(unittest.TestCase):
         assert node.next is None
         assert node.prev is None
 
+    def test_slots(self):
+        node = Node("ABC")
+        assert not hasattr(node, "__dict__")
+
 
 class DoublyLinkedListTest(unittest.TestCase):
     def test_init(self):
@@ -214,5 +218,127 @@ class DoublyLinkedListTest(unittest.TestCase):
             assert data == test_list[-(index + 1)]
 
 
+    def test_index_from_both_ends(self):
+        items = list(range(101))
+        ll = DoublyLinkedList(items)
+        # Indexes past the middle are reached by walking back from the tail
+        for index in range(101):
+            assert ll.get_at_index(index) == index
+        ll.insert_at_index(99, "X")
+        items.insert(99, "X")
+        ll.insert_at_index(2, "Y")
+        items.insert(2, "Y")
+        assert ll.items() == items
+        assert list(ll.reversed()) == items[::-1]
+        assert ll.length() == 103
+
+    def test_append_and_prepend_return_nodes(self):
+        ll = DoublyLinkedList()
+        b = ll.append("B")
+        a = ll.prepend("A")
+        d = ll.insert_at_index(2, "D")
+        c = ll.insert_at_index(2, "C")
+        assert [a.data, b.data, c.data, d.data] == ["A", "B", "C", "D"]
+        assert ll.head is a
+        assert ll.tail is d
+        assert b.next is c
+        assert d.prev is c
+
+    def test_insert_after(self):
+        ll = DoublyLinkedList()
+        a = ll.append("A")
+        c = ll.insert_after(a, "C")
+        assert ll.tail is c
+        b = ll.insert_after(a, "B")
+        assert ll.items() == ["A", "B", "C"]
+        assert list(ll.reversed()) == ["C", "B", "A"]
+        assert b.prev is a and b.next is c
+        assert ll.size == 3
+
+    def test_remove_node(self):
+        ll = DoublyLinkedList()
+        a, b, c = ll.append("A"), ll.append("B"), ll.append("C")
+        assert ll.remove_node(b) == "B"
+        assert ll.items() == ["A", "C"]
+        assert list(ll.reversed()) == ["C", "A"]
+        assert b.prev is None and b.next is None
+        ll.remove_node(c)
+        assert ll.tail is a
+        ll.remove_node(a)
+        assert ll.head is None
+        assert ll.tail is None
+        assert ll.size == 0
+        assert ll.is_empty() is True
+
+    def test_move_to_front_and_back(self):
+        ll = DoublyLinkedList()
+        a, b, c = ll.append("A"), ll.append("B"), ll.append("C")
+        ll.move_to_front(c)
+        assert ll.items() == ["C", "A", "B"]
+        ll.move_to_front(c)
+        assert ll.items() == ["C", "A", "B"]
+        ll.move_to_back(c)
+        assert ll.items() == ["A", "B", "C"]
+        ll.move_to_back(a)
+        ll.move_to_back(a)
+        assert ll.items() == ["B", "C", "A"]
+        ll.move_to_front(c)
+        assert ll.items() == ["C", "B", "A"]
+        assert list(ll.reversed()) == ["A", "B", "C"]
+        assert ll.head is c and ll.tail is a
+        assert ll.size == 3
+
+    def test_extend(self):
+        ll = DoublyLinkedList(["A"])
+        ll.extend(["B", "C"])
+        assert ll.items() == ["A", "B", "C"]
+        assert ll.tail.data == "C"
+        assert ll.size == 3
+        assert list(ll.reversed()) == ["C", "B", "A"]
+        ll.extend([])
+        assert ll.size == 3
+        empty = DoublyLinkedList()
+        empty.extend(iter(["X"]))
+        assert empty.head.data == "X"
+        assert empty.tail.data == "X"
+
+    def test_splice(self):
+        ll = DoublyLinkedList(["A", "B"])
+        other = DoublyLinkedList(["C", "D"])
+        ll.splice(other)
+        assert ll.items() == ["A", "B", "C", "D"]
+        assert ll.tail.data == "D"
+        assert ll.size == 4
+        assert list(ll.reversed()) == ["D", "C", "B", "A"]
+        # The donor is left empty but still usable
+        assert other.head is None
+        assert other.tail is None
+        assert other.size == 0
+        other.append("E")
+        ll.concat(other)
+        assert ll.items() == ["A", "B", "C", "D", "E"]
+        empty = DoublyLinkedList()
+        empty.splice(ll)
+        assert empty.size == 5
+        assert ll.is_empty() is True
+        with self.assertRaises(ValueError):
+            empty.splice(empty)
+
+    def test_split_at(self):
+        ll = DoublyLinkedList(["A", "B", "C", "D"])
+        rest = ll.split_at(1)
+        assert ll.items() == ["A"]
+        assert ll.tail.data == "A"
+        assert ll.size == 1
+        assert rest.items() == ["B", "C", "D"]
+        assert rest.size == 3
+        assert list(rest.reversed()) == ["D", "C", "B"]
+        assert rest.split_at(3).is_empty() is True
+        everything = rest.split_at(0)
+        assert rest.is_empty() is True
+        assert everything.size == 3
+        with self.assertRaises(ValueError):
+            ll.split_at(2)
+
 if __name__ == "__main__":
     unittest.main()
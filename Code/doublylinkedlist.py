@@ -2,6 +2,9 @@
 
 
 class Node(object):
+    # Slots instead of a per-node __dict__ keep long lists compact
+    __slots__ = ("data", "prev", "next")
+
     def __init__(self, data):
         """Initialize this node with the given data."""
         self.data = data
@@ -21,8 +24,7 @@ class DoublyLinkedList(object):
         self.size = 0  # Number of nodes
         # Append the given items
         if iterable is not None:
-            for item in iterable:
-                self.append(item)
+            self.extend(iterable)
 
     def __str__(self):
         """Return a formatted string representation of this linked list."""
@@ -76,47 +78,52 @@ class DoublyLinkedList(object):
 
     def length(self):
         """
-            Return the length of this linked list by traversing its nodes.
-            Best and worst case running time: O(n) for worst and best case.
-            This is because you have to iterate the entire linked list of n items
-            until you've counted all of them.
+            Return the length of this linked list.
+            Best and worst case running time: O(1) - Every method that adds or
+            removes nodes keeps self.size up to date, so there's nothing to count.
         """
-        # Node counter initialized to zero
-        node_count = 0
-        # Start at the head node
-        node = self.head
-        # Loop until the node is None, which is one node too far past the tail
-        while node is not None:
-            # Count one for this node
-            node_count += 1
-            # Skip to the next node
-            node = node.next
-        # Now node_count contains the number of nodes
-        return node_count
+        return self.size
 
     def get_at_index(self, index):
         """
             Return the item at the given index in this linked list, or
             raise ValueError if the given index is out of range of the list size.
-            Best case running time: Omega(1) - Where we're getting the item at the first index.
-            Worst case running time: O(n) - Where we're getting the item at the nth index.
+            Best case running time: Omega(1) - Where we're getting the item at either end.
+            Worst case running time: O(n/2) - Where we're getting the item in the middle,
+            since we walk from whichever end is closer.
         """
         # Check if the given index is out of range and if so raise an error
         if not (0 <= index < self.size):
             raise ValueError("List index out of range: {}".format(index))
 
-        curr_node = self.head
-        for i in range(index):
-            curr_node = curr_node.next
+        return self._node_at(index).data
 
-        return curr_node.data
+    def _node_at(self, index):
+        """
+            Return the node at the given index, which must be in range, walking
+            from whichever end of the list is closer to it.
+            Best case running time: O(1) - Where the index is at either end.
+            Worst case running time: O(n/2) - Where the index is in the middle,
+            so no walk is ever more than half the list.
+        """
+        if index < self.size // 2:
+            curr_node = self.head
+            for _ in range(index):
+                curr_node = curr_node.next
+        else:
+            curr_node = self.tail
+            for _ in range(self.size - 1 - index):
+                curr_node = curr_node.prev
+        return curr_node
 
     def insert_at_index(self, index, item):
         """
-            Insert the given item at the given index in this linked list, or
-            raise ValueError if the given index is out of range of the list size.
+            Insert the given item at the given index in this linked list and return
+            its node, or raise ValueError if the given index is out of range of the
+            list size.
             Best case running time: Omega(1) - Where we're inserting at either the head or the tail.
-            Worst case running time: Theta(n) - Where we're inserting at the n-1 index.
+            Worst case running time: O(n/2) - Where we're inserting in the middle,
+            since we walk from whichever end is closer.
         """
         # Check if the given index is out of range and if so raise an error
         if not (0 <= index <= self.size):
@@ -124,39 +131,25 @@ class DoublyLinkedList(object):
 
         # Check if the linked list is empty
         if self.is_empty():
-            self.append(item)
-            return
+            return self.append(item)
 
         # Prepend if we're inserting at the head
         if index == 0:
-            self.prepend(item)
-            return
+            return self.prepend(item)
 
         # Append if we're inserting at the tail
         if index == self.size:
-            self.append(item)
-            return
-
-        curr_node = self.head
+            return self.append(item)
 
-        for _ in range(index - 1):
-            curr_node = curr_node.next
-
-        new_node = Node(item)
-        # Set the temp node to be the current ones next
-        temp_node = curr_node.next
-        # Set the temp nodes previous to be this new one
-        temp_node.prev = new_node
-
-        # Set this
-        curr_node.next = new_node
-        new_node.next = temp_node
-        new_node.prev = curr_node
-        self.size += 1
+        # Find the node that will come after the new one, from the closer end,
+        # and link the new node in after the one before it
+        return self.insert_after(self._node_at(index).prev, item)
 
     def append(self, item):
         """
-            Insert the given item at the tail of this linked list.
+            Insert the given item at the tail of this linked list and return its
+            node, which can be handed back to remove_node, move_to_front,
+            move_to_back and insert_after.
             Best and worst case running time: Omega(1) - Because for however large
             are linkedlist is we're always performing a constant amount of
             operations
@@ -175,10 +168,12 @@ class DoublyLinkedList(object):
         # Update tail to new node regardless
         self.tail = new_node
         self.size += 1
+        return new_node
 
     def prepend(self, item):
         """
-            Insert the given item at the head of this linked list.
+            Insert the given item at the head of this linked list and return its
+            node, like append.
             Best and worst case running time: O(1) - Constant amount of operations
             regardless of the size of the linked list
         """
@@ -195,6 +190,174 @@ class DoublyLinkedList(object):
         # Update head to new node regardless
         self.head = new_node
         self.size += 1
+        return new_node
+
+    def insert_after(self, node, item):
+        """
+            Insert the given item right after the given node of this linked list
+            and return the new item's node.
+            Best and worst case running time: O(1) - Only the neighbours of the
+            given node are relinked.
+        """
+        new_node = Node(item)
+        next_node = node.next
+        new_node.prev = node
+        new_node.next = next_node
+        node.next = new_node
+        # Inserting after the tail makes the new node the tail
+        if next_node is None:
+            self.tail = new_node
+        else:
+            next_node.prev = new_node
+        self.size += 1
+        return new_node
+
+    def _unlink(self, node):
+        """
+            Detach the given node from its neighbours and the ends of this list,
+            without changing the size.
+        """
+        prev_node = node.prev
+        next_node = node.next
+        if prev_node is None:
+            self.head = next_node
+        else:
+            prev_node.next = next_node
+        if next_node is None:
+            self.tail = prev_node
+        else:
+            next_node.prev = prev_node
+        node.prev = None
+        node.next = None
+
+    def remove_node(self, node):
+        """
+            Remove the given node, as returned by append, prepend, insert_at_index
+            or insert_after, from this linked list and return its item.
+            The node must belong to this list; that isn't checked, as doing so
+            would mean a scan.
+            Best and worst case running time: O(1) - No searching is needed since
+            the node knows both of its neighbours.
+        """
+        self._unlink(node)
+        self.size -= 1
+        return node.data
+
+    def move_to_front(self, node):
+        """
+            Move the given node of this linked list to the head.
+            Best and worst case running time: O(1) - Unlink it and relink it
+            before the head.
+        """
+        if node is self.head:
+            return
+        self._unlink(node)
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+    def move_to_back(self, node):
+        """
+            Move the given node of this linked list to the tail.
+            Best and worst case running time: O(1) - Unlink it and relink it
+            after the tail.
+        """
+        if node is self.tail:
+            return
+        self._unlink(node)
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+
+    def extend(self, iterable):
+        """
+            Append every item from the given iterable to the tail of this linked list.
+            The new nodes are chained together first and then linked on in one go,
+            so the size is only updated once.
+            Best and worst case running time: O(k) - Where k is the number of items
+            in the iterable.
+        """
+        head = None
+        tail = None
+        count = 0
+        for item in iterable:
+            node = Node(item)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+                node.prev = tail
+            tail = node
+            count += 1
+        # Nothing to link if the iterable was empty
+        if tail is None:
+            return
+        if self.tail is None:
+            self.head = head
+        else:
+            self.tail.next = head
+            head.prev = self.tail
+        self.tail = tail
+        self.size += count
+
+    def splice(self, other):
+        """
+            Move every node of the given linked list onto the tail of this one,
+            leaving the other list empty. Nodes are relinked, not copied.
+            Best and worst case running time: O(1) - Only the tail of this list and
+            the head of the other are relinked, however long they are.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a linked list onto itself.")
+        if other.head is None:
+            return
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.size += other.size
+        # The donor no longer owns any nodes
+        other.head = None
+        other.tail = None
+        other.size = 0
+
+    # Joining two lists end to end is the same operation under another name
+    concat = splice
+
+    def split_at(self, index):
+        """
+            Split this linked list in two at the given index, keeping the items
+            before it and returning a new linked list holding the rest, or raise
+            ValueError if the given index is out of range of the list size.
+            Nodes are moved to the new list, not copied.
+            Best case running time: Omega(1) - Where we split at either end.
+            Worst case running time: O(n/2) - Where the split is in the middle, since we walk
+            from whichever end is closer.
+        """
+        # Check if the given index is out of range and if so raise an error
+        if not (0 <= index <= self.size):
+            raise ValueError("List index out of range: {}".format(index))
+
+        rest = type(self)()
+        if index == self.size:
+            return rest
+        if index == 0:
+            # Everything moves over to the new list
+            rest.splice(self)
+            return rest
+
+        # Find the last node we keep, from whichever end is closer
+        last_node = self._node_at(index - 1)
+        rest.head = last_node.next
+        rest.head.prev = None
+        rest.tail = self.tail
+        rest.size = self.size - index
+        last_node.next = None
+        self.tail = last_node
+        self.size = index
+        return rest
 
     def find(self, quality):
         """
@@ -246,13 +409,10 @@ class DoublyLinkedList(object):
 
         # An optimization to handle if the item we're looking for is in
         # the tail and there are many nodes in between. We can just skip
-        # to the tail and handle that one directlyh
-        if self.size > 1:
-            if item == self.tail.data:
-                self.tail = self.tail.prev
-                self.tail.next = None
-                self.size -= 1
-                return
+        # to the tail and handle that one directly
+        if self.size > 1 and item == self.tail.data:
+            self.remove_node(self.tail)
+            return
 
         # Start at the head node
         node = self.head
@@ -269,25 +429,7 @@ class DoublyLinkedList(object):
                 node = node.next
 
         if found:
-            if node is not self.head and node is not self.tail:
-                next_node = node.next
-                prev_node = node.prev
-                prev_node.next = next_node
-                next_node.prev = prev_node
-            elif node is self.head and node is self.tail:
-                self.head = None
-                self.tail = None
-            elif node is self.head:
-                next_node = node.next
-                if next_node:
-                    next_node.prev = None
-                self.head = next_node
-            elif node is self.tail:
-                prev_node = node.prev
-                if prev_node:
-                    prev_node.next = None
-                self.tail = node.prev
-            self.size -= 1
+            self.remove_node(node)
         else:
             # Otherwise raise an error to tell the user that delete has failed
             raise ValueError("Item not found: {}".format(item))
@@ -1,13 +1,130 @@
 #!python
 
+from array import array
+
 from linkedlist import LinkedList
 
+# Markers for slots in open addressing tables that have never held an entry
+# and slots whose entry has been deleted.
+_EMPTY = object()
+_DELETED = object()
+
+# Default for get()'s default argument, meaning raise KeyError on a miss
+_RAISE = object()
+
+
+class TableView(object):
+    """
+        Live view over the entries of a hash table or binarytree.TreeMap,
+        like the views returned by dict.keys(). Views read straight from the
+        table instead of copying it, and iterating one raises RuntimeError if
+        the table changes underneath it. Tables provide _entries(), which
+        yields tuples that start with (key, value), bump _version whenever
+        entries move, and count the views being iterated in _iterators so
+        lookups know when it's safe to move entries.
+    """
+
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        """Return the number of entries in the table."""
+        return self._table.size
+
+    def __iter__(self):
+        """Yield each entry's part of interest, checking for changes as we go."""
+        table = self._table
+        version = table._version
+        table._iterators += 1
+        try:
+            for entry in table._entries():
+                if table._version != version:
+                    break
+                yield self._pick(entry)
+        finally:
+            table._iterators -= 1
+        if table._version != version:
+            raise RuntimeError("{} changed during iteration".format(type(table).__name__))
+
+    def __repr__(self):
+        """Return a string representation of this view."""
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+
+class KeysView(TableView):
+    """Live view over a hash table's keys."""
+
+    def __contains__(self, key):
+        return self._table.contains(key)
+
+    def _pick(self, entry):
+        return entry[0]
+
+
+class ValuesView(TableView):
+    """Live view over a hash table's values."""
+
+    def __contains__(self, value):
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def _pick(self, entry):
+        return entry[1]
+
+
+class ItemsView(TableView):
+    """Live view over a hash table's (key, value) entries."""
+
+    def __contains__(self, item):
+        key, value = item
+        try:
+            return self._table.get(key) == value
+        except KeyError:
+            return False
+
+    def _pick(self, entry):
+        return (entry[0], entry[1])
+
 
 class HashTable(object):
-    def __init__(self, init_size=8):
-        """Initialize this hash table with the given initial size."""
-        self.buckets = [LinkedList() for i in range(init_size)]
+    def __new__(cls, *args, engine="chained", incremental=False, **kwargs):
+        """
+            Pick the storage engine for this hash table.
+            "chained" stores each bucket as a linked list of entries and
+            "open" stores entries in flat arrays with open addressing.
+            Only the chained engine supports incremental resizing.
+        """
+        if engine not in ("chained", "open"):
+            raise ValueError("Unknown hash table engine: {}".format(engine))
+        if engine == "open" and incremental:
+            raise ValueError("The open engine doesn't support incremental resizing")
+        if cls is HashTable and engine == "open":
+            cls = OpenHashTable
+        return super().__new__(cls)
+
+    # Number of old buckets moved into the new bucket array by each operation
+    # while an incremental resize is in progress.
+    migrate_step = 4
+
+    def __init__(self, init_size=8, *, engine="chained", incremental=False):
+        """
+            Initialize this hash table with the given initial size.
+            With incremental=True a resize only allocates the new bucket array,
+            and every following operation migrates a few of the old buckets
+            into it, so no single set() pays for rehashing the whole table.
+            Lookups and updates skip migrating while a view is being iterated,
+            so they never disturb it.
+        """
+        # Linked list buckets are created the first time an entry lands in them
+        self.buckets = [None] * init_size
         self.size = 0  # Number of key-value entries
+        self.incremental = incremental
+        self._old_buckets = None  # Buckets awaiting migration during a resize
+        self._migrate_index = 0  # Index of the next old bucket to migrate
+        self._version = 0  # Bumped whenever entries move, to guard iterating views
+        self._iterators = 0  # Views being iterated, which lookups mustn't disturb
 
     def __str__(self):
         """Return a formatted string representation of this hash table."""
@@ -16,12 +133,25 @@ class HashTable(object):
 
     def __repr__(self):
         """Return a string representation of this hash table."""
-        return "HashTable({!r})".format(self.items())
+        return "HashTable({!r})".format(list(self.items()))
 
     def _bucket_index(self, key):
         """Return the bucket index where the given key would be stored."""
         return hash(key) % len(self.buckets)
 
+    def _buckets_in_use(self):
+        """
+            Yield every bucket that has been created, including old buckets
+            still awaiting migration.
+        """
+        for bucket in self.buckets:
+            if bucket is not None:
+                yield bucket
+        if self._old_buckets is not None:
+            for bucket in self._old_buckets:
+                if bucket is not None:
+                    yield bucket
+
     def load_factor(self):
         """
             Return the load factor, the ratio of number of entries to buckets.
@@ -30,43 +160,41 @@ class HashTable(object):
         """
         return self.size / len(self.buckets)
 
+    def _entries(self):
+        """
+            Yield every (key, value, hash) entry straight from the buckets.
+            Best and worst case running time: O(b + n) - Where b is the number of
+            buckets and n the number of entries.
+        """
+        for bucket in self._buckets_in_use():
+            node = bucket.head
+            while node is not None:
+                yield node.data
+                node = node.next
+
     def keys(self):
         """
-            Return a list of all keys in this hash table.
-            Best and worst case running time: O(n) - Where n is the number
-            of keys we have within our hashtable
+            Return a live view of all keys in this hash table.
+            Best and worst case running time: O(1) - Iterating the view is O(n)
+            but nothing is copied up front.
         """
-        # Collect all keys in each of the buckets
-        all_keys = []
-        for bucket in self.buckets:
-            for key, value in bucket.items():
-                all_keys.append(key)
-        return all_keys
+        return KeysView(self)
 
     def values(self):
         """
-            Return a list of all values in this hash table.
-            Best and worst case running time: O(n) - Where n is the number of values 
-            within our hashtable
+            Return a live view of all values in this hash table.
+            Best and worst case running time: O(1) - Iterating the view is O(n)
+            but nothing is copied up front.
         """
-        # Collect all values in each of the buckets
-        all_values = []
-        for bucket in self.buckets:
-            for key, value in bucket.items():
-                all_values.append(value)
-        return all_values
+        return ValuesView(self)
 
     def items(self):
         """
-            Return a list of all entries (key-value pairs) in this hash table.
-            Best and worst case running time: O(n) - Where n is the number of items
-            within our hashtable
+            Return a live view of all entries (key-value pairs) in this hash table.
+            Best and worst case running time: O(1) - Iterating the view is O(n)
+            but nothing is copied up front.
         """
-        # Collect all pairs of key-value entries in each of the buckets
-        all_items = []
-        for bucket in self.buckets:
-            all_items.extend(bucket.items())
-        return all_items
+        return ItemsView(self)
 
     def length(self):
         """
@@ -76,11 +204,120 @@ class HashTable(object):
         """
         # Count number of key-value entries in each of the buckets
         item_count = 0
-        for bucket in self.buckets:
+        for bucket in self._buckets_in_use():
             item_count += bucket.length()
         return item_count
-        # Equivalent to this list comprehension:
-        return sum(bucket.length() for bucket in self.buckets)
+
+    def _find_node(self, key, key_hash, bucket):
+        """
+            Return the linked list node holding the (key, value, hash) entry
+            for the given key in the given bucket, or None. Cached hashes are
+            compared first so most mismatches skip __eq__.
+            Best case running time: O(1) - Where the key is first in its bucket.
+            Worst case running time: O(l) - Where there are l entries in the bucket.
+        """
+        if bucket is None:
+            return None
+        node = bucket.head
+        while node is not None:
+            entry = node.data
+            if entry[2] == key_hash and (entry[0] is key or entry[0] == key):
+                return node
+            node = node.next
+        return None
+
+    def _locate(self, key, key_hash):
+        """
+            Return the bucket holding the given key and the node holding the
+            key's entry, or (None, None) if it isn't stored. During an incremental resize the
+            key may still be in an old bucket, so that is checked second.
+            Best case running time: O(1) - Where the key is first in its bucket.
+            Worst case running time: O(l) - Where there are l entries in the buckets.
+        """
+        bucket = self.buckets[key_hash % len(self.buckets)]
+        node = self._find_node(key, key_hash, bucket)
+        if node is None and self._old_buckets is not None:
+            bucket = self._old_buckets[key_hash % len(self._old_buckets)]
+            node = self._find_node(key, key_hash, bucket)
+        if node is None:
+            return None, None
+        return bucket, node
+
+    @classmethod
+    def from_pairs(cls, pairs, **kwargs):
+        """
+            Build a hash table from an iterable of (key, value) pairs. The
+            buckets are sized for every pair up front, so loading them
+            allocates the bucket array once and never resizes.
+            Best and worst case running time: O(n) - Where n is the number of pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        table = cls(max(8, int(len(pairs) / 0.75) + 1), **kwargs)
+        table.set_many(pairs)
+        return table
+
+    def _reserve(self, count):
+        """
+            Grow the buckets once so count more entries fit under the 0.75
+            load factor, finishing any incremental migration on the way.
+            Best and worst case running time: O(b + n) - Where b is the number of
+            buckets and n the number of entries if a resize is needed, else O(1).
+        """
+        needed = int((self.size + count) / 0.75) + 1
+        if needed > len(self.buckets):
+            self._resize(needed)
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+    def set_many(self, pairs):
+        """
+            Insert or update every (key, value) pair from the given iterable.
+            The buckets are grown at most once before loading, and the per-set
+            load factor checks are skipped.
+            Best and worst case running time: O(n) - Where n is the number of pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        self._reserve(len(pairs))
+
+        buckets = self.buckets
+        bucket_count = len(buckets)
+        for key, value in pairs:
+            key_hash = hash(key)
+            index = key_hash % bucket_count
+            bucket = buckets[index]
+            if bucket is None:
+                bucket = buckets[index] = LinkedList()
+            else:
+                # Update the existing entry for this key in place, if there is one
+                node = self._find_node(key, key_hash, bucket)
+                if node is not None:
+                    node.data = (key, value, key_hash)
+                    continue
+            bucket.append((key, value, key_hash))
+            self.size += 1
+        self._version += 1
+
+    def update(self, other):
+        """
+            Insert or update every entry from a mapping with an items() method
+            (a dict or another hash table) or an iterable of (key, value) pairs.
+            Best and worst case running time: O(n) - Where n is the number of entries.
+        """
+        if hasattr(other, "items"):
+            other = other.items()
+        self.set_many(other)
+
+    def get_many(self, keys):
+        """
+            Return a list of the values associated with the given keys, or
+            raise KeyError if any of them isn't stored.
+            Best and worst case running time: O(k) - Where k is the number of keys,
+            assuming short buckets.
+        """
+        get = self.get
+        return [get(key) for key in keys]
 
     def contains(self, key):
         """
@@ -89,54 +326,90 @@ class HashTable(object):
             Worst case running time: O(l) - Where there is l items within our bucket that have to b
             be checked 
         """
-        # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
-        # Check if an entry with the given key exists in that bucket
-        entry = bucket.find(lambda key_value: key_value[0] == key)
-        return entry is not None  # True or False
-
-    def get(self, key):
+        # Migrating moves entries, so leave it to set() while views are iterating
+        if self._old_buckets is not None and not self._iterators:
+            self._migrate(self.migrate_step)
+        # Find the entry with the given key, if one exists
+        bucket, node = self._locate(key, hash(key))
+        return node is not None  # True or False
+
+    def get(self, key, default=_RAISE):
         """
-            Return the value associated with the given key, or raise KeyError.
+            Return the value associated with the given key. If it isn't
+            stored return default, or raise KeyError if no default was given.
             Best case running time: O(1) - Where there is only one or no items within our bucket.
             Worst case running time: O(l) - Where there are l items within our bucket that have to be checked.
         """
-        # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
-        # Find the entry with the given key in that bucket, if one exists
-        entry = bucket.find(lambda key_value: key_value[0] == key)
-        if entry is not None:  # Found
+        if self._old_buckets is not None and not self._iterators:
+            self._migrate(self.migrate_step)
+        # Find the entry with the given key, if one exists
+        bucket, node = self._locate(key, hash(key))
+        if node is not None:  # Found
             # Return the given key's associated value
+            entry = node.data
             assert isinstance(entry, tuple)
-            assert len(entry) == 2
+            assert len(entry) == 3
             return entry[1]
+        elif default is not _RAISE:  # Not found, but the caller expected that
+            return default
         else:  # Not found
             raise KeyError("Key not found: {}".format(key))
 
+    def setdefault(self, key, default=None):
+        """
+            Return the value associated with the given key, first inserting
+            it with the given default value if it isn't stored yet. Only one
+            lookup is done either way.
+            Best case running time: O(1) - Where there is only one or no items within our bucket.
+            Worst case running time: O(l) - Where there are l items within our bucket that have to be checked.
+        """
+        key_hash = hash(key)
+        bucket, node = self._locate(key, key_hash)
+        if node is not None:  # Found
+            if self._old_buckets is not None and not self._iterators:
+                self._migrate(self.migrate_step)
+            return node.data[1]
+        self._insert_new(key, default, key_hash)
+        return default
+
     def set(self, key, value):
         """
-            Insert or update the given key with its associated value.
+            Insert or update the given key with its associated value. Updates
+            replace the entry in place, so they don't disturb views being
+            iterated.
             Best case running time: O(1) - Where there are no other items in the current
             bucket we're indexing into
             Worst case running time: O(l) - Where there are other items in the bucket that we're
             indexing into and l is the load factor of our hash table
         """
-        # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
+        # Hash the key once and keep the hash with the entry
+        key_hash = hash(key)
+        # Find the entry with the given key, if one exists
+        bucket, node = self._locate(key, key_hash)
+        if node is not None:  # Found
+            # In this case, the given key's value is being updated in place
+            node.data = (key, value, key_hash)
+            if self._old_buckets is not None and not self._iterators:
+                self._migrate(self.migrate_step)
+            return
+        self._insert_new(key, value, key_hash)
+
+    def _insert_new(self, key, value, key_hash):
+        """
+            Insert an entry for a key already known not to be stored, with
+            the key's hash, skipping the lookup set() would do.
+            Best and worst case running time: O(1) - Amortized over resizes.
+        """
+        if self._old_buckets is not None:
+            self._migrate(self.migrate_step)
+        # Insert the new key-value entry into its bucket
+        index = key_hash % len(self.buckets)
         bucket = self.buckets[index]
-        # Find the entry with the given key in that bucket, if one exists
-        # Check if an entry with the given key exists in that bucket
-        entry = bucket.find(lambda key_value: key_value[0] == key)
-        if entry is not None:  # Found
-            # In this case, the given key's value is being updated
-            # Remove the old key-value entry from the bucket first
-            bucket.delete(entry)
-            self.size -= 1
-        # Insert the new key-value entry into the bucket in either case
-        bucket.append((key, value))
+        if bucket is None:
+            bucket = self.buckets[index] = LinkedList()
+        bucket.append((key, value, key_hash))
         self.size += 1
+        self._version += 1
 
         # Check if the load factor exceeds .75, if so resize our hashtable.
         if self.load_factor() > 0.75:
@@ -151,15 +424,15 @@ class HashTable(object):
             Worst case running time: O(l) where l is the load factor of our hash table and
             there are multiple items in the bucket we're trying to insert into
         """
-        # Find the bucket the given key belongs in
-        index = self._bucket_index(key)
-        bucket = self.buckets[index]
-        # Find the entry with the given key in that bucket, if one exists
-        entry = bucket.find(lambda key_value: key_value[0] == key)
-        if entry is not None:  # Found
+        if self._old_buckets is not None:
+            self._migrate(self.migrate_step)
+        # Find the entry with the given key, if one exists
+        bucket, node = self._locate(key, hash(key))
+        if node is not None:  # Found
             # Remove the key-value entry from the bucket
-            bucket.delete(entry)
+            bucket.delete(node.data)
             self.size -= 1
+            self._version += 1
         else:  # Not found
             raise KeyError("Key not found: {}".format(key))
 
@@ -168,37 +441,347 @@ class HashTable(object):
             Resize this hash table's buckets and rehash all key-value entries.
             Should be called automatically when load factor exceeds a threshold
             such as 0.75 after an insertion (when set is called with a new key).
-            Best and worst case running time: O(b) - Where b is the total number of buckets we have
-            to create.
-            Best and worst case space usage: O(n) - Where n is the total number of entries we have to
-            store for when we create new buckets.
+            Entries carry their cached hash, so they're moved straight into
+            their new bucket without hashing keys, checking for duplicates or
+            triggering nested resizes. Incremental tables only swap in the new
+            bucket array here and leave the moving to later operations.
+            Best and worst case running time: O(b + n) - Where b is the total number
+            of buckets we have to create and n is the number of entries we move.
+            O(b) for incremental tables.
+            Best and worst case space usage: O(b) - Where b is the total number of
+            new buckets we have to create.
         """
         # If unspecified, choose new size dynamically based on current size
         if new_size is None:
             new_size = len(self.buckets) * 2  # Double size
         # Option to reduce size if buckets are sparsely filled (low load factor)
-        elif new_size is 0:
-            new_size = len(self.buckets) / 2  # Half size
+        elif new_size == 0:
+            new_size = len(self.buckets) // 2  # Half size
+
+        # Finish any migration in progress so there are never three arrays
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+        old_buckets = self.buckets
+        self.buckets = [None] * new_size
+        self._version += 1
+        if self.incremental:
+            self._old_buckets = old_buckets
+            self._migrate_index = 0
+        else:
+            self._rehash_into(old_buckets)
+
+    def _rehash_into(self, old_buckets):
+        """
+            Move every entry from the given buckets into this table's buckets
+            using each entry's cached hash.
+            Best and worst case running time: O(n) - Where n is the number of entries.
+        """
+        buckets = self.buckets
+        bucket_count = len(buckets)
+        for bucket in old_buckets:
+            if bucket is None:
+                continue
+            node = bucket.head
+            while node is not None:
+                entry = node.data
+                index = entry[2] % bucket_count
+                if buckets[index] is None:
+                    buckets[index] = LinkedList()
+                buckets[index].append(entry)
+                node = node.next
+
+    def _migrate(self, bucket_count):
+        """
+            Move up to bucket_count old buckets into the new bucket array,
+            ending the incremental resize once every old bucket has moved.
+            Best and worst case running time: O(k) - Where k is the number of
+            entries in the migrated buckets.
+        """
+        old_buckets = self._old_buckets
+        start = self._migrate_index
+        stop = min(start + bucket_count, len(old_buckets))
+        self._rehash_into(old_buckets[start:stop])
+        for index in range(start, stop):
+            old_buckets[index] = None
+        self._version += 1
+        if stop == len(old_buckets):
+            self._old_buckets = None
+            self._migrate_index = 0
+        else:
+            self._migrate_index = stop
 
-        # grab all items from the current hashtable
-        all_items = self.items()
 
-        # Reinitialize hashtable
-        self.__init__(new_size)
+class OpenHashTable(HashTable):
+    """
+        Hashtable implemented with open addressing over flat parallel arrays
+        of keys, values and cached key hashes. Create one with
+        HashTable(engine="open").
+    """
 
-        # insert all items into the new bucket
-        for key, value in all_items:
-            self.set(key, value)
+    def __init__(self, init_size=8, *, engine="open", incremental=False):
+        # HashTable.__new__ rejects incremental=True for this engine
+        self.incremental = False
+        self._keys = [_EMPTY] * init_size
+        self._values = [None] * init_size
+        self._hashes = [0] * init_size
+        self.size = 0  # Number of key-value entries
+        self._filled = 0  # Number of slots holding an entry or a tombstone
+        self._version = 0  # Bumped whenever entries move, to guard iterating views
+        self._iterators = 0  # Views being iterated, which lookups mustn't disturb
+
+    @property
+    def buckets(self):
+        """The slots of this hash table."""
+        return self._keys
+
+    def _bucket_index(self, key):
+        """Return the slot index where the given key would start probing."""
+        return hash(key) % len(self._keys)
+
+    def _probe(self, key, key_hash):
+        """
+            Return the slot index holding the given key, or -1 if it isn't
+            stored. Probing stops at the first never-used slot.
+            Best case running time: O(1) - The key sits in its home slot.
+            Worst case running time: O(n) - The key sits at the end of a
+            cluster that spans the table.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        capacity = len(keys)
+        index = key_hash % capacity
+        for _ in range(capacity):
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                return -1
+            if hashes[index] == key_hash and slot_key is not _DELETED:
+                if slot_key is key or slot_key == key:
+                    return index
+            index += 1
+            if index == capacity:
+                index = 0
+        return -1
+
+    def _entries(self):
+        """
+            Yield every live (key, value) entry.
+            Best and worst case running time: O(b) - Where b is the number of slots.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _EMPTY and key is not _DELETED:
+                yield key, value
+
+    def length(self):
+        """
+            Return the number of key-value entries.
+            Best and worst case running time: O(1) - We track the entry count.
+        """
+        return self.size
+
+    def _reserve(self, count):
+        """
+            Grow the slots once so count more entries fit under the 0.75 fill
+            ratio, tombstones included.
+            Best and worst case running time: O(b) if a resize is needed, else O(1).
+        """
+        needed = int((self._filled + count) / 0.75) + 1
+        if needed > len(self._keys):
+            self._resize(needed)
+
+    def set_many(self, pairs):
+        """
+            Insert or update every (key, value) pair from the given iterable,
+            growing the slots at most once before loading.
+            Best and worst case running time: O(n) - Where n is the number of pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        self._reserve(len(pairs))
+        set_item = self.set
+        for key, value in pairs:
+            set_item(key, value)
+
+    def contains(self, key):
+        """
+            Return True if this hash table contains the given key, or False.
+            Best case running time: O(1) - The key is in its home slot.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        return self._probe(key, hash(key)) != -1
+
+    def get(self, key, default=_RAISE):
+        """
+            Return the value associated with the given key. If it isn't
+            stored return default, or raise KeyError if no default was given.
+            Best case running time: O(1) - The key is in its home slot.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        index = self._probe(key, hash(key))
+        if index != -1:
+            return self._values[index]
+        if default is not _RAISE:
+            return default
+        raise KeyError("Key not found: {}".format(key))
+
+    def _find_slot(self, key, key_hash):
+        """
+            Return the slot index holding the given key and True, or the
+            slot a new entry for it should take and False. New entries reuse
+            the first tombstone seen while probing, or else the never-used
+            slot that ended the probe.
+            Best case running time: O(1) - The home slot is free.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        keys = self._keys
+        capacity = len(keys)
+        index = key_hash % capacity
+        free_index = -1
+        for _ in range(capacity):
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                break
+            if slot_key is _DELETED:
+                if free_index == -1:
+                    free_index = index
+            elif self._hashes[index] == key_hash and (
+                slot_key is key or slot_key == key
+            ):
+                return index, True
+            index += 1
+            if index == capacity:
+                index = 0
+        return (index if free_index == -1 else free_index), False
+
+    def _insert_at(self, index, key, value, key_hash):
+        """Store a new entry in the free slot _find_slot picked for it."""
+        keys = self._keys
+        capacity = len(keys)
+        if keys[index] is _EMPTY:
+            self._filled += 1
+        keys[index] = key
+        self._values[index] = value
+        self._hashes[index] = key_hash
+        self.size += 1
+        self._version += 1
+
+        # Tombstones lengthen probes too, so they count towards resizing.
+        # Only grow when live entries fill more than half the slots, else
+        # the fill is mostly tombstones and rehashing in place clears them.
+        if self._filled / capacity > 0.75:
+            self._resize(capacity * 2 if self.size > capacity // 2 else capacity)
+
+    def set(self, key, value):
+        """
+            Insert or update the given key with its associated value.
+            The first tombstone seen while probing is reused for new keys.
+            Best case running time: O(1) - The home slot is free.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        key_hash = hash(key)
+        index, found = self._find_slot(key, key_hash)
+        if found:
+            # Update the existing entry in place
+            self._values[index] = value
+        else:
+            self._insert_at(index, key, value, key_hash)
+
+    def setdefault(self, key, default=None):
+        """
+            Return the value associated with the given key, first inserting
+            it with the given default value if it isn't stored yet. Only one
+            probe is done either way.
+            Best case running time: O(1) - The key or a free slot is at home.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        key_hash = hash(key)
+        index, found = self._find_slot(key, key_hash)
+        if found:
+            return self._values[index]
+        self._insert_at(index, key, default, key_hash)
+        return default
+
+    def delete(self, key):
+        """
+            Delete the given key and its associated value, or raise KeyError.
+            The slot becomes a tombstone so later probes keep walking past it.
+            Best case running time: O(1) - The key is in its home slot.
+            Worst case running time: O(n) - Probing walks a long cluster.
+        """
+        index = self._probe(key, hash(key))
+        if index == -1:
+            raise KeyError("Key not found: {}".format(key))
+        self._keys[index] = _DELETED
+        self._values[index] = None
+        self.size -= 1
+        self._version += 1
+
+    def _resize(self, new_size=None):
+        """
+            Resize this hash table's slots and reinsert every live entry
+            using its cached hash, dropping tombstones along the way.
+            Best and worst case running time: O(b) - Where b is the number of slots.
+        """
+        if new_size is None:
+            new_size = len(self._keys) * 2
+        elif new_size == 0:
+            new_size = len(self._keys) // 2
+
+        old_keys, old_values, old_hashes = self._keys, self._values, self._hashes
+        keys = [_EMPTY] * new_size
+        values = [None] * new_size
+        hashes = [0] * new_size
+        for key, value, key_hash in zip(old_keys, old_values, old_hashes):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            # Every key is unique, so take the first never-used slot.
+            index = key_hash % new_size
+            while keys[index] is not _EMPTY:
+                index += 1
+                if index == new_size:
+                    index = 0
+            keys[index] = key
+            values[index] = value
+            hashes[index] = key_hash
+
+        self._keys, self._values, self._hashes = keys, values, hashes
+        self._filled = self.size
+        self._version += 1
 
 
 class LinearHashTable(object):
     """
-        Hashtable implemented with linear probing.
+        Hashtable implemented with linear probing. Deleted entries become
+        tombstones and lookups never walk further than the longest probe
+        any entry needed.
     """
 
-    def __init__(self, init_size=8):
+    # Number of old slots moved into the new bucket array by each operation
+    # while an incremental resize is in progress.
+    migrate_step = 8
+
+    # Deleted entries leave a tombstone behind so probe chains stay intact.
+    # Once tombstones fill this fraction of the buckets the table is compacted.
+    tombstone_limit = 0.2
+
+    def __init__(self, init_size=8, incremental=False):
+        """
+            Initialize this hash table with the given initial size.
+            With incremental=True a resize only allocates the new bucket array,
+            and every following operation migrates a few of the old slots into
+            it. Lookups and updates skip migrating while a view is being iterated.
+        """
         self.buckets = [(None, None) for _ in range(init_size)]
         self.size = 0
+        self.incremental = incremental
+        self._old_buckets = None  # Slots awaiting migration during a resize
+        self._migrate_index = 0  # Index of the next old slot to migrate
+        self._tombstones = 0  # Buckets holding a deleted marker
+        self._max_probe = 0  # Longest distance of any entry from its home bucket
+        self._old_max_probe = 0  # The same for the old buckets while migrating
+        self._probe_total = 0  # Sum of every entry's distance from its home bucket
+        self._version = 0  # Bumped whenever entries move, to guard iterating views
+        self._iterators = 0  # Views being iterated, which lookups mustn't disturb
 
     def __str__(self):
         """Return a formatted string representation of this hash table."""
@@ -207,68 +790,74 @@ class LinearHashTable(object):
 
     def __repr__(self):
         """Return a string representation of this hash table."""
-        return "HashTable({!r})".format(self.items())
+        return "HashTable({!r})".format(list(self.items()))
 
     def _bucket_index(self, key):
         """Return the bucket index where the given key would be stored."""
         return hash(key) % len(self.buckets)
 
-    def keys(self):
+    def _entries(self):
         """
-            Iterate through all of the keys.
+            Iterate through every occupied slot, including old slots still
+            awaiting migration.
 
             Returns:
-                A list of the keys within the hashtable
+                A generator of (key, value) tuples
         """
-        all_keys = []
-        for key, _ in self.buckets:
-            if key is not None:
-                all_keys.append(key)
+        for key, value in self.buckets:
+            if key is not None and key is not _DELETED:
+                yield key, value
+        if self._old_buckets is not None:
+            for key, value in self._old_buckets:
+                if key is not None and key is not _DELETED:
+                    yield key, value
 
-        return all_keys
+    def keys(self):
+        """
+            Get a live view of all of the keys.
+
+            Returns:
+                A KeysView that iterates the buckets without copying them
+        """
+        return KeysView(self)
 
     def values(self):
         """
-            Iterate through all of the values within the hashtable.
+            Get a live view of all of the values within the hashtable.
 
             Returns:
-                A list of all values within the hashtable.
+                A ValuesView that iterates the buckets without copying them
         """
-        all_values = []
-        for key, value in self.buckets:
-            if key is not None:
-                all_values.append(value)
-
-        return all_values
+        return ValuesView(self)
 
     def items(self):
         """
-            Iterate through all of our items within the hashtable.
+            Get a live view of all of our items within the hashtable.
 
             Returns:
-                A list of all items within the hashtable
+                An ItemsView that iterates the buckets without copying them
         """
-        all_items = []
-        for key, value in self.buckets:
-            if key is not None:
-                all_items.append((key, value))
-
-        return all_items
+        return ItemsView(self)
 
     def length(self):
         """
-            Obtain the length or amount of items within the hashtable
-            by iterating through it.
+            Obtain the length or amount of items within the hashtable.
+            Runtime: O(1) - set, delete and resizing keep self.size up to date.
 
             Returns:
                 The amount of items within the hashtable
         """
-        count = 0
-        for key, _ in self.buckets:
-            if key is not None:
-                count += 1
+        return self.size
+
+    def is_empty(self):
+        """
+            Check if the hashtable holds no items.
+            Runtime: O(1) - Checks the tracked size.
 
-        return count
+            Returns:
+                True if there are no items, False if there are.
+        """
+        return self.size == 0
 
     def contains(self, key: object):
         """
@@ -277,33 +866,12 @@ class LinearHashTable(object):
             Returns:
                 True if the key is found, False if not.
         """
-        index = self._bucket_index(key)
-
-        desired_key, _ = self.buckets[index]
-
-        if desired_key is None:
-            return False
-
-        if desired_key == key:
+        if self._old_buckets is not None and not self._iterators:
+            self._migrate(self.migrate_step)
+        if self._find_old(key) != -1:
             return True
-        else:
-            search_index = index + 1
-
-            while search_index != index:
-                if search_index > len(self.buckets) - 1:
-                    search_index = 0
-
-                key_at_index, _ = self.buckets[search_index]
 
-                if key_at_index is None:
-                    return False
-
-                if key_at_index == key:
-                    return True
-
-                search_index += 1
-
-            return False
+        return self._find_in(self.buckets, key, hash(key), self._max_probe) != -1
 
     def get(self, key: object) -> object:
         """
@@ -317,84 +885,84 @@ class LinearHashTable(object):
                 A value if the key is within our hashtable.
                 A KeyError if the key cannot be found.
         """
-        index = self._bucket_index(key)
-
-        key_at_index, value_at_index = self.buckets[index]
-
-        if key_at_index == key:
-            return value_at_index
-        else:
-            search_index = index + 1
-
-            # While the search hasn't fully looped around the hashtable...
-            while search_index != index:
-                # If we've made it to the end of the hashtable, loop back to the beginning.
-                if search_index > len(self.buckets) - 1:
-                    search_index = 0
-
-                # Grab the key and value at the current index
-                key_at_index, value_at_index = self.buckets[search_index]
-
-                # Check if the key is equal to the current key
-                if key == key_at_index:
-                    return value_at_index
-
-                # Continue searching
-                search_index += 1
-                # If we've made it to the end of the hashtable, loop back to the beginning.
-                if search_index > len(self.buckets) - 1:
-                    search_index = 0
-
-            # Key wasn't found after fully looping around
+        if self._old_buckets is not None and not self._iterators:
+            self._migrate(self.migrate_step)
+        old_index = self._find_old(key)
+        if old_index != -1:
+            return self._old_buckets[old_index][1]
+
+        index = self._find_in(self.buckets, key, hash(key), self._max_probe)
+        if index == -1:
+            # Key wasn't found within the longest probe distance
             raise KeyError(f"Key not within hashtable: {key}")
 
+        return self.buckets[index][1]
+
     def set(self, key: object, value: object) -> None:
         """
-            Set an item inside of the hashtable
+            Set an item inside of the hashtable. New keys take the first
+            tombstone or empty bucket along their probe, and existing keys
+            are updated in place.
 
             Params:
                 key - A hashable object to be used for indexing
                 value - an object to be stored within our bucket (mapped to key)
         """
-        index = self._bucket_index(key)
-
-        key_at_index, _ = self.buckets[index]
-
-        # Found an empty bucket, yay!
-        if key_at_index is None:
-            self.buckets[index] = (key, value)
-            self.size += 1
-        elif key_at_index == key:
-            # If we found the key at the initial hash index,
-            # update it!
-            self.buckets[index] = (key, value)
-        else:
-
-            search_index = index + 1 if index < len(self.buckets) - 1 else 0
-            # While an empty bucket hasn't been found
-            while search_index != index:
-
-                # Grab the key at our current index.
-                key_at_index, _ = self.buckets[search_index]
-
-                # Check if an empty bucket has been found
-                # and fill it in with our value.
-                if key_at_index is None:
-                    self.buckets[search_index] = (key, value)
-                    self.size += 1
-                    break
-
-                # Check if the bucket has the key we're trying to set,
-                # if so update the value
-                if key_at_index == key:
-                    self.buckets[search_index] = (key, value)
-                    break
-
-                search_index += 1
-
-                # Loop back around...
-                if search_index > len(self.buckets) - 1:
-                    search_index = 0
+        key_hash = hash(key)
+        if self._old_buckets is not None:
+            old_index = self._find_old(key)
+            if old_index != -1:
+                # Update keys that haven't migrated yet where they are
+                self._old_buckets[old_index] = (key, value)
+                if not self._iterators:
+                    self._migrate(self.migrate_step)
+                return
+            # Updates leave migrating to later while views are iterating
+            if not self._iterators or self._find_in(
+                self.buckets, key, key_hash, self._max_probe
+            ) == -1:
+                self._migrate(self.migrate_step)
+
+        buckets = self.buckets
+        capacity = len(buckets)
+        search_index = key_hash % capacity
+        free_index = -1
+
+        for distance in range(capacity):
+            key_at_index = buckets[search_index][0]
+
+            # An empty bucket ends the probe, the key can't be any further
+            if key_at_index is None:
+                if free_index == -1:
+                    free_index = search_index
+                break
+
+            if key_at_index is _DELETED:
+                # Remember the first tombstone so we can fill it back in
+                if free_index == -1:
+                    free_index = search_index
+            elif key_at_index == key:
+                # Found the key, update it!
+                buckets[search_index] = (key, value)
+                return
+
+            # No entry sits further than the longest probe, so once we
+            # have somewhere to put the key we can stop looking for it.
+            if distance >= self._max_probe and free_index != -1:
+                break
+
+            search_index += 1
+
+            # Loop back around...
+            if search_index == capacity:
+                search_index = 0
+
+        if buckets[free_index][0] is _DELETED:
+            self._tombstones -= 1
+        buckets[free_index] = (key, value)
+        self.size += 1
+        self._version += 1
+        self._record_probe(free_index, key_hash, capacity)
 
         # Check to see if the table needs to be resized.
         if self.load_factor() > 0.75:
@@ -402,38 +970,37 @@ class LinearHashTable(object):
 
     def delete(self, key: object):
         """
-            Delete an item from within the hashtable.
+            Delete an item from within the hashtable. The bucket becomes a
+            tombstone so probes for keys further along keep walking past it,
+            and the table is compacted once tombstones pile up.
 
             Returns:
                 Nothing if the deletion was successful
                 A KeyError if the key is not within the hashtable.
         """
-        index = self._bucket_index(key)
-
-        key_at_index, _ = self.buckets[index]
-
-        if key_at_index == key:
-            self.buckets[index] = (None, None)
-            self.size -= 1
-        else:
-            search_index = index + 1 if index < len(self.buckets) - 1 else 0
-
-            while search_index != index:
-
-                key_at_index, _ = self.buckets[search_index]
-                # If the entry is equal to the key, we've found what
-                # we're trying to delete
-                if key_at_index == key:
-                    self.buckets[search_index] = (None, None)
-                    self.size -= 1
-                    return
-
-                search_index += 1
+        if self._old_buckets is not None:
+            self._migrate(self.migrate_step)
+            old_index = self._find_old(key)
+            if old_index != -1:
+                self._remove_old(old_index, key)
+                self._version += 1
+                return
+
+        capacity = len(self.buckets)
+        key_hash = hash(key)
+        index = self._find_in(self.buckets, key, key_hash, self._max_probe)
+        if index == -1:
+            raise KeyError(f"Key does not exist within hashtable: {key}")
 
-                if search_index > len(self.buckets) - 1:
-                    search_index = 0
+        self.buckets[index] = (_DELETED, None)
+        self.size -= 1
+        self._version += 1
+        self._tombstones += 1
+        self._probe_total -= (index - key_hash) % capacity
 
-            raise KeyError(f"Key does not exist within hashtable: {key}")
+        # Rehash at the same capacity to clear out the tombstones
+        if self._tombstones > self.tombstone_limit * capacity:
+            self._resize(1)
 
     def load_factor(self):
         """
@@ -445,26 +1012,337 @@ class LinearHashTable(object):
         """
         return self.size / len(self.buckets)
 
+    def probe_stats(self):
+        """
+            Report probe length statistics for monitoring.
+
+            Returns:
+                A dict with the longest distance any entry sits from its home
+                bucket (the most buckets a lookup will walk), the mean distance,
+                the number of tombstones and the load factor.
+        """
+        max_probe = self._max_probe
+        if self._old_buckets is not None:
+            max_probe = max(max_probe, self._old_max_probe)
+
+        return {
+            "max_probe": max_probe,
+            "mean_probe": self._probe_total / self.size if self.size else 0.0,
+            "tombstones": self._tombstones,
+            "load_factor": self.load_factor(),
+        }
+
+    def _record_probe(self, index, key_hash, capacity):
+        """
+            Account for an entry placed at the given index of a bucket
+            array with the given capacity.
+        """
+        distance = (index - key_hash) % capacity
+        self._probe_total += distance
+        if distance > self._max_probe:
+            self._max_probe = distance
+
+    def _find_in(self, buckets, key, key_hash, max_probe):
+        """
+            Find a key's bucket within the given bucket array. No entry sits
+            more than max_probe buckets past its home bucket, so a miss gives
+            up after that many steps even without an empty bucket to stop at.
+
+            Returns:
+                The index of the key's bucket, or -1 if it isn't there
+        """
+        capacity = len(buckets)
+        index = key_hash % capacity
+        for _ in range(max_probe + 1):
+            key_at_index = buckets[index][0]
+            if key_at_index is None:
+                return -1
+            if key_at_index is not _DELETED and key_at_index == key:
+                return index
+            index += 1
+            if index == capacity:
+                index = 0
+        return -1
+
     def _resize(self, new_size=None):
         """
-            Resize our hashtable given a new size.
+            Resize our hashtable given a new size. A new_size of 1 rehashes
+            at the same capacity, which drops every tombstone.
+            Incremental tables only swap in the new bucket array here and
+            leave moving the entries to later operations.
         """
         # Check new_size against some conditions for determining
         # the new bucket amount (usually double)
         if new_size is None:
             new_bucket_amt = len(self.buckets) * 2
         elif new_size <= -1:
-            new_bucket_amt = len(self.buckets) / 2
+            new_bucket_amt = len(self.buckets) // 2
         else:
             new_bucket_amt = len(self.buckets) * new_size
 
+        # Finish any migration in progress so there are never three arrays
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+        if self.incremental:
+            self._old_buckets = self.buckets
+            self._old_max_probe = self._max_probe
+            self._migrate_index = 0
+            self.buckets = [(None, None)] * new_bucket_amt
+            self._tombstones = 0
+            self._max_probe = 0
+            self._version += 1
+            return
+
         # Grab all the items and reinitiliaze the hash table.
-        all_items = self.items()
+        all_items = list(self._entries())
+        version, iterators = self._version, self._iterators
         self.__init__(new_bucket_amt)
 
         # Rehash all of our items
         for key, value in all_items:
             self.set(key, value)
+        self._version = version + 1
+        self._iterators = iterators
+
+    def _find_old(self, key):
+        """
+            Find a key among the old buckets of an incremental resize.
+            Migrated old buckets hold a tombstone, so probing walks past them.
+
+            Returns:
+                The index of the key's old bucket, or -1 if it isn't there
+                (or no resize is in progress)
+        """
+        if self._old_buckets is None:
+            return -1
+        return self._find_in(self._old_buckets, key, hash(key), self._old_max_probe)
+
+    def _remove_old(self, old_index, key):
+        """
+            Remove the entry for the given key from its old bucket, leaving a
+            tombstone in its place.
+        """
+        self._old_buckets[old_index] = (_DELETED, None)
+        self.size -= 1
+        self._probe_total -= (old_index - hash(key)) % len(self._old_buckets)
+
+    def _migrate(self, slot_count):
+        """
+            Move up to slot_count old buckets into the new bucket array, ending
+            the incremental resize once every old bucket has moved. Keys are
+            unique, so each one takes the first free bucket without any
+            duplicate checks or load factor checks.
+        """
+        old_buckets = self._old_buckets
+        old_capacity = len(old_buckets)
+        buckets = self.buckets
+        capacity = len(buckets)
+        start = self._migrate_index
+        stop = min(start + slot_count, old_capacity)
+        for old_index in range(start, stop):
+            key, value = old_buckets[old_index]
+            if key is None or key is _DELETED:
+                continue
+            key_hash = hash(key)
+            index = key_hash % capacity
+            while buckets[index][0] is not None:
+                index += 1
+                if index == capacity:
+                    index = 0
+            buckets[index] = (key, value)
+            self._probe_total -= (old_index - key_hash) % old_capacity
+            self._record_probe(index, key_hash, capacity)
+            # Leave a tombstone so probes for later old keys walk past this bucket
+            old_buckets[old_index] = (_DELETED, None)
+        self._version += 1
+
+        if stop == old_capacity:
+            self._old_buckets = None
+            self._old_max_probe = 0
+            self._migrate_index = 0
+        else:
+            self._migrate_index = stop
+
+
+class RobinHoodHashTable(LinearHashTable):
+    """
+        Hashtable implemented with Robin Hood linear probing. An insert takes
+        the bucket of any entry sitting closer to its home than the new key
+        is to its own, and deletes shift the following entries back instead
+        of leaving tombstones. Probe lengths stay short and even, so the
+        table can run at a 0.9 load factor.
+    """
+
+    def __init__(self, init_size=8, max_load=0.9):
+        super().__init__(init_size)
+        self.max_load = max_load
+        # Cached hash of each bucket's key, packed as machine integers
+        self._hashes = array("q", bytes(8 * init_size))
+
+    def _distance(self, index):
+        """Return how far the entry at the given index sits from its home bucket."""
+        return (index - self._hashes[index]) % len(self.buckets)
+
+    def _find(self, key, key_hash):
+        """
+            Find a key's bucket. The probe ends at an empty bucket, at an
+            entry closer to its home than we are to ours (the key would have
+            taken that entry's bucket when it was inserted) or after the
+            longest probe any entry needed.
+
+            Returns:
+                The index of the key's bucket, or -1 if it isn't there
+        """
+        buckets = self.buckets
+        hashes = self._hashes
+        capacity = len(buckets)
+        index = key_hash % capacity
+        distance = 0
+        while distance <= self._max_probe:
+            key_at_index = buckets[index][0]
+            if key_at_index is None:
+                return -1
+            if (index - hashes[index]) % capacity < distance:
+                return -1
+            if hashes[index] == key_hash and key_at_index == key:
+                return index
+            distance += 1
+            index += 1
+            if index == capacity:
+                index = 0
+        return -1
+
+    def _insert(self, key, value, key_hash):
+        """
+            Place a key that isn't in the table yet, displacing any entry
+            that sits closer to its home bucket than the one being placed.
+        """
+        buckets = self.buckets
+        hashes = self._hashes
+        capacity = len(buckets)
+        entry = (key, value)
+        index = key_hash % capacity
+        distance = 0
+        while True:
+            if buckets[index][0] is None:
+                buckets[index] = entry
+                hashes[index] = key_hash
+                self._record_probe(index, key_hash, capacity)
+                return
+
+            existing_distance = (index - hashes[index]) % capacity
+            if existing_distance < distance:
+                # Swap with the richer entry and carry it further along
+                buckets[index], entry = entry, buckets[index]
+                hashes[index], key_hash = key_hash, hashes[index]
+                self._record_probe(index, hashes[index], capacity)
+                self._probe_total -= existing_distance
+                distance = existing_distance
+
+            distance += 1
+            index += 1
+            if index == capacity:
+                index = 0
+
+    def contains(self, key: object):
+        """
+            Check if a key exists within our hashtable
+
+            Returns:
+                True if the key is found, False if not.
+        """
+        return self._find(key, hash(key)) != -1
+
+    def get(self, key: object) -> object:
+        """
+            Get a value from the hashtable given a key.
+
+            Returns:
+                A value if the key is within our hashtable.
+                A KeyError if the key cannot be found.
+        """
+        index = self._find(key, hash(key))
+        if index == -1:
+            raise KeyError(f"Key not within hashtable: {key}")
+
+        return self.buckets[index][1]
+
+    def set(self, key: object, value: object) -> None:
+        """
+            Set an item inside of the hashtable
+
+            Params:
+                key - A hashable object to be used for indexing
+                value - an object to be stored within our bucket (mapped to key)
+        """
+        key_hash = hash(key)
+        index = self._find(key, key_hash)
+        if index != -1:
+            self.buckets[index] = (key, value)
+            return
+
+        self._insert(key, value, key_hash)
+        self.size += 1
+        self._version += 1
+
+        # Check to see if the table needs to be resized.
+        if self.load_factor() > self.max_load:
+            self._resize()
+
+    def delete(self, key: object):
+        """
+            Delete an item from within the hashtable, shifting the rest of
+            its cluster back one bucket so no tombstone is needed.
+
+            Returns:
+                Nothing if the deletion was successful
+                A KeyError if the key is not within the hashtable.
+        """
+        index = self._find(key, hash(key))
+        if index == -1:
+            raise KeyError(f"Key does not exist within hashtable: {key}")
+
+        buckets = self.buckets
+        hashes = self._hashes
+        capacity = len(buckets)
+        self._probe_total -= self._distance(index)
+
+        # Pull entries back until one is already in its home bucket
+        next_index = index + 1 if index < capacity - 1 else 0
+        while buckets[next_index][0] is not None and self._distance(next_index) > 0:
+            buckets[index] = buckets[next_index]
+            hashes[index] = hashes[next_index]
+            self._probe_total -= 1
+            index = next_index
+            next_index = index + 1 if index < capacity - 1 else 0
+
+        buckets[index] = (None, None)
+        self.size -= 1
+        self._version += 1
+
+    def _resize(self, new_size=None):
+        """
+            Resize our hashtable given a new size, reinserting every entry
+            with its cached hash.
+        """
+        if new_size is None:
+            new_bucket_amt = len(self.buckets) * 2
+        elif new_size <= -1:
+            new_bucket_amt = len(self.buckets) // 2
+        else:
+            new_bucket_amt = len(self.buckets) * new_size
+
+        old_entries = zip(self.buckets, self._hashes)
+        size = self.size
+        version, iterators = self._version, self._iterators
+        self.__init__(new_bucket_amt, self.max_load)
+        for (key, value), key_hash in old_entries:
+            if key is not None:
+                self._insert(key, value, key_hash)
+        self.size = size
+        self._version = version + 1
+        self._iterators = iterators
 
 
 def test_hash_table():
@@ -0,0 +1,227 @@
+#!python
+"""
+    Benchmarks for the hash tables in hashtable.py.
+    Usage: python hashtable_bench.py [number of keys] [resize sizes to run, 1-3]
+"""
+
+import time
+
+from bench import arg_size, report, timed, traced
+from hashtable import HashTable, LinearHashTable, RobinHoodHashTable
+
+
+def fill(table, keys):
+    """Set every key in the given table to itself and return the table."""
+    for key in keys:
+        table.set(key, key)
+    return table
+
+
+def lookup_all(table, keys):
+    """Get every key from the given table."""
+    get = table.get
+    for key in keys:
+        get(key)
+
+
+def bench_engines(count):
+    """Compare lookup throughput and bytes per entry of both engines."""
+    keys = ["key{}".format(i) for i in range(count)]
+    for engine in ("chained", "open"):
+        table = fill(HashTable(engine=engine), keys)
+        seconds, _ = timed(lookup_all, table, keys)
+        del table
+        current, _, table = traced(fill, HashTable(engine=engine), keys)
+        report(
+            "engine={}".format(engine),
+            keys=count,
+            lookups_per_sec=count / seconds,
+            bytes_per_entry=current / count,
+        )
+        del table
+
+
+def rehash_every_key(table):
+    """Resize the way HashTable used to: re-set() every entry from scratch."""
+    all_items = list(table.items())  # Snapshot, the view empties with the table
+    table.__init__(len(table.buckets) * 2)
+    for key, value in all_items:
+        table.set(key, value)
+
+
+def bench_resize(counts):
+    """
+        Time one doubling of a chained table holding tuple keys, whose hashes
+        Python doesn't cache, with and without the cached entry hashes.
+    """
+    for count in counts:
+        keys = [(i, "resize", i) for i in range(count)]
+        table = fill(HashTable(), keys)
+        cached, _ = timed(table._resize)
+        rehashed, _ = timed(rehash_every_key, table)
+        report(
+            "resize entries={}".format(count),
+            cached_hash_sec=cached,
+            rehash_sec=rehashed,
+            speedup=rehashed / cached,
+        )
+        del table, keys
+
+
+def set_latencies(table, keys):
+    """Set every key in the given table, returning each call's time in ns."""
+    clock = time.perf_counter_ns
+    latencies = []
+    for key in keys:
+        start = clock()
+        table.set(key, key)
+        latencies.append(clock() - start)
+    return latencies
+
+
+def print_histogram(latencies):
+    """Print how many calls fell in each power-of-two microsecond range."""
+    counts = {}
+    for latency in latencies:
+        bound = 1
+        while bound * 1000 < latency:
+            bound *= 2
+        counts[bound] = counts.get(bound, 0) + 1
+    for bound in sorted(counts):
+        print("    <= {:>8,} us: {:,}".format(bound, counts[bound]))
+
+
+def bench_incremental(count):
+    """Compare per-set() latency of eager and incremental resizing."""
+    keys = ["key{}".format(i) for i in range(count)]
+    for table_type in (HashTable, LinearHashTable):
+        for incremental in (False, True):
+            _, latencies = timed(set_latencies, table_type(incremental=incremental), keys)
+            latencies.sort()
+            report(
+                "{} incremental={}".format(table_type.__name__, incremental),
+                sets=count,
+                p50_us=latencies[count // 2] / 1000,
+                p99_us=latencies[count * 99 // 100] / 1000,
+                p999_us=latencies[count * 999 // 1000] / 1000,
+                max_us=latencies[-1] / 1000,
+            )
+            print_histogram(latencies)
+
+
+def bench_probing(count):
+    """
+        Compare hits, misses and memory of the chained, linear probing and
+        Robin Hood tables, each sized to end up at its maximum load factor.
+    """
+    keys = ["key{}".format(i) for i in range(count)]
+    missing = ["missing{}".format(i) for i in range(count)]
+    tables = [
+        ("HashTable", lambda: HashTable(int(count / 0.75) + 2)),
+        ("LinearHashTable", lambda: LinearHashTable(int(count / 0.75) + 2)),
+        ("RobinHoodHashTable", lambda: RobinHoodHashTable(int(count / 0.9) + 2)),
+    ]
+    for name, make_table in tables:
+        table = fill(make_table(), keys)
+        hit_seconds, _ = timed(lookup_all, table, keys)
+        miss_seconds, _ = timed(contains_all, table, missing)
+        stats = table.probe_stats() if hasattr(table, "probe_stats") else {}
+        load = table.load_factor()
+        del table
+        current, _, table = traced(lambda: fill(make_table(), keys))
+        report(
+            name,
+            load=load,
+            hits_per_sec=count / hit_seconds,
+            misses_per_sec=count / miss_seconds,
+            max_probe=stats.get("max_probe", 0),
+            mean_probe=stats.get("mean_probe", 0.0),
+            bytes_per_entry=current / count,
+        )
+        del table
+
+
+def contains_all(table, keys):
+    """Check every key against the given table."""
+    contains = table.contains
+    for key in keys:
+        contains(key)
+
+
+def call_repeatedly(func, times):
+    """Call func the given number of times."""
+    for _ in range(times):
+        func()
+
+
+def bench_size_queries(calls):
+    """
+        Time length(), load_factor() and is_empty() on LinearHashTables of
+        growing capacity holding the same handful of entries. Constant
+        time queries should cost the same at every capacity.
+    """
+    for capacity in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        table = fill(LinearHashTable(capacity), range(100))
+        fields = {}
+        for query in ("length", "load_factor", "is_empty"):
+            seconds, _ = timed(call_repeatedly, getattr(table, query), calls)
+            fields[query + "_ns"] = seconds * 1e9 / calls
+        report("capacity={}".format(capacity), **fields)
+
+
+def consume(iterable):
+    """Walk the given iterable without keeping anything."""
+    for _ in iterable:
+        pass
+
+
+def bench_views(count):
+    """
+        Peak memory of iterating items() through the live view, against
+        first copying it into a list like items() used to.
+    """
+    keys = ["key{}".format(i) for i in range(count)]
+    for table in (fill(HashTable(), keys), fill(LinearHashTable(), keys)):
+        _, copied_peak, _ = traced(lambda: consume(list(table.items())))
+        _, view_peak, _ = traced(lambda: consume(table.items()))
+        report(
+            "{} items()".format(type(table).__name__),
+            entries=count,
+            list_peak_bytes=copied_peak,
+            view_peak_bytes=view_peak,
+        )
+        del table
+
+
+def bench_bulk_load(count):
+    """Time loading pairs with a set() loop against from_pairs()."""
+    pairs = [("key{}".format(i), i) for i in range(count)]
+    for engine in ("chained", "open"):
+        loop_seconds, table = timed(fill_pairs, HashTable(engine=engine), pairs)
+        del table
+        bulk_seconds, table = timed(lambda: HashTable.from_pairs(pairs, engine=engine))
+        del table
+        report(
+            "bulk load engine={}".format(engine),
+            pairs=count,
+            set_loop_sec=loop_seconds,
+            from_pairs_sec=bulk_seconds,
+            speedup=loop_seconds / bulk_seconds,
+        )
+
+
+def fill_pairs(table, pairs):
+    """Set every (key, value) pair in the given table and return the table."""
+    for key, value in pairs:
+        table.set(key, value)
+    return table
+
+
+if __name__ == "__main__":
+    bench_engines(arg_size(10 ** 6))
+    bench_resize([10 ** 5, 10 ** 6, 10 ** 7][: arg_size(3, 2)])
+    bench_incremental(arg_size(10 ** 6))
+    bench_probing(arg_size(10 ** 6))
+    bench_size_queries(10 ** 5)
+    bench_views(arg_size(10 ** 6))
+    bench_bulk_load(5 * arg_size(10 ** 6))
@@ -1,6 +1,6 @@
 #!python
 
-from hashtable import HashTable
+from hashtable import HashTable, LinearHashTable, OpenHashTable, RobinHoodHashTable
 import unittest
 # Python 2 and 3 compatibility: unittest module renamed this assertion method
 if not hasattr(unittest.TestCase, 'assertCountEqual'):
@@ -17,9 +17,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_keys(self):
         ht = HashTable()
-        assert ht.keys() == []
+        assert list(ht.keys()) == []
         ht.set('I', 1)
-        assert ht.keys() == ['I']
+        assert list(ht.keys()) == ['I']
         ht.set('V', 5)
         self.assertCountEqual(ht.keys(), ['I', 'V'])  # Ignore item order
         ht.set('X', 10)
@@ -27,9 +27,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_values(self):
         ht = HashTable()
-        assert ht.values() == []
+        assert list(ht.values()) == []
         ht.set('I', 1)
-        assert ht.values() == [1]
+        assert list(ht.values()) == [1]
         ht.set('V', 5)
         self.assertCountEqual(ht.values(), [1, 5])  # Ignore item order
         ht.set('X', 10)
@@ -37,9 +37,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_items(self):
         ht = HashTable()
-        assert ht.items() == []
+        assert list(ht.items()) == []
         ht.set('I', 1)
-        assert ht.items() == [('I', 1)]
+        assert list(ht.items()) == [('I', 1)]
         ht.set('V', 5)
         self.assertCountEqual(ht.items(), [('I', 1), ('V', 5)])
         ht.set('X', 10)
@@ -141,6 +141,296 @@ class HashTableTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             ht.delete('A')  # Key does not exist
 
+    def test_resize_reuses_cached_hashes(self):
+        class CountingKey(object):
+            hash_calls = 0
+
+            def __init__(self, value):
+                self.value = value
+
+            def __hash__(self):
+                CountingKey.hash_calls += 1
+                return hash(self.value)
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        ht = HashTable(2)
+        keys = [CountingKey(i) for i in range(100)]
+        for key in keys:
+            ht.set(key, key.value)
+        # One hash per set, none from the resizes along the way
+        assert CountingKey.hash_calls == 100
+        assert len(ht.buckets) == 256
+        assert all(ht.get(key) == key.value for key in keys)
+
+    def test_incremental_resize(self):
+        ht = HashTable(4, incremental=True)
+        for i in range(4):
+            ht.set(i, str(i))
+        # The resize swapped in 8 buckets but left entries to be migrated
+        assert len(ht.buckets) == 8
+        assert ht._old_buckets is not None
+        assert ht.size == 4
+        self.assertCountEqual(ht.keys(), [0, 1, 2, 3])
+        # Lookups, updates and deletes see entries in both bucket arrays
+        ht.set(3, 'three')
+        assert ht.get(3) == 'three'
+        ht.delete(2)
+        assert ht.contains(2) is False
+        assert ht.get(1) == '1'
+        assert ht.size == 3
+        assert ht._old_buckets is None  # Every old bucket has migrated
+        self.assertCountEqual(ht.items(), [(0, '0'), (1, '1'), (3, 'three')])
+
+    def test_incremental_resize_with_many_keys(self):
+        ht = HashTable(incremental=True)
+        for i in range(1000):
+            ht.set(i, i)
+            assert ht.get(i // 2) == i // 2
+        assert ht.size == 1000
+        assert ht.length() == 1000
+        for i in range(0, 1000, 2):
+            ht.delete(i)
+        assert all(ht.contains(i) is (i % 2 == 1) for i in range(1000))
+
+
+class OpenHashTableTest(unittest.TestCase):
+
+    def test_engine_selection(self):
+        assert isinstance(HashTable(engine='open'), OpenHashTable)
+        assert isinstance(HashTable(engine='open', incremental=False), OpenHashTable)
+        assert not isinstance(HashTable(), OpenHashTable)
+        with self.assertRaises(ValueError):
+            HashTable(engine='cuckoo')
+        with self.assertRaises(TypeError):
+            HashTable(16, 'open')  # The engine is keyword-only
+        with self.assertRaises(ValueError):
+            HashTable(engine='open', incremental=True)
+
+    def test_resize(self):
+        ht = HashTable(2, engine='open')
+        assert len(ht.buckets) == 2
+        ht.set('I', 1)
+        assert len(ht.buckets) == 2
+        ht.set('V', 5)  # Should trigger resize
+        assert len(ht.buckets) == 4
+        ht.set('X', 10)
+        ht.set('L', 50)  # Should trigger resize
+        assert len(ht.buckets) == 8
+        assert ht.size == 4
+        assert ht.load_factor() == 0.5
+        self.assertCountEqual(ht.items(), [('I', 1), ('V', 5), ('X', 10), ('L', 50)])
+
+    def test_set_twice_and_get(self):
+        ht = HashTable(engine='open')
+        ht.set('I', 1)
+        ht.set('V', 4)
+        ht.set('V', 5)  # Update value
+        assert ht.get('I') == 1
+        assert ht.get('V') == 5
+        assert ht.length() == 2
+        with self.assertRaises(KeyError):
+            ht.get('A')  # Key does not exist
+
+    def test_delete_leaves_probe_chain_intact(self):
+        ht = HashTable(16, engine='open')
+        # Small ints hash to themselves, so 1, 17 and 33 share a home slot
+        for key in (1, 17, 33):
+            ht.set(key, str(key))
+        ht.delete(17)
+        assert ht.contains(17) is False
+        assert ht.get(33) == '33'
+        with self.assertRaises(KeyError):
+            ht.delete(17)  # Key no longer exists
+        ht.set(49, '49')  # Reuses the tombstone left by 17
+        assert ht.get(49) == '49'
+        assert ht.size == 3
+        self.assertCountEqual(ht.keys(), [1, 33, 49])
+
+    def test_churn_keeps_slots_bounded(self):
+        ht = HashTable(engine='open')
+        for key in range(100000):
+            ht.set(key, key)
+            ht.delete(key)
+        assert ht.size == 0
+        assert len(ht.buckets) == 8
+        # Sliding window: insert a new key and delete the oldest
+        for key in range(200000):
+            ht.set(key, key)
+            if key >= 1000:
+                ht.delete(key - 1000)
+        assert ht.size == 1000
+        assert len(ht.buckets) == 2048  # The same as the chained engine
+        assert all(ht.get(key) == key for key in range(199000, 200000))
+
+
+class DefaultLookupTest(unittest.TestCase):
+
+    def test_get_with_default(self):
+        for engine in ('chained', 'open'):
+            ht = HashTable(engine=engine)
+            ht.set('I', 1)
+            assert ht.get('I', 0) == 1
+            assert ht.get('V', None) is None
+            assert ht.get('V', 5) == 5
+            assert ht.size == 1  # Defaults aren't stored
+            with self.assertRaises(KeyError):
+                ht.get('V')
+
+    def test_setdefault(self):
+        for engine in ('chained', 'open'):
+            ht = HashTable(4, engine=engine)
+            assert ht.setdefault('I', 1) == 1
+            assert ht.setdefault('I', 10) == 1  # Existing values are kept
+            assert ht.setdefault('V') is None
+            for i in range(100):
+                assert ht.setdefault(i, str(i)) == str(i)
+            assert ht.size == 102
+            assert ht.get('I') == 1
+            assert ht.get(99) == '99'
+
+
+class BulkLoadTest(unittest.TestCase):
+
+    def test_from_pairs(self):
+        for engine in ('chained', 'open'):
+            pairs = [(i, str(i)) for i in range(100)]
+            ht = HashTable.from_pairs(pairs, engine=engine)
+            assert ht.size == 100
+            assert ht.load_factor() <= 0.75
+            assert ht.get(42) == '42'
+            # Generators work too
+            ht = HashTable.from_pairs((key, key) for key in 'abc')
+            self.assertCountEqual(ht.items(), [('a', 'a'), ('b', 'b'), ('c', 'c')])
+
+    def test_set_many_resizes_at_most_once(self):
+        for engine in ('chained', 'open'):
+            ht = HashTable(4, engine=engine)
+            ht.set('I', 1)
+            resizes = []
+            original_resize = ht._resize
+            ht._resize = lambda new_size=None: resizes.append(new_size) or original_resize(new_size)
+            ht.set_many([(i, i) for i in range(1000)])
+            assert len(resizes) == 1
+            assert ht.size == 1001
+            assert ht.load_factor() <= 0.75
+
+    def test_set_many_updates_existing_keys(self):
+        for engine in ('chained', 'open'):
+            ht = HashTable(engine=engine)
+            ht.set('V', 4)
+            ht.set_many([('I', 1), ('V', 5), ('I', 2)])
+            assert ht.size == 2
+            assert ht.get_many(['I', 'V']) == [2, 5]
+
+    def test_update(self):
+        ht = HashTable()
+        ht.update({'I': 1, 'V': 5})
+        ht.update(HashTable.from_pairs([('X', 10)]))
+        ht.update([('L', 50)])
+        self.assertCountEqual(ht.items(), [('I', 1), ('V', 5), ('X', 10), ('L', 50)])
+
+    def test_get_many(self):
+        ht = HashTable.from_pairs([('I', 1), ('V', 5)])
+        assert ht.get_many([]) == []
+        assert ht.get_many(['V', 'I', 'V']) == [5, 1, 5]
+        with self.assertRaises(KeyError):
+            ht.get_many(['I', 'A'])  # Key does not exist
+
+    def test_set_many_finishes_incremental_resize(self):
+        ht = HashTable(4, incremental=True)
+        for i in range(4):
+            ht.set(i, i)
+        assert ht._old_buckets is not None
+        ht.set_many([(i, i) for i in range(4, 100)])
+        assert ht._old_buckets is None
+        assert ht.get_many(range(100)) == list(range(100))
+
+
+class TableViewTest(unittest.TestCase):
+
+    def make_tables(self):
+        return [HashTable(), HashTable(engine='open'), LinearHashTable(),
+                RobinHoodHashTable()]
+
+    def test_views_are_live(self):
+        for ht in self.make_tables():
+            keys, values, items = ht.keys(), ht.values(), ht.items()
+            assert len(keys) == 0
+            ht.set('I', 1)
+            ht.set('V', 5)
+            assert len(keys) == len(values) == len(items) == 2
+            self.assertCountEqual(keys, ['I', 'V'])
+            self.assertCountEqual(values, [1, 5])
+            self.assertCountEqual(items, [('I', 1), ('V', 5)])
+
+    def test_membership(self):
+        for ht in self.make_tables():
+            ht.set('I', 1)
+            assert 'I' in ht.keys()
+            assert 'A' not in ht.keys()
+            assert 1 in ht.values()
+            assert 2 not in ht.values()
+            assert ('I', 1) in ht.items()
+            assert ('I', 2) not in ht.items()
+            assert ('A', 1) not in ht.items()
+
+    def test_mutation_during_iteration_raises(self):
+        for ht in self.make_tables():
+            ht.set('I', 1)
+            ht.set('V', 5)
+            with self.assertRaises(RuntimeError):
+                for key in ht.keys():
+                    ht.set(key + key, 0)
+            with self.assertRaises(RuntimeError):
+                for key, value in ht.items():
+                    ht.delete(key)
+
+    def test_lookups_during_incremental_resize_keep_views_valid(self):
+        for ht in (HashTable(4, incremental=True),
+                   LinearHashTable(4, incremental=True)):
+            for i in range(4):
+                ht.set(i, str(i))
+            assert ht._old_buckets is not None  # Resize still in progress
+            for key in ht.keys():
+                assert ht.get(key) == str(key)
+                assert ht.contains(key)
+                assert (key, str(key)) in ht.items()
+            self.assertCountEqual(ht.keys(), range(4))
+
+    def test_lookups_finish_incremental_resize(self):
+        for ht in (HashTable(4, incremental=True),
+                   LinearHashTable(4, incremental=True)):
+            for i in range(4):
+                ht.set(i, str(i))
+            assert ht._old_buckets is not None  # Resize still in progress
+            # A loop abandoned part way through stops holding migration back
+            for key in ht.keys():
+                break
+            for _ in range(len(ht.buckets)):
+                assert ht.get(0) == '0'
+            assert ht._old_buckets is None
+            assert [ht.get(i) for i in range(4)] == ['0', '1', '2', '3']
+
+    def test_updating_values_during_iteration_is_allowed(self):
+        for ht in self.make_tables():
+            ht.set('I', 1)
+            ht.set('V', 5)
+            for key in ht.keys():
+                ht.set(key, 0)
+            assert list(ht.values()) == [0, 0]
+
+    def test_updating_values_during_incremental_resize_is_allowed(self):
+        for ht in (HashTable(4, incremental=True),
+                   LinearHashTable(4, incremental=True)):
+            for i in range(4):
+                ht.set(i, i)
+            assert ht._old_buckets is not None  # Resize still in progress
+            for key in ht.keys():
+                ht.set(key, -key)
+            self.assertCountEqual(ht.items(), [(i, -i) for i in range(4)])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,9 @@
 
 
 class Node(object):
+    # Slots instead of a per-node __dict__ keep long lists compact
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         """Initialize this node with the given data."""
         self.data = data
@@ -20,8 +23,7 @@ class LinkedList(object):
         self.size = 0  # Number of nodes
         # Append the given items
         if iterable is not None:
-            for item in iterable:
-                self.append(item)
+            self.extend(iterable)
 
     def __str__(self):
         """Return a formatted string representation of this linked list."""
@@ -32,6 +34,17 @@ class LinkedList(object):
         """Return a string representation of this linked list."""
         return "LinkedList({!r})".format(self.items())
 
+    def __iter__(self):
+        """
+            Yield each item in this linked list from head to tail, without
+            copying them into a list first.
+            Running time: O(1) per item - We just follow next pointers
+        """
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+
     def items(self):
         """
             Return a list of all items in this linked list.
@@ -57,23 +70,11 @@ class LinkedList(object):
 
     def length(self):
         """
-            Return the length of this linked list by traversing its nodes.
-            Best and worst case running time: O(n) for worst and best case.
-            This is because you have to iterate the entire linked list of n items
-            until you've counted all of them.
+            Return the length of this linked list.
+            Best and worst case running time: O(1) - Every method that adds or
+            removes nodes keeps self.size up to date, so there's nothing to count.
         """
-        # Node counter initialized to zero
-        node_count = 0
-        # Start at the head node
-        node = self.head
-        # Loop until the node is None, which is one node too far past the tail
-        while node is not None:
-            # Count one for this node
-            node_count += 1
-            # Skip to the next node
-            node = node.next
-        # Now node_count contains the number of nodes
-        return node_count
+        return self.size
 
     def get_at_index(self, index):
         """
@@ -172,6 +173,113 @@ class LinkedList(object):
         self.head = new_node
         self.size += 1
 
+    def pop_head(self):
+        """
+            Remove and return the item at the head of this linked list,
+            or raise ValueError if the list is empty.
+            Best and worst case running time: O(1) - We only ever unlink the head
+            node, without comparing any items.
+        """
+        node = self.head
+        if node is None:
+            raise ValueError("Cannot pop from an empty linked list.")
+
+        self.head = node.next
+        # The list is now empty, so the tail has to go too
+        if self.head is None:
+            self.tail = None
+        node.next = None
+        self.size -= 1
+        return node.data
+
+    def extend(self, iterable):
+        """
+            Append every item from the given iterable to the tail of this linked list.
+            The new nodes are chained together first and then linked on in one go,
+            so the size is only updated once.
+            Best and worst case running time: O(k) - Where k is the number of items
+            in the iterable.
+        """
+        head = None
+        tail = None
+        count = 0
+        for item in iterable:
+            node = Node(item)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        # Nothing to link if the iterable was empty
+        if tail is None:
+            return
+        if self.tail is None:
+            self.head = head
+        else:
+            self.tail.next = head
+        self.tail = tail
+        self.size += count
+
+    def splice(self, other):
+        """
+            Move every node of the given linked list onto the tail of this one,
+            leaving the other list empty. Nodes are relinked, not copied.
+            Best and worst case running time: O(1) - Only the tail of this list and
+            the head of the other are relinked, however long they are.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a linked list onto itself.")
+        if other.head is None:
+            return
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.size += other.size
+        # The donor no longer owns any nodes
+        other.head = None
+        other.tail = None
+        other.size = 0
+
+    # Joining two lists end to end is the same operation under another name
+    concat = splice
+
+    def split_at(self, index):
+        """
+            Split this linked list in two at the given index, keeping the items
+            before it and returning a new linked list holding the rest, or raise
+            ValueError if the given index is out of range of the list size.
+            Nodes are moved to the new list, not copied.
+            Best case running time: Omega(1) - Where we split at either end.
+            Worst case running time: O(n) - Where the split is near the tail, since we walk
+            from the head to find it.
+        """
+        # Check if the given index is out of range and if so raise an error
+        if not (0 <= index <= self.size):
+            raise ValueError("List index out of range: {}".format(index))
+
+        rest = type(self)()
+        if index == self.size:
+            return rest
+        if index == 0:
+            # Everything moves over to the new list
+            rest.splice(self)
+            return rest
+
+        # Find the last node we keep
+        last_node = self.head
+        for _ in range(index - 1):
+            last_node = last_node.next
+        rest.head = last_node.next
+        rest.tail = self.tail
+        rest.size = self.size - index
+        last_node.next = None
+        self.tail = last_node
+        self.size = index
+        return rest
+
     def find(self, quality):
         """
             Return an item from this linked list satisfying the given quality.
@@ -192,6 +300,65 @@ class LinkedList(object):
         # We never found data satisfying quality, but have to return something
         return None  # Constant time to return None
 
+    def find_all(self, quality):
+        """
+            Yield every item from this linked list satisfying the given quality,
+            from head to tail, as it is found.
+            Best and worst case running time: O(n) to exhaust it, but the caller
+            can stop early and only pay for the nodes visited so far.
+        """
+        node = self.head
+        while node is not None:
+            if quality(node.data):
+                yield node.data
+            node = node.next
+
+    def index_of(self, item):
+        """
+            Return the index of the first occurrence of the given item in this
+            linked list, or raise ValueError if it is not present.
+            Best case running time: Omega(1) if item is near the head of the list.
+            Worst case running time: O(n) if item is near the tail of the list or
+            not present.
+        """
+        index = 0
+        node = self.head
+        while node is not None:
+            if node.data == item:
+                return index
+            index += 1
+            node = node.next
+        raise ValueError("Item not found: {}".format(item))
+
+    def any(self, quality):
+        """
+            Return True if any item in this linked list satisfies the given
+            quality, or False. Stops at the first item that does.
+            Best case running time: Omega(1) if such an item is near the head.
+            Worst case running time: O(n) if no item satisfies the quality.
+        """
+        node = self.head
+        while node is not None:
+            if quality(node.data):
+                return True
+            node = node.next
+        return False
+
+    def all(self, quality):
+        """
+            Return True if every item in this linked list satisfies the given
+            quality (or the list is empty), or False. Stops at the first item
+            that doesn't.
+            Best case running time: Omega(1) if a failing item is near the head.
+            Worst case running time: O(n) if every item satisfies the quality.
+        """
+        node = self.head
+        while node is not None:
+            if not quality(node.data):
+                return False
+            node = node.next
+        return True
+
     def replace(self, old_item, new_item):
         """Replace the given old_item in this linked list with given new_item
         using the same node, or raise ValueError if old_item is not found.
@@ -0,0 +1,120 @@
+#!python
+"""
+    Benchmarks for linkedlist.py and doublylinkedlist.py.
+    Usage: python linkedlist_bench.py [number of items]
+"""
+
+import random
+
+from bench import arg_size, report, timed, traced
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+
+
+def head_only_get(ll, index):
+    """Fetch the item at index by walking from the head, like get_at_index used to."""
+    node = ll.head
+    for _ in range(index):
+        node = node.next
+    return node.data
+
+
+def bench_random_index(count, lookups=200):
+    """Random get_at_index on a DoublyLinkedList against walking from the head."""
+    ll = DoublyLinkedList(range(count))
+    indexes = [random.randrange(count) for _ in range(lookups)]
+    seconds, _ = timed(lambda: [head_only_get(ll, index) for index in indexes])
+    report("DoublyLinkedList head walk", items=count, lookups_per_sec=lookups / seconds)
+    seconds, _ = timed(lambda: [ll.get_at_index(index) for index in indexes])
+    report("DoublyLinkedList nearer end", items=count, lookups_per_sec=lookups / seconds)
+
+
+def bench_length(count, calls=1000):
+    """Calls per second to length() on both kinds of list."""
+    for list_type in (LinkedList, DoublyLinkedList):
+        ll = list_type(range(count))
+        seconds, _ = timed(lambda: [ll.length() for _ in range(calls)])
+        report("{}.length()".format(list_type.__name__), items=count,
+               calls_per_sec=calls / seconds)
+
+
+def bench_node_handles(count, operations=1000):
+    """Moving random items to the front by handle against delete + prepend by value."""
+    picks = [random.randrange(count) for _ in range(operations)]
+    ll = DoublyLinkedList(range(count))
+
+    def by_value():
+        for item in picks:
+            ll.delete(item)
+            ll.prepend(item)
+
+    handles = DoublyLinkedList()
+    nodes = [handles.append(item) for item in range(count)]
+
+    def by_handle():
+        for item in picks:
+            handles.move_to_front(nodes[item])
+
+    seconds, _ = timed(by_value)
+    report("delete + prepend", items=count, ops_per_sec=operations / seconds)
+    seconds, _ = timed(by_handle)
+    report("move_to_front", items=count, ops_per_sec=operations / seconds)
+
+
+def bench_stitching(count, piece=10):
+    """Joining many small lists into one, item by item against splice()."""
+    for list_type in (LinkedList, DoublyLinkedList):
+        pieces = [list_type(range(piece)) for _ in range(count // piece)]
+
+        def by_append():
+            merged = list_type()
+            for other in pieces:
+                node = other.head
+                while node is not None:
+                    merged.append(node.data)
+                    node = node.next
+            return merged
+
+        seconds, _ = timed(by_append)
+        report("{} append".format(list_type.__name__), items=count,
+               items_per_sec=count / seconds)
+        seconds, _ = timed(lambda: [list_type().extend(range(piece)) for _ in pieces])
+        report("{} extend".format(list_type.__name__), items=count,
+               items_per_sec=count / seconds)
+
+        def by_splice():
+            merged = list_type()
+            for other in pieces:
+                merged.splice(other)
+            return merged
+
+        seconds, merged = timed(by_splice)
+        assert merged.size == count
+        report("{} splice".format(list_type.__name__), items=count,
+               lists_per_sec=len(pieces) / seconds)
+
+
+def bench_scans(count, position=10):
+    """An early-terminating scan against first copying the list with items()."""
+    ll = LinkedList(range(count))
+    target = position
+
+    def quality(item):
+        return item == target
+
+    seconds, _ = timed(lambda: any(quality(item) for item in ll.items()))
+    report("any() over items()", items=count, match_at=position, sec=seconds)
+    seconds, _ = timed(ll.any, quality)
+    report("LinkedList.any()", items=count, match_at=position, sec=seconds)
+    _, peak, _ = traced(lambda: next(item for item in ll.items() if quality(item)))
+    report("first match from items()", items=count, peak_bytes=peak)
+    _, peak, _ = traced(lambda: next(ll.find_all(quality)))
+    report("first match from find_all()", items=count, peak_bytes=peak)
+
+
+if __name__ == "__main__":
+    bench_random_index(arg_size(10 ** 6))
+    bench_length(arg_size(10 ** 6))
+    bench_node_handles(arg_size(10 ** 6))
+    bench_stitching(arg_size(10 ** 6))
+    bench_scans(arg_size(10 ** 6))
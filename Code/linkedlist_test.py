@@ -12,6 +12,10 @@ class NodeTest(unittest.TestCase):
         assert node.data is data
         assert node.next is None
 
+    def test_slots(self):
+        node = Node('ABC')
+        assert not hasattr(node, '__dict__')
+
 
 class LinkedListTest(unittest.TestCase):
 
@@ -136,6 +140,22 @@ class LinkedListTest(unittest.TestCase):
         assert ll.tail.data == 'C'  # unchanged
         assert ll.size == 3
 
+    def test_pop_head(self):
+        ll = LinkedList(['A', 'B', 'A'])
+        assert ll.pop_head() == 'A'
+        assert ll.head.data == 'B'
+        assert ll.tail.data == 'A'  # The duplicate at the tail is untouched
+        assert ll.size == 2
+        assert ll.pop_head() == 'B'
+        assert ll.pop_head() == 'A'
+        assert ll.head is None
+        assert ll.tail is None
+        assert ll.size == 0
+        with self.assertRaises(ValueError):
+            ll.pop_head()
+        ll.append('C')  # Still usable once emptied
+        assert ll.items() == ['C']
+
     def test_find(self):
         ll = LinkedList(['A', 'B', 'C'])
         assert ll.find(lambda item: item == 'B') == 'B'
@@ -178,5 +198,101 @@ class LinkedListTest(unittest.TestCase):
             ll.delete('X')  # item not in list
 
 
+    def test_extend(self):
+        ll = LinkedList(['A'])
+        ll.extend(['B', 'C'])
+        assert ll.items() == ['A', 'B', 'C']
+        assert ll.tail.data == 'C'
+        assert ll.size == 3
+        ll.extend([])
+        assert ll.size == 3
+        empty = LinkedList()
+        empty.extend(iter(['X']))
+        assert empty.head.data == 'X'
+        assert empty.tail.data == 'X'
+
+    def test_splice(self):
+        ll = LinkedList(['A', 'B'])
+        other = LinkedList(['C', 'D'])
+        ll.splice(other)
+        assert ll.items() == ['A', 'B', 'C', 'D']
+        assert ll.tail.data == 'D'
+        assert ll.size == 4
+        # The donor is left empty but still usable
+        assert other.head is None
+        assert other.tail is None
+        assert other.size == 0
+        other.append('E')
+        ll.concat(other)
+        assert ll.items() == ['A', 'B', 'C', 'D', 'E']
+        empty = LinkedList()
+        empty.splice(ll)
+        assert empty.size == 5
+        assert ll.is_empty() is True
+        with self.assertRaises(ValueError):
+            empty.splice(empty)
+
+    def test_split_at(self):
+        ll = LinkedList(['A', 'B', 'C', 'D'])
+        rest = ll.split_at(1)
+        assert ll.items() == ['A']
+        assert ll.tail.data == 'A'
+        assert ll.size == 1
+        assert rest.items() == ['B', 'C', 'D']
+        assert rest.size == 3
+        assert rest.split_at(3).is_empty() is True
+        everything = rest.split_at(0)
+        assert rest.is_empty() is True
+        assert everything.size == 3
+        with self.assertRaises(ValueError):
+            ll.split_at(2)
+
+    def test_iter(self):
+        ll = LinkedList(['A', 'B', 'C'])
+        assert list(ll) == ['A', 'B', 'C']
+        assert list(LinkedList()) == []
+        items = iter(ll)
+        assert next(items) == 'A'
+
+    def test_find_all(self):
+        ll = LinkedList([1, 2, 3, 4, 5, 6])
+        assert list(ll.find_all(lambda item: item % 2 == 0)) == [2, 4, 6]
+        assert list(ll.find_all(lambda item: item > 6)) == []
+        # The scan is lazy, so it only goes as far as we ask it to
+        seen = []
+
+        def quality(item):
+            seen.append(item)
+            return item > 1
+
+        assert next(ll.find_all(quality)) == 2
+        assert seen == [1, 2]
+
+    def test_index_of(self):
+        ll = LinkedList(['A', 'B', 'C', 'B'])
+        assert ll.index_of('A') == 0
+        assert ll.index_of('B') == 1
+        assert ll.index_of('C') == 2
+        with self.assertRaises(ValueError):
+            ll.index_of('X')
+
+    def test_any_and_all(self):
+        ll = LinkedList([1, 2, 3])
+        assert ll.any(lambda item: item == 2) is True
+        assert ll.any(lambda item: item > 3) is False
+        assert ll.all(lambda item: item > 0) is True
+        assert ll.all(lambda item: item < 3) is False
+        assert LinkedList().any(lambda item: True) is False
+        assert LinkedList().all(lambda item: False) is True
+        # Both stop at the first item that decides the answer
+        seen = []
+
+        def quality(item):
+            seen.append(item)
+            return item < 2
+
+        assert ll.all(quality) is False
+        assert seen == [1, 2]
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,174 @@
+#!python
+
+import functools
+import sys
+
+from doublylinkedlist import DoublyLinkedList
+from hashtable import HashTable
+
+# Returned by _lookup on a miss, since None is a perfectly good cached value
+_MISSING = object()
+
+# Separates positional from keyword arguments in lru_cache keys, so no call
+# can build the same key as a call with different arguments
+_KWD_MARK = object()
+
+
+def _entry_bytes(key, value):
+    """Return the shallow size of a key and value, as sys.getsizeof reports it."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class LRUCache(object):
+    """
+        Least recently used cache. A HashTable maps each key to its node in a
+        DoublyLinkedList kept in recency order, most recent at the head, so
+        get, put and evicting from the tail are all O(1) using the list's node
+        handles. Not thread-safe.
+    """
+
+    def __init__(self, max_size=128, max_bytes=None, sizeof=_entry_bytes):
+        """
+            Initialize this cache to hold at most max_size entries and, if
+            max_bytes is given, at most that many bytes as measured by calling
+            sizeof(key, value) once per put. The default sizeof is shallow, so
+            pass your own for values that hold on to large objects.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1: {}".format(max_size))
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.table = HashTable()  # key -> node holding (key, value, size)
+        self.order = DoublyLinkedList()  # Most recently used at the head
+        self.bytes = 0  # Total size of the entries, if max_bytes is set
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        """Return a string representation of this cache."""
+        return "LRUCache({} entries, hits={}, misses={}, evictions={})".format(
+            self.length(), self.hits, self.misses, self.evictions
+        )
+
+    def length(self):
+        """
+            Return the number of entries in this cache.
+            Running time: O(1) - The list keeps track of its size
+        """
+        return self.order.size
+
+    def contains(self, key):
+        """
+            Return True if this cache holds the given key, or False, without
+            counting a hit or miss or changing the recency order.
+        """
+        return self.table.contains(key)
+
+    def keys(self):
+        """Return a list of the keys in this cache, most recently used first."""
+        return [entry[0] for entry in self.order]
+
+    def _lookup(self, key):
+        """
+            Return the cached value for the given key, marking it as most
+            recently used, or _MISSING. Counts the hit or miss.
+            Misses don't raise, so they never pay for formatting a KeyError.
+            Running time: O(1) - A hash table lookup and a node move
+        """
+        node = self.table.get(key, None)  # Nodes are never None
+        if node is None:
+            self.misses += 1
+            return _MISSING
+        self.hits += 1
+        self.order.move_to_front(node)
+        return node.data[1]
+
+    def get(self, key):
+        """
+            Return the cached value for the given key, marking it as most
+            recently used, or raise KeyError.
+            Running time: O(1) - A hash table lookup and a node move
+        """
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError("Key not found: {}".format(key))
+        return value
+
+    def put(self, key, value):
+        """
+            Cache the given value under the given key as the most recently used
+            entry, evicting least recently used entries until the cache is back
+            within its bounds. An entry bigger than max_bytes on its own is
+            evicted straight away. New keys and updates both take a single
+            hash table lookup.
+            Running time: O(1) amortized - Each entry is evicted at most once
+        """
+        size = self.sizeof(key, value) if self.max_bytes is not None else 0
+        order = self.order
+        new_node = order.prepend((key, value, size))
+        node = self.table.setdefault(key, new_node)
+        if node is not new_node:
+            # Already cached, so update that entry instead
+            order.remove_node(new_node)
+            self.bytes -= node.data[2]
+            node.data = (key, value, size)
+            order.move_to_front(node)
+        self.bytes += size
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is within its bounds."""
+        order = self.order
+        while order.size > self.max_size or (
+            self.max_bytes is not None and self.bytes > self.max_bytes
+        ):
+            key, _, size = order.remove_node(order.tail)
+            self.table.delete(key)
+            self.bytes -= size
+            self.evictions += 1
+
+    def delete(self, key):
+        """
+            Remove the given key and its value from this cache, or raise KeyError.
+            Running time: O(1) - A hash table delete and a node unlink
+        """
+        node = self.table.get(key)
+        self.table.delete(key)
+        self.order.remove_node(node)
+        self.bytes -= node.data[2]
+
+    def clear(self):
+        """Remove every entry from this cache, keeping its counters."""
+        self.table = HashTable()
+        self.order = DoublyLinkedList()
+        self.bytes = 0
+
+
+def lru_cache(max_size=128, max_bytes=None, sizeof=_entry_bytes):
+    """
+        Decorator that memoizes a function in an LRUCache, like
+        functools.lru_cache. Arguments must be hashable. The cache is
+        available as the wrapped function's cache attribute.
+    """
+
+    def decorator(func):
+        cache = LRUCache(max_size, max_bytes, sizeof)
+        lookup, put = cache._lookup, cache.put
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Keyword arguments follow a private marker, as in functools
+            key = args + (_KWD_MARK,) + tuple(kwargs.items()) if kwargs else args
+            value = lookup(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                # put() copes with a recursive call having cached it meanwhile
+                put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,59 @@
+#!python
+"""
+    Benchmarks for lrucache.py.
+    Usage: python lrucache_bench.py [number of lookups]
+"""
+
+import functools
+import random
+
+from bench import arg_size, report, timed
+from lrucache import LRUCache, lru_cache
+
+
+def identity(number):
+    """The function being memoized; its cost doesn't matter on the hit path."""
+    return number
+
+
+def call_all(func, keys):
+    """Call func once for each of the given keys."""
+    for key in keys:
+        func(key)
+
+
+def bench_hits(count, max_size=1000):
+    """Hit-path latency of the decorators and of LRUCache.get on a warm cache."""
+    keys = [random.randrange(max_size) for _ in range(count)]
+    warm = range(max_size)
+    decorated = (
+        ("functools.lru_cache", functools.lru_cache(maxsize=max_size)(identity)),
+        ("lrucache.lru_cache", lru_cache(max_size=max_size)(identity)),
+        ("lrucache.lru_cache max_bytes", lru_cache(max_size=max_size, max_bytes=10 ** 9)(identity)),
+    )
+    for name, func in decorated:
+        call_all(func, warm)
+        seconds, _ = timed(call_all, func, keys)
+        report(name, lookups=count, hit_nsec=seconds / count * 10 ** 9)
+
+    cache = LRUCache(max_size)
+    for key in warm:
+        cache.put(key, key)
+    seconds, _ = timed(call_all, cache.get, keys)
+    assert cache.misses == 0
+    report("LRUCache.get", lookups=count, hit_nsec=seconds / count * 10 ** 9)
+
+
+def bench_misses(count, max_size=1000):
+    """Miss-and-evict latency: every call is a new key."""
+    for name, func in (
+        ("functools.lru_cache", functools.lru_cache(maxsize=max_size)(identity)),
+        ("lrucache.lru_cache", lru_cache(max_size=max_size)(identity)),
+    ):
+        seconds, _ = timed(call_all, func, range(count))
+        report(name + " miss", lookups=count, miss_nsec=seconds / count * 10 ** 9)
+
+
+if __name__ == "__main__":
+    bench_hits(arg_size(10 ** 6))
+    bench_misses(arg_size(10 ** 6))
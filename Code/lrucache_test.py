@@ -0,0 +1,184 @@
+#!python
+
+from hashtable import HashTable
+from lrucache import LRUCache, lru_cache
+import unittest
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_init(self):
+        cache = LRUCache(max_size=2)
+        assert cache.length() == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+        assert cache.evictions == 0
+        with self.assertRaises(ValueError):
+            LRUCache(max_size=0)
+
+    def test_put_and_get(self):
+        cache = LRUCache()
+        cache.put('A', 1)
+        cache.put('B', None)
+        assert cache.get('A') == 1
+        assert cache.get('B') is None
+        assert cache.length() == 2
+        with self.assertRaises(KeyError):
+            cache.get('C')
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_put_twice_updates(self):
+        cache = LRUCache(max_size=2)
+        cache.put('A', 1)
+        cache.put('B', 2)
+        cache.put('A', 10)
+        assert cache.length() == 2
+        assert cache.get('A') == 10
+        assert cache.keys() == ['A', 'B']
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=3)
+        for key in 'ABC':
+            cache.put(key, key.lower())
+        cache.get('A')  # B is now the least recently used
+        cache.put('D', 'd')
+        assert cache.contains('B') is False
+        assert cache.keys() == ['D', 'A', 'C']
+        cache.put('E', 'e')
+        assert cache.keys() == ['E', 'D', 'A']
+        assert cache.evictions == 2
+        assert cache.length() == 3
+
+    def test_works_on_either_engine(self):
+        for engine in ('chained', 'open'):
+            cache = LRUCache(max_size=2)
+            cache.table = HashTable(engine=engine)
+            cache.put('A', 1)
+            cache.put('B', 2)
+            cache.put('A', 10)
+            cache.put('C', 3)  # Evicts B
+            assert cache.get('A') == 10
+            assert cache.contains('B') is False
+            with self.assertRaises(KeyError):
+                cache.get('B')
+            cache.delete('C')
+            assert cache.keys() == ['A']
+
+    def test_contains_does_not_touch(self):
+        cache = LRUCache(max_size=2)
+        cache.put('A', 1)
+        cache.put('B', 2)
+        assert cache.contains('A') is True
+        assert cache.hits == 0
+        cache.put('C', 3)
+        assert cache.contains('A') is False
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_size=100, max_bytes=10, sizeof=lambda key, value: len(value))
+        cache.put('A', 'xxxx')
+        cache.put('B', 'xxxx')
+        assert cache.bytes == 8
+        cache.put('C', 'xxxx')
+        assert cache.keys() == ['C', 'B']
+        assert cache.bytes == 8
+        cache.put('B', 'x')
+        assert cache.bytes == 5
+        # An entry bigger than the whole bound can't stay
+        cache.put('D', 'x' * 11)
+        assert cache.length() == 0
+        assert cache.bytes == 0
+        assert cache.evictions == 4
+
+    def test_default_sizeof(self):
+        cache = LRUCache(max_bytes=10 ** 6)
+        cache.put('A', 'x' * 1000)
+        assert cache.bytes > 1000
+
+    def test_delete_and_clear(self):
+        cache = LRUCache(max_bytes=100, sizeof=lambda key, value: value)
+        cache.put('A', 10)
+        cache.put('B', 20)
+        cache.delete('A')
+        assert cache.contains('A') is False
+        assert cache.bytes == 20
+        assert cache.keys() == ['B']
+        with self.assertRaises(KeyError):
+            cache.delete('A')
+        cache.clear()
+        assert cache.length() == 0
+        assert cache.bytes == 0
+
+
+class LRUCacheDecoratorTest(unittest.TestCase):
+
+    def test_memoizes(self):
+        calls = []
+
+        @lru_cache(max_size=2)
+        def square(number):
+            calls.append(number)
+            return number * number
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        assert square.cache.hits == 1
+        assert square.cache.misses == 1
+        square(4)
+        square(5)  # Evicts 3
+        square(3)
+        assert calls == [3, 4, 5, 3]
+        assert square.cache.evictions == 2
+        assert square.__name__ == 'square'
+
+    def test_keyword_arguments(self):
+        calls = []
+
+        @lru_cache()
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        assert add(1, b=2) == 3
+        assert add(1, b=2) == 3
+        assert add(1, 2) == 3
+        assert calls == [(1, 2), (1, 2)]
+
+    def test_keyword_and_positional_keys_never_collide(self):
+        @lru_cache()
+        def arguments(*args, **kwargs):
+            return args, kwargs
+
+        assert arguments(x=1) == ((), {'x': 1})
+        assert arguments((), frozenset({('x', 1)})) == (((), frozenset({('x', 1)})), {})
+        assert arguments(('x', 1)) == ((('x', 1),), {})
+        assert arguments.cache.misses == 3
+
+    def test_recursive_calls(self):
+        calls = []
+
+        @lru_cache(max_size=3)
+        def fib(n):
+            calls.append(n)
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        assert fib(30) == 832040
+        assert sorted(calls) == list(range(31))  # Each value computed once
+        assert fib.cache.length() == 3
+        assert fib.cache.keys() == [(30,), (28,), (29,)]  # fib(28) hit last
+
+    def test_caches_none(self):
+        calls = []
+
+        @lru_cache()
+        def nothing():
+            calls.append(1)
+
+        nothing()
+        nothing()
+        assert calls == [1]
+
+
+if __name__ == '__main__':
+    unittest.main()
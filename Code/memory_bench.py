@@ -0,0 +1,35 @@
+#!python
+"""
+    Memory used per element by the linked structures.
+    Usage: python memory_bench.py [number of items]
+"""
+
+import random
+
+from bench import arg_size, report, traced
+from binarytree import BinarySearchTree
+from deque import Deque
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+
+
+def bench_bytes_per_element(count):
+    """Report bytes allocated per element when building each structure."""
+    items = list(range(count))
+    # Shuffled so the unbalanced tree stays shallow
+    shuffled = items[:]
+    random.Random(13).shuffle(shuffled)
+    structures = [
+        ("LinkedList", lambda: LinkedList(items)),
+        ("DoublyLinkedList", lambda: DoublyLinkedList(items)),
+        ("Deque", lambda: Deque(items)),
+        ("BinarySearchTree", lambda: BinarySearchTree(shuffled)),
+    ]
+    for name, build in structures:
+        current, _, structure = traced(build)
+        report(name, items=count, bytes_per_element=current / count)
+        del structure
+
+
+if __name__ == "__main__":
+    bench_bytes_per_element(arg_size(10 ** 6))
@@ -18,9 +18,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_keys(self):
         ht = LinearHashTable()
-        assert ht.keys() == []
+        assert list(ht.keys()) == []
         ht.set("I", 1)
-        assert ht.keys() == ["I"]
+        assert list(ht.keys()) == ["I"]
         ht.set("V", 5)
         self.assertCountEqual(ht.keys(), ["I", "V"])  # Ignore item order
         ht.set("X", 10)
@@ -28,9 +28,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_values(self):
         ht = LinearHashTable()
-        assert ht.values() == []
+        assert list(ht.values()) == []
         ht.set("I", 1)
-        assert ht.values() == [1]
+        assert list(ht.values()) == [1]
         ht.set("V", 5)
         self.assertCountEqual(ht.values(), [1, 5])  # Ignore item order
         ht.set("X", 10)
@@ -38,9 +38,9 @@ class HashTableTest(unittest.TestCase):
 
     def test_items(self):
         ht = LinearHashTable()
-        assert ht.items() == []
+        assert list(ht.items()) == []
         ht.set("I", 1)
-        assert ht.items() == [("I", 1)]
+        assert list(ht.items()) == [("I", 1)]
         ht.set("V", 5)
         self.assertCountEqual(ht.items(), [("I", 1), ("V", 5)])
         ht.set("X", 10)
@@ -56,6 +56,23 @@ class HashTableTest(unittest.TestCase):
         ht.set("X", 10)
         assert ht.length() == 3
 
+    def test_is_empty(self):
+        ht = LinearHashTable()
+        assert ht.is_empty() is True
+        ht.set("I", 1)
+        assert ht.is_empty() is False
+        ht.delete("I")
+        assert ht.is_empty() is True
+
+    def test_length_matches_items(self):
+        ht = LinearHashTable(incremental=True)
+        for i in range(100):
+            ht.set(i, i)
+            assert ht.length() == len(ht.items())
+        for i in range(0, 100, 3):
+            ht.delete(i)
+            assert ht.length() == len(ht.items())
+
     def test_size(self):
         ht = LinearHashTable()
         assert ht.size == 0
@@ -158,6 +175,85 @@ class HashTableTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             ht.delete("A")  # Key does not exist
 
+    def test_incremental_resize(self):
+        ht = LinearHashTable(4, incremental=True)
+        for i in range(4):
+            ht.set(i, str(i))
+        # The resize swapped in 8 buckets but left entries to be migrated
+        assert len(ht.buckets) == 8
+        assert ht._old_buckets is not None
+        assert ht.size == 4
+        self.assertCountEqual(ht.keys(), [0, 1, 2, 3])
+        # Lookups, updates and deletes see entries in both bucket arrays
+        assert ht.get(2) == "2"
+        ht.set(1, "one")
+        ht.delete(0)
+        assert ht.contains(0) is False
+        assert ht.get(1) == "one"
+        assert ht.size == 3
+        assert ht._old_buckets is None  # Every old slot has migrated
+        self.assertCountEqual(ht.items(), [(1, "one"), (2, "2"), (3, "3")])
+
+    def test_incremental_resize_with_many_keys(self):
+        ht = LinearHashTable(incremental=True)
+        for i in range(1000):
+            ht.set(i, i)
+            assert ht.get(i // 2) == i // 2
+        assert ht.size == 1000
+        assert ht.length() == 1000
+        self.assertCountEqual(ht.values(), range(1000))
+
+    def test_delete_leaves_tombstone(self):
+        ht = LinearHashTable(16)
+        # Small ints hash to themselves, so 1, 17 and 33 share a home bucket
+        for key in (1, 17, 33):
+            ht.set(key, str(key))
+        ht.delete(17)
+        assert ht.contains(17) is False
+        assert ht.get(33) == "33"  # Still reachable past the tombstone
+        assert ht.probe_stats()["tombstones"] == 1
+        ht.set(49, "49")  # Reuses the tombstone
+        assert ht.probe_stats()["tombstones"] == 0
+        self.assertCountEqual(ht.keys(), [1, 33, 49])
+
+    def test_probe_stats(self):
+        ht = LinearHashTable(16)
+        assert ht.probe_stats()["max_probe"] == 0
+        for key in (1, 17, 33):
+            ht.set(key, key)
+        stats = ht.probe_stats()
+        assert stats["max_probe"] == 2
+        assert stats["mean_probe"] == 1.0  # Distances of 0, 1 and 2
+        ht.delete(33)
+        assert ht.probe_stats()["mean_probe"] == 0.5
+
+    def test_tombstones_trigger_compaction(self):
+        ht = LinearHashTable(16)
+        for key in range(8):
+            ht.set(key, key)
+        for key in range(4):
+            ht.delete(key)
+        # 4 tombstones in 16 buckets crossed the 0.2 limit
+        assert ht.probe_stats()["tombstones"] == 0
+        assert len(ht.buckets) == 16
+        self.assertCountEqual(ht.keys(), [4, 5, 6, 7])
+
+    def test_matches_dict_under_churn(self):
+        for incremental in (False, True):
+            ht = LinearHashTable(incremental=incremental)
+            expected = {}
+            for i in range(2000):
+                key = (i * 7919) % 500
+                if key in expected and i % 3 == 0:
+                    ht.delete(key)
+                    del expected[key]
+                else:
+                    ht.set(key, i)
+                    expected[key] = i
+            assert ht.size == len(expected)
+            self.assertCountEqual(ht.items(), expected.items())
+            for key in range(600):
+                assert ht.contains(key) is (key in expected)
 
 if __name__ == "__main__":
     unittest.main()
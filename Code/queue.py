@@ -48,30 +48,39 @@ class LinkedQueue(object):
         if self.is_empty():
             return None
 
-        return self.list.get_at_index(0)
+        return self.list.head.data
 
     def dequeue(self):
         """
             Remove and return the item at the front of this queue,
             or raise ValueError if this queue is empty.
-            Running time: O(1) - checking if empty is constant time and getting and deleting
-            the first index inside of our list is also constant time.
+            Running time: O(1) - checking if empty is constant time and popping
+            the head of our list unlinks it without comparing any items.
         """
         if self.is_empty():
             raise ValueError("The queue is currently empty")
 
-        item = self.list.get_at_index(0)
-        self.list.delete(item)
-        return item
+        return self.list.pop_head()
 
 
 # Implement ArrayQueue below, then change the assignment at the bottom
 # to use this Queue implementation to verify it passes all tests
 class ArrayQueue:
-    def __init__(self, iterable=None):
-        """Initialize this queue and enqueue the given items, if any."""
-        # Initialize a new list (dynamic array) to store the items
-        self.list = list()
+    def __init__(self, iterable=None, capacity=None, overwrite=False):
+        """
+            Initialize this queue and enqueue the given items, if any.
+            The items live in a circular buffer that grows as needed. Passing a
+            capacity fixes its size instead: enqueuing onto a full queue then
+            raises ValueError, or drops the front item if overwrite is True.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Queue capacity must be at least 1: {}".format(capacity))
+        self.capacity = capacity
+        self.overwrite = overwrite
+        # Initialize a new list (dynamic array) to act as the circular buffer
+        self.list = [None] * (capacity or 8)
+        self._head = 0  # Index of the front item
+        self._size = 0  # Number of items
         if iterable is not None:
             for item in iterable:
                 self.enqueue(item)
@@ -83,24 +92,52 @@ class ArrayQueue:
     def is_empty(self):
         """
             Return True if this queue is empty, or False otherwise.
-            Runtime: O(1) - Arrays keep track of length
+            Runtime: O(1) - We keep track of the number of items
         """
-        return len(self.list) == 0
+        return self._size == 0
+
+    def is_full(self):
+        """
+            Return True if this queue has a capacity and has reached it.
+            Runtime: O(1) - We keep track of the number of items
+        """
+        return self.capacity is not None and self._size == self.capacity
 
     def length(self):
         """
             Return the number of items in this queue.
-            Runtime: O(1) - Arrays keep track of length
+            Runtime: O(1) - We keep track of the number of items
         """
-        return len(self.list)
+        return self._size
+
+    def _grow(self):
+        """
+            Double the circular buffer, unrolling the items so the front
+            item is back at index 0.
+            Runtime: O(n) - Every item is copied, but doubling means this
+            happens rarely enough to be amortized O(1) per enqueue.
+        """
+        head = self._head
+        self.list = self.list[head:] + self.list[:head] + [None] * len(self.list)
+        self._head = 0
 
     def enqueue(self, item):
         """
             Insert the given item at the back of this queue.
-            Running time: O(1) - Barring that inserting an item wont resize the array,
-            insertions are constant time operations.
+            Running time: O(1) amortized - Writing to the slot after the back item
+            is constant time, and the buffer only occasionally doubles.
         """
-        self.list.append(item)
+        if self._size == len(self.list):
+            if self.capacity is None:
+                self._grow()
+            elif self.overwrite:
+                # Drop the front item to make room
+                self.dequeue()
+            else:
+                raise ValueError("The queue is full")
+
+        self.list[(self._head + self._size) % len(self.list)] = item
+        self._size += 1
 
     def front(self):
         """
@@ -111,23 +148,225 @@ class ArrayQueue:
         if self.is_empty():
             return None
 
-        return self.list[0]
+        return self.list[self._head]
 
     def dequeue(self):
         """
             Remove and return the item at the front of this queue,
             or raise ValueError if this queue is empty.
-            Running time: O(n) - Every time we pop from the front we have to shift
-            all of the items within the array over 1
+            Running time: O(1) - The front index just moves forward one slot,
+            so no items are ever shifted over.
         """
         if self.is_empty():
             raise ValueError("The queue is empty")
 
-        return self.list.pop(0)
+        head = self._head
+        item = self.list[head]
+        # Release the reference so the buffer doesn't keep the item alive
+        self.list[head] = None
+        self._head = (head + 1) % len(self.list)
+        self._size -= 1
+        return item
+
+
+class Block(object):
+    """A fixed-size chunk of deque slots, linked to its neighbouring blocks."""
+
+    __slots__ = ("items", "prev", "next")
+
+    def __init__(self, size):
+        self.items = [None] * size
+        self.prev = None
+        self.next = None
 
 
 class Deque:
-    pass
+    """
+        Double-ended queue built from a linked list of fixed-size blocks,
+        the same layout CPython's collections.deque uses. Items sit side by
+        side inside each block, so only one allocation is needed for every
+        block_size pushes instead of one node per item.
+    """
+
+    block_size = 64  # At least 2, so an empty block has room on both sides
+
+    def __init__(self, iterable=None):
+        """Initialize this deque and push the given items to its back, if any."""
+        if self.block_size < 2:
+            raise ValueError("Deque block_size must be at least 2: {}".format(self.block_size))
+        self.size = 0  # Number of items
+        self._left = self._right = Block(self.block_size)
+        self._recenter()
+        if iterable is not None:
+            for item in iterable:
+                self.push_back(item)
+
+    def __repr__(self):
+        """Return a string representation of this deque."""
+        return "Deque({!r})".format(self.items())
+
+    def __iter__(self):
+        """
+            Iterate the items from front to back.
+            Runtime: O(n) - Every item is visited once
+        """
+        block = self._left
+        index = self._left_index
+        block_size = self.block_size
+        for _ in range(self.size):
+            yield block.items[index]
+            index += 1
+            if index == block_size:
+                block = block.next
+                index = 0
+
+    def reversed(self):
+        """
+            Iterate the items from back to front.
+            Runtime: O(n) - Every item is visited once
+        """
+        block = self._right
+        index = self._right_index
+        for _ in range(self.size):
+            yield block.items[index]
+            index -= 1
+            if index == -1:
+                block = block.prev
+                index = self.block_size - 1
+
+    def _recenter(self):
+        """
+            Point both ends at the middle of the single remaining block, so
+            the next push has room to grow in either direction.
+        """
+        center = self.block_size // 2
+        self._left_index = center  # Index of the front item
+        self._right_index = center - 1  # Index of the back item
+
+    def items(self):
+        """
+            Return a list of all items from front to back.
+            Runtime: O(n) - Every item is copied once
+        """
+        return list(self)
+
+    def is_empty(self):
+        """
+            Return True if this deque is empty, or False otherwise.
+            Runtime: O(1) - We keep track of the number of items
+        """
+        return self.size == 0
+
+    def length(self):
+        """
+            Return the number of items in this deque.
+            Runtime: O(1) - We keep track of the number of items
+        """
+        return self.size
+
+    @property
+    def front(self):
+        """
+            Get the data at the front of the deque (if any)
+        """
+        if self.size == 0:
+            return None
+
+        return self._left.items[self._left_index]
+
+    @property
+    def back(self):
+        """
+            Get the data at the back of the deque (if any)
+        """
+        if self.size == 0:
+            return None
+
+        return self._right.items[self._right_index]
+
+    def push_front(self, item):
+        """
+            Push an item to the front of the deque.
+            Runtime: O(1) - Writes into the front block, linking a new block
+            on the left only when that one is full.
+        """
+        if self._left_index == 0:
+            block = Block(self.block_size)
+            block.next = self._left
+            self._left.prev = block
+            self._left = block
+            self._left_index = self.block_size
+        self._left_index -= 1
+        self._left.items[self._left_index] = item
+        self.size += 1
+
+    def push_back(self, item):
+        """
+            Push an item to the back of the deque.
+            Runtime: O(1) - Writes into the back block, linking a new block
+            on the right only when that one is full.
+        """
+        if self._right_index == self.block_size - 1:
+            block = Block(self.block_size)
+            block.prev = self._right
+            self._right.next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right.items[self._right_index] = item
+        self.size += 1
+
+    def pop_front(self):
+        """
+            Pop an item from the front of the deque, or raise ValueError if
+            it is empty.
+            Runtime: O(1) - Reads from the front block, unlinking it once
+            it has been emptied.
+        """
+        if self.size == 0:
+            raise ValueError("The deque is currently empty")
+
+        items = self._left.items
+        item = items[self._left_index]
+        # Release the reference so the block doesn't keep the item alive
+        items[self._left_index] = None
+        self._left_index += 1
+        self.size -= 1
+
+        if self.size == 0:
+            self._recenter()
+        elif self._left_index == self.block_size:
+            block = self._left.next
+            block.prev = None
+            self._left = block
+            self._left_index = 0
+        return item
+
+    def pop_back(self):
+        """
+            Pop an item from the back of the deque, or raise ValueError if
+            it is empty.
+            Runtime: O(1) - Reads from the back block, unlinking it once
+            it has been emptied.
+        """
+        if self.size == 0:
+            raise ValueError("The deque is currently empty")
+
+        items = self._right.items
+        item = items[self._right_index]
+        # Release the reference so the block doesn't keep the item alive
+        items[self._right_index] = None
+        self._right_index -= 1
+        self.size -= 1
+
+        if self.size == 0:
+            self._recenter()
+        elif self._right_index == -1:
+            block = self._right.prev
+            block.next = None
+            self._right = block
+            self._right_index = self.block_size - 1
+        return item
 
 
 # Implement LinkedQueue and ArrayQueue above, then change the assignment below
@@ -0,0 +1,93 @@
+#!python
+"""
+    Benchmarks for the queues in queue.py.
+    Usage: python queue_bench.py [number of operations]
+"""
+
+import deque
+from bench import arg_size, report, timed, traced
+from queue import ArrayQueue, Deque, LinkedQueue
+
+
+def enqueue_dequeue_pairs(queue, count):
+    """Enqueue then dequeue an item count times on the given queue."""
+    enqueue = queue.enqueue
+    dequeue = queue.dequeue
+    for item in range(count):
+        enqueue(item)
+        dequeue()
+
+
+def legacy_dequeue_pairs(queue, count):
+    """The same pairs, dequeuing the way LinkedQueue used to: by value."""
+    enqueue = queue.enqueue
+    items = queue.list
+    for item in range(count):
+        enqueue(item)
+        front = items.get_at_index(0)
+        items.delete(front)
+
+
+def bench_linked_queue(count, backlog=1000):
+    """Throughput of enqueue/dequeue pairs on a LinkedQueue with a backlog."""
+    for name, run in (("pop_head", enqueue_dequeue_pairs), ("by value", legacy_dequeue_pairs)):
+        seconds, _ = timed(run, LinkedQueue(range(backlog)), count)
+        report("LinkedQueue dequeue {}".format(name), pairs=count, pairs_per_sec=count / seconds)
+
+
+def fill_and_drain(queue, count):
+    """Enqueue count items onto the given queue, then dequeue them all."""
+    enqueue = queue.enqueue
+    dequeue = queue.dequeue
+    for item in range(count):
+        enqueue(item)
+    for _ in range(count):
+        dequeue()
+
+
+def list_fill_and_drain(count):
+    """The same workload on a plain list popped from the front, like ArrayQueue used to."""
+    items = []
+    for item in range(count):
+        items.append(item)
+    for _ in range(count):
+        items.pop(0)
+
+
+def bench_array_queue(counts):
+    """Throughput of filling and then draining an ArrayQueue."""
+    for count in counts:
+        seconds, _ = timed(fill_and_drain, ArrayQueue(), count)
+        report("ArrayQueue ring buffer", items=count, ops_per_sec=2 * count / seconds)
+    # Popping from the front of a list is quadratic, so keep this one small
+    count = 10 ** 5
+    seconds, _ = timed(list_fill_and_drain, count)
+    report("list.pop(0)", items=count, ops_per_sec=2 * count / seconds)
+
+
+def push_and_pop_both_ends(deque_, count):
+    """Fill the deque from both ends, then empty it from both ends."""
+    push_front, push_back = deque_.push_front, deque_.push_back
+    pop_front, pop_back = deque_.pop_front, deque_.pop_back
+    for item in range(count // 2):
+        push_back(item)
+        push_front(item)
+    for _ in range(count // 2):
+        pop_front()
+        pop_back()
+
+
+def bench_deques(count):
+    """Compare the block-linked queue.Deque against the node-based deque.Deque."""
+    for deque_type in (Deque, deque.Deque):
+        name = "{}.Deque".format(deque_type.__module__)
+        seconds, _ = timed(push_and_pop_both_ends, deque_type(), count)
+        current, _, built = traced(deque_type, range(count))
+        report(name, items=count, ops_per_sec=2 * count / seconds, bytes_per_item=current / count)
+        del built
+
+
+if __name__ == "__main__":
+    bench_linked_queue(arg_size(10 ** 7))
+    bench_array_queue([10 ** 6, 10 ** 7])
+    bench_deques(arg_size(10 ** 6))
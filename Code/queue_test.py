@@ -1,6 +1,7 @@
 #!python
 
-from queue import Queue
+from queue import ArrayQueue, Deque, LinkedQueue, Queue
+import random
 import unittest
 
 
@@ -68,5 +69,128 @@ class QueueTest(unittest.TestCase):
             q.dequeue()
 
 
+class ArrayQueueTest(unittest.TestCase):
+
+    def test_wraps_around_and_grows(self):
+        q = ArrayQueue()
+        for item in range(6):
+            q.enqueue(item)
+        assert [q.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+        # The back of the queue now wraps around the end of the buffer
+        for item in range(6, 20):
+            q.enqueue(item)
+        assert q.length() == 16
+        assert q.front() == 4
+        assert [q.dequeue() for _ in range(16)] == list(range(4, 20))
+        assert q.is_empty() is True
+
+    def test_fixed_capacity_rejects_when_full(self):
+        q = ArrayQueue(['A', 'B'], capacity=2)
+        assert q.is_full() is True
+        with self.assertRaises(ValueError):
+            q.enqueue('C')
+        assert q.dequeue() == 'A'
+        q.enqueue('C')
+        assert q.length() == 2
+        assert len(q.list) == 2  # The buffer never grew
+
+    def test_fixed_capacity_overwrites_when_full(self):
+        q = ArrayQueue(['A', 'B', 'C'], capacity=2, overwrite=True)
+        assert q.length() == 2
+        assert q.dequeue() == 'B'
+        assert q.dequeue() == 'C'
+        assert q.is_full() is False
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            ArrayQueue(capacity=0)
+
+
+class LinkedQueueTest(unittest.TestCase):
+
+    def test_dequeue_with_duplicates(self):
+        q = LinkedQueue(['A', 'B', 'A', 'C'])
+        assert q.dequeue() == 'A'
+        assert q.front() == 'B'
+        q.enqueue('B')
+        assert [q.dequeue() for _ in range(4)] == ['B', 'A', 'C', 'B']
+        assert q.is_empty() is True
+        with self.assertRaises(ValueError):
+            q.dequeue()
+
+
+class DequeTest(unittest.TestCase):
+
+    def test_init(self):
+        d = Deque()
+        assert d.is_empty() is True
+        assert d.front is None
+        assert d.back is None
+        d = Deque(['a', 'b', 'c'])
+        assert d.size == 3
+        assert d.length() == 3
+        assert d.front == 'a'
+        assert d.back == 'c'
+        assert d.items() == ['a', 'b', 'c']
+        assert list(d.reversed()) == ['c', 'b', 'a']
+
+    def test_pop_empty(self):
+        d = Deque()
+        with self.assertRaises(ValueError):
+            d.pop_front()
+        with self.assertRaises(ValueError):
+            d.pop_back()
+
+    def test_spans_many_blocks(self):
+        d = Deque()
+        for item in range(200):
+            d.push_back(item)
+            d.push_front(-item)
+        assert d.size == 400
+        assert d.items() == list(range(-199, 1)) + list(range(200))
+        assert [d.pop_front() for _ in range(250)] == list(range(-199, 1)) + list(range(50))
+        assert [d.pop_back() for _ in range(150)] == list(range(199, 49, -1))
+        assert d.is_empty() is True
+        assert d.items() == []
+
+    def test_matches_list_under_random_operations(self):
+        for block_size in (2, 3, 4, 64):
+            self.check_random_operations(block_size)
+
+    def test_small_blocks(self):
+        for block_size in (2, 3):
+            small_deque = type('SmallDeque', (Deque,), {'block_size': block_size})
+            for push in ('push_back', 'push_front'):
+                d = small_deque()
+                getattr(d, push)('a')
+                assert d.front == d.back == 'a'
+                assert d.items() == ['a']
+                assert list(d.reversed()) == ['a']
+
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            type('TinyDeque', (Deque,), {'block_size': 1})()
+
+    def check_random_operations(self, block_size):
+        rng = random.Random(7)
+        d = type('SizedDeque', (Deque,), {'block_size': block_size})()
+        expected = []
+        for item in range(5000):
+            choice = rng.randrange(4)
+            if choice == 0:
+                d.push_front(item)
+                expected.insert(0, item)
+            elif choice == 1:
+                d.push_back(item)
+                expected.append(item)
+            elif expected and choice == 2:
+                assert d.pop_front() == expected.pop(0)
+            elif expected:
+                assert d.pop_back() == expected.pop()
+            assert d.size == len(expected)
+        assert d.items() == expected
+        assert list(d.reversed()) == expected[::-1]
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,96 @@
+#!python
+
+import unittest
+
+from hashtable import RobinHoodHashTable
+
+# Python 2 and 3 compatibility: unittest module renamed this assertion method
+if not hasattr(unittest.TestCase, "assertCountEqual"):
+    unittest.TestCase.assertCountEqual = unittest.TestCase.assertItemsEqual
+
+
+class RobinHoodHashTableTest(unittest.TestCase):
+    def test_init(self):
+        ht = RobinHoodHashTable(4)
+        assert len(ht.buckets) == 4
+        assert ht.length() == 0
+        assert ht.size == 0
+
+    def test_items(self):
+        ht = RobinHoodHashTable()
+        assert list(ht.items()) == []
+        ht.set("I", 1)
+        assert list(ht.items()) == [("I", 1)]
+        ht.set("V", 5)
+        ht.set("X", 10)
+        self.assertCountEqual(ht.items(), [("I", 1), ("V", 5), ("X", 10)])
+        self.assertCountEqual(ht.keys(), ["I", "V", "X"])
+        self.assertCountEqual(ht.values(), [1, 5, 10])
+
+    def test_resize_at_max_load(self):
+        ht = RobinHoodHashTable(10)
+        for key in range(9):
+            ht.set(key, key)
+        assert len(ht.buckets) == 10
+        assert ht.load_factor() == 0.9
+        ht.set(9, 9)  # Should trigger resize
+        assert len(ht.buckets) == 20
+        assert ht.size == 10
+        assert all(ht.get(key) == key for key in range(10))
+
+    def test_set_twice_and_get(self):
+        ht = RobinHoodHashTable()
+        ht.set("I", 1)
+        ht.set("V", 4)
+        ht.set("V", 5)  # Update value
+        assert ht.get("I") == 1
+        assert ht.get("V") == 5
+        assert ht.length() == 2
+        assert ht.size == 2
+        assert ht.contains("A") is False
+        with self.assertRaises(KeyError):
+            ht.get("A")  # Key does not exist
+
+    def test_insert_displaces_closer_entries(self):
+        ht = RobinHoodHashTable(16)
+        ht.set(1, "a")  # Home bucket 1
+        ht.set(2, "b")  # Home bucket 2
+        ht.set(17, "c")  # Home bucket 1, takes bucket 2 from key 2
+        assert ht.buckets[1] == (1, "a")
+        assert ht.buckets[2] == (17, "c")
+        assert ht.buckets[3] == (2, "b")
+        assert ht.probe_stats()["max_probe"] == 1
+        assert ht.probe_stats()["mean_probe"] == 2 / 3
+
+    def test_delete_shifts_cluster_back(self):
+        ht = RobinHoodHashTable(16)
+        for key in (1, 17, 2):
+            ht.set(key, key)
+        ht.delete(1)
+        # 17 moves back home and 2 follows, leaving no tombstone behind
+        assert ht.buckets[1] == (17, 17)
+        assert ht.buckets[2] == (2, 2)
+        assert ht.buckets[3] == (None, None)
+        assert ht.probe_stats()["mean_probe"] == 0
+        with self.assertRaises(KeyError):
+            ht.delete(1)  # Key no longer exists
+
+    def test_matches_dict_under_churn(self):
+        ht = RobinHoodHashTable()
+        expected = {}
+        for i in range(2000):
+            key = (i * 7919) % 500
+            if key in expected and i % 3 == 0:
+                ht.delete(key)
+                del expected[key]
+            else:
+                ht.set(key, i)
+                expected[key] = i
+        assert ht.size == len(expected)
+        self.assertCountEqual(ht.items(), expected.items())
+        for key in range(600):
+            assert ht.contains(key) is (key in expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
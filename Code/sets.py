@@ -13,8 +13,7 @@ class HashTableSet(HashTable):
         return self.contains(item)
 
     def __iter__(self):
-        for item in self.keys():
-            yield item
+        return iter(self.keys())
 
     def add(self, key: object):
         """
@@ -58,10 +58,7 @@ class LinkedStack:
         if self.is_empty():
             raise ValueError("The stack is currently empty")
 
-        # Get the item and then delete it.
-        item = self.list.get_at_index(0)
-        self.list.delete(item)
-        return item
+        return self.list.pop_head()
 
 
 # Implement ArrayStack below, then change the assignment at the bottom